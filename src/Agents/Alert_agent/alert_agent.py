@@ -1,15 +1,10 @@
 from crewai import Agent
-from langchain_openai import ChatOpenAI
-
-gpt_model = ChatOpenAI(
-    temperature=0,
-    model_name="gpt-4o"
-)
+from src.Helpers.llm_registry import get_llm
 
 class AlertAgent:
     def __init__(self):
         self.agent = Agent(
-            llm=gpt_model,
+            llm=get_llm("gpt-4o", temperature=0),
             role='Stock Alert Analyst',
             goal="Monitor stock prices and trends to trigger alerts.",
             backstory="A highly experienced analyst monitoring market trends to send near real-time alerts.",
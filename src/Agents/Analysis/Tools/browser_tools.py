@@ -7,23 +7,14 @@
 import json
 import os
 
-import requests
-from crewai import Agent, Task
 from langchain.tools import tool
-from unstructured.partition.html import partition_html
-from textwrap import dedent
-import requests
 
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from bs4 import BeautifulSoup
-import time
+from src.Helpers.browser_pool import fetch_page
+from src.Helpers.summarizer import summarize_text
+from src.Helpers.text_extraction import extract_text
 
-import platform
-
-#FIXME: May want to change this to headless
+# text_extraction imports BeautifulSoup on first use and browser_pool imports selenium only when
+# a page has to be rendered, so agent modules that list this tool do not pay for either.
 
 class BrowserTools:
 
@@ -33,67 +24,12 @@ class BrowserTools:
         if isinstance(website, dict) and "title" in website:
             website = website["title"]
 
-        # Set up Chrome options to run headless
-        chrome_options = Options()
-        chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--ignore-certificate-errors")  # Ignore SSL certificate errors
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--disable-features=NetworkService")
-        chrome_options.add_argument("--disable-software-rasterizer")
-        chrome_options.add_argument("--log-level=3")  # Enable verbose logging
-
-        # Initialize the Chrome WebDriver
-        current_os = platform.system()
-        if current_os == "Windows":
-            service = Service('chromedriver/chromedriver.exe')  # Specify the path to your chromedriver
-        else:
-            service = Service('chromedriver/chromedriver')  # Specify the path to your chromedriver
-            
-        driver = webdriver.Chrome(service=service, options=chrome_options)
-
-        try:
-            
-            # Navigate to the website
-            driver.get(website)
-
-            # Allow time for the page to load and any JavaScript to execute
-            time.sleep(3)
-
-            # Get the page source after JavaScript has executed
-            page_source = driver.page_source
-
-        finally:
-            driver.quit()
-
-        # Use BeautifulSoup to parse the HTML
-        soup = BeautifulSoup(page_source, 'html.parser')
-        elements = soup.find_all(text=True)
-
-        content = "\n\n".join([str(el) for el in elements])
-        content = [content[i:i + 8000] for i in range(0, len(content), 8000)]
+        # Static pages come from a plain HTTP request; pages that need JavaScript are rendered
+        # in a warm browser from the shared pool instead of a new Chrome per call
+        page_source = fetch_page(website)
 
-        summaries = []
-        for chunk in content:
-            agent = Agent(
-                role='Principal Researcher',
-                goal='Do amazing research and summaries based on the content you are working with',
-                backstory="You're a Principal Researcher at a big company and you need to do research about a given topic.",
-                allow_delegation=False
-            )
-            task = Task(
-                agent=agent,
-                description=dedent(f"""
-                    Analyze and summarize the content below, make sure to include the most relevant information in the summary, return only the summary nothing else.
-                    
-                    CONTENT
-                    ----------
-                    {chunk}
-                """),
-                expected_output="A concise summary of the most relevant information from the provided content."
-            )
-            summary = task.execute()
-            summaries.append(summary)
+        # Keep only the main text: no scripts, styles, menus, footers or repeated lines
+        content = extract_text(page_source)
 
-        return "\n\n".join(summaries)
\ No newline at end of file
+        # Repeated boilerplate is dropped, chunks are summarized concurrently and merged in one final call
+        return summarize_text(content)
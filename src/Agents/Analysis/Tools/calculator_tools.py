@@ -4,6 +4,7 @@
 ######################################
 
 from langchain.tools import tool
+from src.Helpers.safe_eval import evaluate_all, format_number
 
 
 class CalculatorTools():
@@ -13,6 +14,20 @@ class CalculatorTools():
     """Useful to perform any mathematical calculations, 
     like sum, minus, multiplication, division, etc.
     The input to this tool should be a mathematical 
-    expression, a couple examples are `200*7` or `5000/2*10`
+    expression, a couple examples are `200*7` or `5000/2*10`.
+    Several calculations can be done in one call, separated by
+    semicolons or new lines, and results can be named and reused:
+    `revenue = [100, 120, 150]; pct_change(revenue); cagr(100, 150, 2)`.
+    Lists are calculated element-wise, e.g. `[100, 120] * 1.1`.
+    Functions: pct_change(old, new) or pct_change(list) in percent,
+    cagr(begin, end, years) in percent, mean, median, stdev, variance,
+    pstdev, sum, min, max, len, cumsum, abs, round, sqrt, log, log10, exp.
     """
-    return eval(operation)
\ No newline at end of file
+    # Model-written input is parsed into a restricted expression tree, never passed to eval
+    try:
+      results = evaluate_all(operation)
+    except ValueError as e:
+      return f"Error: {e}"
+    if len(results) == 1:
+      return format_number(next(iter(results.values())))
+    return "\n".join(f"{label} = {format_number(value)}" for label, value in results.items())
@@ -9,11 +9,12 @@ import os
 import requests
 from langchain.tools import tool
 
-from newspaper import Article
-from newspaper.article import ArticleException
 from datetime import datetime  
 import platform
 
+from src.Helpers.article_scraper import scrape_articles
+from src.Helpers.web_cache import serper_request
+
 
 class SearchTools():
   @tool("Search the internet")
@@ -21,14 +22,7 @@ class SearchTools():
     """Useful to search the internet 
     about a a given topic and return relevant results"""
     top_result_to_return = 4
-    url = "https://google.serper.dev/search"
-    payload = json.dumps({"q": query})
-    headers = {
-        'X-API-KEY': os.environ['SERPER_API_KEY'],
-        'content-type': 'application/json'
-    }
-    response = requests.request("POST", url, headers=headers, data=payload)
-    results = response.json()['organic']
+    results = serper_request('search', query)['organic']
     string = []
     for result in results[:top_result_to_return]:
       try:
@@ -49,51 +43,23 @@ class SearchTools():
       including the full text of each news article.
       """
 
-      # Private function
-      def scrape_full_article(url):
-        """
-        Scrape the full text of a news article from the given URL using newspaper3k.
-        
-        Args:
-            url (str): The URL of the news article to scrape.
-        
-        Returns:
-            str: The full text of the article, or an error message if scraping fails.
-        """
-        try:
-            article = Article(url)
-            article.download()
-            article.parse()
-            return article.text
-        except ArticleException as e:
-            return f"Error: Failed to scrape the article. Details: {e}"
-        except Exception as e:
-            return f"Error: An unexpected error occurred while scraping the article. Details: {e}"
-
-
-      url = "https://google.serper.dev/news"
-      payload = json.dumps({"q": query})
-      headers = {
-          'X-API-KEY': os.environ['SERPER_API_KEY'],
-          'Content-Type': 'application/json'
-      }
-      
-      try:
-          response = requests.post(url, headers=headers, data=payload)
-          response.raise_for_status()  # Raise an exception for HTTP errors
-      except requests.exceptions.RequestException as e:
-          return f"Error: Failed to fetch news from SERPER API. Details: {e}"
-      
       try:
-          results = response.json().get('news', [])
+          # Served from the web cache when the same query was searched recently
+          results = serper_request('news', query).get('news', [])
       except json.JSONDecodeError:
           return "Error: Failed to parse JSON response from SERPER API."
+      except requests.exceptions.RequestException as e:
+          return f"Error: Failed to fetch news from SERPER API. Details: {e}"
       
       if not results:
           return "No news results found."
       
+      results = results[:top_result_to_return]
+      # Download the full articles concurrently; slow sites time out without holding up the rest
+      full_texts = scrape_articles([result.get('link', 'No Link') for result in results])
+
       formatted_results = []
-      for result in results[:top_result_to_return]:
+      for result, full_text in zip(results, full_texts):
           try:
               title = result.get('title', 'No Title')
               link = result.get('link', 'No Link')
@@ -117,9 +83,6 @@ class SearchTools():
               else:
                   formatted_date = date_str
               
-              # Scrape the full article text
-              full_text = scrape_full_article(link)
-              
               # Optionally, truncate the full text to a certain length
               truncated_full_text = (full_text[:500] + '...') if len(full_text) > 500 else full_text
               
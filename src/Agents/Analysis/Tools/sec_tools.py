@@ -8,12 +8,11 @@ import os
 import requests
 
 from langchain.tools import tool
-from langchain.text_splitter import CharacterTextSplitter
-from langchain_community.embeddings import OpenAIEmbeddings
-from langchain_community.vectorstores import FAISS
 
-from sec_api import QueryApi
-from unstructured.partition.html import partition_html
+from src.Helpers.filing_index import get_filing_index_store
+from src.Helpers.filing_store import get_filing_store
+
+# sec_api, FAISS and the embeddings client are imported on first use
 
 class SECTools():
   @tool("Search 10-Q form")
@@ -27,22 +26,9 @@ class SECTools():
 		For example, `AAPL|what was last quarter's revenue`.
     """
     stock, ask = data.split("|")
-    queryApi = QueryApi(api_key=os.environ['SEC_API_API_KEY'])
-    query = {
-      "query": {
-        "query_string": {
-          "query": f"ticker:{stock} AND formType:\"10-Q\""
-        }
-      },
-      "from": "0",
-      "size": "1",
-      "sort": [{ "filedAt": { "order": "desc" }}]
-    }
-
-    fillings = queryApi.get_filings(query)['filings']
-    if len(fillings) == 0:
+    link = SECTools.__latest_filing_link(stock, "10-Q")
+    if link is None:
       return "Sorry, I couldn't find any filling for this stock, check if the ticker is correct."
-    link = fillings[0]['linkToFilingDetails']
     answer = SECTools.__embedding_search(link, ask)
     return answer
 
@@ -57,43 +43,46 @@ class SECTools():
     For example, `AAPL|what was last year's revenue`.
     """
     stock, ask = data.split("|")
+    link = SECTools.__latest_filing_link(stock, "10-K")
+    if link is None:
+      return "Sorry, I couldn't find any filling for this stock, check if the ticker is correct."
+    answer = SECTools.__embedding_search(link, ask)
+    return answer
+
+  def __latest_filing_link(stock, form_type):
+    # Filing lists are kept in the local filing store; sec-api is only asked for filings newer
+    # than the latest stored one, and at most once per refresh interval
+    store = get_filing_store()
+    store.update(stock, form_type, lambda since: SECTools.__query_filings(stock, form_type, since))
+    latest = store.latest(stock, form_type)
+    return latest['url'] if latest else None
+
+  def __query_filings(stock, form_type, since=None):
+    from sec_api import QueryApi
     queryApi = QueryApi(api_key=os.environ['SEC_API_API_KEY'])
+    query_string = f"ticker:{stock} AND formType:\"{form_type}\""
+    if since:
+      query_string += f" AND filedAt:[{since[:10]} TO *]"
     query = {
       "query": {
         "query_string": {
-          "query": f"ticker:{stock} AND formType:\"10-K\""
+          "query": query_string
         }
       },
       "from": "0",
-      "size": "1",
+      "size": "1" if since is None else "10",
       "sort": [{ "filedAt": { "order": "desc" }}]
     }
 
     fillings = queryApi.get_filings(query)['filings']
-    if len(fillings) == 0:
-      return "Sorry, I couldn't find any filling for this stock, check if the ticker is correct."
-    link = fillings[0]['linkToFilingDetails']
-    answer = SECTools.__embedding_search(link, ask)
-    return answer
+    return [{'accession': filling.get('accessionNo'), 'filed_at': filling['filedAt'],
+             'url': filling['linkToFilingDetails'], 'metadata': filling} for filling in fillings]
 
   def __embedding_search(url, ask):
-    text = SECTools.__download_form_html(url)
-    elements = partition_html(text=text)
-    content = "\n".join([str(el) for el in elements])
-    text_splitter = CharacterTextSplitter(
-        separator = "\n",
-        chunk_size = 1000,
-        chunk_overlap  = 150,
-        length_function = len,
-        is_separator_regex = False,
-    )
-    docs = text_splitter.create_documents([content])
-    retriever = FAISS.from_documents(
-      docs, OpenAIEmbeddings()
-    ).as_retriever()
-    answers = retriever.get_relevant_documents(ask, top_k=4)
-    answers = "\n\n".join([a.page_content for a in answers])
-    return answers
+    # The filing is chunked and embedded once and its index kept on disk per accession number;
+    # later questions about it only embed the question
+    return get_filing_index_store().search(
+      url, ask, load_text=lambda link: get_filing_store().text(link, SECTools.__download_form_html))
 
   def __download_form_html(url):
     headers = {
@@ -114,4 +103,6 @@ class SECTools():
     }
 
     response = requests.get(url, headers=headers)
+    # Error pages must not end up in the filing store
+    response.raise_for_status()
     return response.text
\ No newline at end of file
@@ -10,22 +10,15 @@ from src.Agents.Analysis.Tools.calculator_tools import CalculatorTools
 from src.Agents.Analysis.Tools.search_tools import SearchTools
 from src.Agents.Analysis.Tools.sec_tools import SECTools
 
-from langchain_community.tools import YahooFinanceNewsTool
-from langchain_openai import ChatOpenAI
+from src.Helpers.llm_registry import get_llm
 
 
-gpt_model = ChatOpenAI(
-  temperature=0,
-  #model_name="gpt-3.5-turbo",
-  model_name="gpt-4o"
-)
-
 class StockAnalysisAgents():
   def __init__(
           self,
-          gpt_model=gpt_model
+          gpt_model=None
      ):
-      self.gpt_model = gpt_model
+      self.gpt_model = gpt_model or get_llm("gpt-4o", temperature=0)
 
   def financial_analyst(self):
     return Agent(
@@ -47,6 +40,7 @@ class StockAnalysisAgents():
     )
 
   def research_analyst(self):
+    from langchain_community.tools import YahooFinanceNewsTool
     return Agent(
       llm=self.gpt_model,
       role='Staff Research Analyst',
@@ -68,6 +62,7 @@ class StockAnalysisAgents():
   )
 
   def investment_advisor(self):
+    from langchain_community.tools import YahooFinanceNewsTool
     return Agent(
       llm=self.gpt_model,
       role='Private Investment Advisor',
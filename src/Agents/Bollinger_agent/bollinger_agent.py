@@ -1,18 +1,11 @@
 from crewai import Agent, Task
 from textwrap import dedent
-from langchain_openai import ChatOpenAI
+from src.Helpers.llm_registry import get_llm
 from src.Agents.Analysis.Tools.browser_tools import BrowserTools
 from src.Agents.Analysis.Tools.calculator_tools import CalculatorTools
 from src.Agents.Analysis.Tools.search_tools import SearchTools
 from src.Agents.Analysis.Tools.sec_tools import SECTools
 
-from langchain_community.tools import YahooFinanceNewsTool
-
-# Initialize the LLM (e.g., OpenAI GPT model)
-gpt_model = ChatOpenAI(
-    temperature=0,
-    model_name="gpt-4"
-)
 
 class BollingerAnalysisAgents:
     def bollinger_bands_investment_advisor(self):
@@ -20,8 +13,9 @@ class BollingerAnalysisAgents:
         Returns an agent that analyzes Bollinger Bands data to provide actionable investment advice.
         The agent is expected to make buy/sell suggestions based on whether the stock is overbought or oversold.
         """
+        from langchain_community.tools import YahooFinanceNewsTool
         return Agent(
-            llm=gpt_model,
+            llm=get_llm("gpt-4", temperature=0),
             role='Bollinger Bands Investment Advisor',
             goal="""Provide actionable buying or selling suggestions by analyzing Bollinger Bands data 
             and determining whether the stock is overbought, oversold, or trending.""",
@@ -3,6 +3,7 @@ import crewai as crewai
 from textwrap import dedent
 from src.Agents.base_agent import BaseAgent
 from src.Data_Retrieval.data_fetcher import DataFetcher
+from src.Helpers.structured_output import CorrelationResult, expected_json
 import logging
 import pandas as pd
 
@@ -23,7 +24,17 @@ class CorrelationAgent(BaseAgent):
         self.stock2 = stock2
         logging.info("CorrelationAgent initialized") 
 
-    def calculate_correlation(self) -> crewai.Task:        
+    def calculate_correlation(self, structured: bool = False) -> crewai.Task:
+        """
+        Create the correlation task from the two stocks' closing prices.
+
+        Args:
+            structured (bool): Answer with a CorrelationResult JSON object (read from output.pydantic)
+                instead of a sentence.
+
+        Returns:
+            crewai.Task: The correlation analysis task.
+        """
         fetcher = DataFetcher()
         stock1_data = fetcher.get_stock_data(self.stock1)
         print(stock1_data)
@@ -43,11 +54,19 @@ class CorrelationAgent(BaseAgent):
         correlation_coef = close_stock1_aligned.corr(close_stock2_aligned)
         logging.info(f"Correlation coefficient between {self.stock1} and {self.stock2}: {correlation_coef:.4f}")
         
-        return crewai.Task(
-            description=dedent(f"""
+        description = dedent(f"""
                 Analyze the historical price data of {self.stock1} and {self.stock2} to calculate their correlation.
                 Based on the correlation results, determine if the stocks are suitable for pairs trading.
-            """),
+            """)
+        if structured:
+            return crewai.Task(
+                description=description + f"The measured correlation coefficient is {correlation_coef:.4f}.",
+                agent=self,
+                expected_output=expected_json(CorrelationResult),
+                output_pydantic=CorrelationResult
+            )
+        return crewai.Task(
+            description=description,
             agent=self,
             expected_output=f"The correlation between {self.stock1} and {self.stock2} is: {correlation_coef:.4f}"
         )
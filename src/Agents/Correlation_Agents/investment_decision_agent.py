@@ -1,6 +1,7 @@
 import crewai as crewai
 from textwrap import dedent
 from src.Agents.base_agent import BaseAgent
+from src.Helpers.structured_output import TradeDecision, expected_json
 import logging
 
 class InvestmentDecisionAgent(BaseAgent):
@@ -17,13 +18,31 @@ class InvestmentDecisionAgent(BaseAgent):
         self.stock2 = stock2
         logging.info("InvestmentDecisionAgent initialized")
 
-    def investment_decision(self):       
+    def investment_decision(self, structured: bool = False):
+        """
+        Create the investment decision task.
+
+        Args:
+            structured (bool): Answer with a TradeDecision JSON object (read from output.pydantic)
+                instead of a report.
+
+        Returns:
+            crewai.Task: The investment decision task.
+        """
         logging.info("investment_decision CrewAI Task being assembled") 
-        return crewai.Task(
-            description=dedent(f"""
+        description = dedent(f"""
                 Based on the correlation analysis between {self.stock1} and {self.stock2}, provide an investment decision.
                 Consider market trends, risk factors, and the potential for profit in pairs trading with these stocks.
-            """),
+            """)
+        if structured:
+            return crewai.Task(
+                description=description,
+                agent=self,
+                expected_output=expected_json(TradeDecision),
+                output_pydantic=TradeDecision
+            )
+        return crewai.Task(
+            description=description,
             agent=self,
             expected_output="A detailed investment decision report, including buy/sell recommendations."
         )
@@ -2,13 +2,11 @@
 
 from crewai import Agent, Task
 from textwrap import dedent
-from langchain_openai import ChatOpenAI
-
-# Initialize the GPT-4 model
-gpt_model = ChatOpenAI(
-    temperature=0,
-    model_name="gpt-4"
+from src.Helpers.llm_registry import get_llm
+from src.Helpers.prompt_compaction import (
+    FILINGS_TOKEN_BUDGET, TRANSCRIPT_TOKEN_BUDGET, compact_json, truncate_to_tokens
 )
+from src.Helpers.structured_output import TradeDecision, expected_json
 
 class EarningsSecAnalysisAgents:
     def financial_analyst(self):
@@ -16,7 +14,7 @@ class EarningsSecAnalysisAgents:
         Initializes the Financial Analyst agent.
         """
         return Agent(
-            llm=gpt_model,
+            llm=get_llm("gpt-4", temperature=0),
             role='Financial Analyst',
             goal="Provide comprehensive analysis of SEC filings to guide investment decisions.",
             backstory="You are an expert financial analyst with deep knowledge of financial statements, market trends, and SEC regulations.",
@@ -28,17 +26,19 @@ class EarningsSecAnalysisAgents:
         Initializes the Sentiment Analyst agent.
         """
         return Agent(
-            llm=gpt_model,
+            llm=get_llm("gpt-4", temperature=0),
             role='Sentiment Analyst',
             goal="Assess the sentiment and tone of management during earnings calls.",
             backstory="You analyze the language and sentiment used by company executives to gauge confidence and future outlook.",
             verbose=True
         )
     
-    def analyze_sec_filings(self, agent, sec_data):
+    def analyze_sec_filings(self, agent, sec_data, token_budget=FILINGS_TOKEN_BUDGET):
         """
         Creates a task for analyzing SEC filings.
+        The filings are compacted to at most token_budget tokens.
         """
+        sec_data = compact_json(sec_data, token_budget)
         return Task(
             description=dedent(f"""
                 Analyze the SEC filings for potential risks, growth opportunities, and 
@@ -50,10 +50,12 @@ class EarningsSecAnalysisAgents:
             expected_output="A detailed analysis of SEC filings highlighting investment risks, growth opportunities, and financial trends."
         )
     
-    def analyze_earnings_calls(self, agent, earnings_data):
+    def analyze_earnings_calls(self, agent, earnings_data, token_budget=FILINGS_TOKEN_BUDGET):
         """
         Creates a task for analyzing earnings calls.
+        The earnings events are compacted to at most token_budget tokens.
         """
+        earnings_data = compact_json(earnings_data, token_budget)
         return Task(
             description=dedent(f"""
                 Analyze the earnings calls for insights on the company's performance, market outlook, and 
@@ -64,10 +66,12 @@ class EarningsSecAnalysisAgents:
             expected_output="A detailed earnings call analysis with insights into company performance, market outlook, and management sentiment."
         )
     
-    def analyze_single_earnings_transcript(self, agent, key, transcript):
+    def analyze_single_earnings_transcript(self, agent, key, transcript, token_budget=TRANSCRIPT_TOKEN_BUDGET):
         """
         Creates a task for analyzing a single earnings call transcript.
+        The transcript is truncated to at most token_budget tokens.
         """
+        transcript = truncate_to_tokens(str(transcript), token_budget)
         return Task(
             description=dedent(f"""
                 Analyze the earnings call transcript for {key} for detailed insights into the company's performance, 
@@ -78,3 +82,19 @@ class EarningsSecAnalysisAgents:
             agent=agent,
             expected_output=f"A comprehensive analysis of the {key} earnings call transcript, highlighting key insights, sentiment, and strategic directions."
         )
+
+    def investment_decision(self, agent, context_tasks):
+        """
+        Creates a task that turns the analyses of context_tasks into a trading decision.
+        The answer is a TradeDecision JSON object, available validated in the task's output.pydantic.
+        """
+        return Task(
+            description=dedent("""
+                Based on the SEC filings and earnings call analyses, decide whether to buy, sell or
+                hold the stock. Give your confidence between 0 and 1 and a one or two sentence rationale.
+            """),
+            agent=agent,
+            context=context_tasks,
+            expected_output=expected_json(TradeDecision),
+            output_pydantic=TradeDecision
+        )
@@ -1,17 +1,12 @@
 from crewai import Agent, Task
-from langchain_openai import ChatOpenAI
+from src.Helpers.llm_registry import get_llm
 from textwrap import dedent
 from src.Agents.base_agent import BaseAgent
 from src.Agents.Analysis.Tools.browser_tools import BrowserTools
 from src.Agents.Analysis.Tools.calculator_tools import CalculatorTools
 from src.Agents.Analysis.Tools.search_tools import SearchTools
 from src.Agents.Analysis.Tools.sec_tools import SECTools
-from langchain_community.tools import YahooFinanceNewsTool
-
-gpt_model = ChatOpenAI(
-  temperature=0,
-  model_name="gpt-4o"
-)
+from src.Helpers.prompt_compaction import INDICATOR_TOKEN_BUDGET, summarize_macd, truncate_to_tokens
 
 class MACDAnalysisAgent(BaseAgent):
     def __init__(self):
@@ -25,8 +20,9 @@ class MACDAnalysisAgent(BaseAgent):
             based on the MACD signals."""
         )
     def macd_trading_advisor(self):
+        from langchain_community.tools import YahooFinanceNewsTool
         return Agent(
-            llm=gpt_model,
+            llm=get_llm("gpt-4o", temperature=0),
             role='MACD Trading Advisor',
             goal="""Interpret MACD signals and provide actionable insights on market trends. 
             Help traders identify potential bullish or bearish movements and offer advice 
@@ -45,20 +41,23 @@ class MACDAnalysisAgent(BaseAgent):
             ]
         )
 
-    def macd_analysis(self, agent, macd_data):
+    def macd_analysis(self, agent, macd_data, recent_bars=10, token_budget=INDICATOR_TOKEN_BUDGET):
         """
         A new task to handle the MACD analysis by the financial analyst agent.
 
         Args:
             agent (object): The agent responsible for analyzing MACD data.
             macd_data (pd.DataFrame): The calculated MACD and Signal Line data.
+            recent_bars (int): Number of most recent bars included verbatim.
+            token_budget (int): Maximum tokens of MACD data in the task description.
 
         Returns:
             Task: A CrewAI task for the agent to analyze the MACD report.
         """
-        # Generate a descriptive report of the MACD analysis
+        # Summarize the MACD history instead of embedding every bar
         report = "MACD Analysis Report:\n"
-        report += macd_data.to_string(index=False)
+        report += summarize_macd(macd_data, recent=recent_bars)
+        report = truncate_to_tokens(report, token_budget)
 
         # Create the task for the agent to analyze the MACD report
         return Task(
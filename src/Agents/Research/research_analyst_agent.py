@@ -21,7 +21,9 @@ class ResearchAnalystAgent(BaseAgent):
         self.ticker = ticker
         self.previous_report = None
 
-    def get_scenarios_from_news(self):
+    def get_scenarios_from_news(self, news_query: str = None):
+        # A crew that prefetched a news search names its query so the first tool call is served from it
+        query_hint = f'Start with a Search News query for "{news_query}".' if news_query else ''
         if os.name == 'nt':  # For Windows
             formatted_date = datetime.now().strftime('%b %#d, %Y')  # Example: 'Jan 1, 2024'
         else:  # For Unix/Linux/Mac
@@ -33,6 +35,7 @@ class ResearchAnalystAgent(BaseAgent):
                 releases, and market analyses related to {self.ticker}                                               
                                                          
                Make sure to use the most recent data as possible. Do not consider news older than 1 week from {formatted_date}.
+               {query_hint}
 
                "If you do your BEST WORK, I'll give you a $10,000 commission!"
           
@@ -3,25 +3,23 @@
 from crewai import Agent, Task
 from textwrap import dedent
 from src.Indicators.detect_divergence import DivergenceDetector  # Import DivergenceDetector
-from langchain_openai import ChatOpenAI
+from src.Helpers.llm_registry import get_llm
+from src.Helpers.structured_output import DivergenceSignals, expected_json
 from src.Agents.Analysis.Tools.browser_tools import BrowserTools
 from src.Agents.Analysis.Tools.calculator_tools import CalculatorTools
 from src.Agents.Analysis.Tools.search_tools import SearchTools
 from src.Agents.Analysis.Tools.sec_tools import SECTools
 
-# Initialize the LLM (e.g., OpenAI GPT model)
-gpt_model = ChatOpenAI(
-    temperature=0,
-    model_name="gpt-4"
-)
-
 class DivergenceAnalysisAgents:
-    def divergence_trading_advisor(self):
+    def divergence_trading_advisor(self, llm=None):
         """
         Returns an agent that interprets divergence signals and provides insights on potential market reversals.
+
+        Args:
+            llm (optional): LLM to use instead of the shared GPT-4 client, e.g. structured_llm("gpt-4").
         """
         return Agent(
-            llm=gpt_model,
+            llm=llm or get_llm("gpt-4", temperature=0),
             role='Divergence Trading Advisor',
             goal="""Analyze divergence signals detected in MACD and RSI and provide insights into 
             potential reversals by analyzing historical data.""",
@@ -38,6 +36,21 @@ class DivergenceAnalysisAgents:
         )
 
 class DivergenceAnalysisTasks:
+    def _describe_divergence(self, price_data, indicator_data, indicator_name):
+        # Detect divergence using DivergenceDetector
+        detector = DivergenceDetector(price_data, indicator_data, indicator_name)
+        bullish_divergences = detector.detect_bullish_divergence()
+        bearish_divergences = detector.detect_bearish_divergence()
+
+        market_context = "Bullish trend" if len(bullish_divergences) > len(bearish_divergences) else "Bearish trend"
+        return dedent(f"""
+            Detected divergence in {indicator_name} on the following dates:
+            Bullish Divergences: {', '.join([str(d) for d in bullish_divergences])}
+            Bearish Divergences: {', '.join([str(d) for d in bearish_divergences])}
+
+            Market context: {market_context}.
+        """)
+
     def detect_divergence(self, agent, price_data, indicator_data, indicator_name):
         """
         Detect potential divergence signals and create a task for ChatGPT analysis.
@@ -51,19 +64,7 @@ class DivergenceAnalysisTasks:
         Returns:
             Task: A task for ChatGPT to analyze the divergence.
         """
-        # Detect divergence using DivergenceDetector
-        detector = DivergenceDetector(price_data, indicator_data, indicator_name)
-        bullish_divergences = detector.detect_bullish_divergence()
-        bearish_divergences = detector.detect_bearish_divergence()
-
-        # Create a message for ChatGPT analysis
-        market_context = "Bullish trend" if len(bullish_divergences) > len(bearish_divergences) else "Bearish trend"
-        description = dedent(f"""
-            Detected divergence in {indicator_name} on the following dates:
-            Bullish Divergences: {', '.join([str(d) for d in bullish_divergences])}
-            Bearish Divergences: {', '.join([str(d) for d in bearish_divergences])}
-
-            Market context: {market_context}.
+        description = self._describe_divergence(price_data, indicator_data, indicator_name) + dedent("""
             Please analyze these divergence signals to confirm if they indicate a potential market reversal.
         """)
 
@@ -72,3 +73,30 @@ class DivergenceAnalysisTasks:
             agent=agent,
             expected_output="A detailed analysis of the divergence signals with a recommendation."
         )
+
+    def divergence_signals(self, agent, price_data, indicator_data, indicator_name):
+        """
+        Create a task that answers with the confirmed divergences as a DivergenceSignals JSON object,
+        so backtests read dates and the recommendation from fields instead of parsing prose.
+
+        Args:
+            agent: The Divergence Trading Advisor agent.
+            price_data (pd.DataFrame): The stock price data.
+            indicator_data (pd.DataFrame): The indicator data (MACD/RSI).
+            indicator_name (str): Name of the indicator used for divergence detection.
+
+        Returns:
+            Task: A task whose output carries a validated DivergenceSignals in output.pydantic.
+        """
+        description = self._describe_divergence(price_data, indicator_data, indicator_name) + dedent("""
+            Confirm which of these divergences indicate a potential market reversal. List only the
+            confirmed dates, copied exactly as given, and give your trading action with a confidence
+            between 0 and 1.
+        """)
+
+        return Task(
+            description=description,
+            agent=agent,
+            expected_output=expected_json(DivergenceSignals),
+            output_pydantic=DivergenceSignals
+        )
@@ -1,11 +1,12 @@
 from datetime import datetime
 import logging
+import os
 import backtrader as bt
 import pandas as pd
-import re
 from src.Data_Retrieval.data_fetcher import DataFetcher
 from src.Agents.Correlation_Agents.correlation_agent import CorrelationAgent
 from src.Agents.Correlation_Agents.investment_decision_agent import InvestmentDecisionAgent
+from src.Helpers.structured_output import CorrelationResult, TradeDecision, parse_structured, structured_llm
 import crewai as crewai
 
 logging.basicConfig(level=logging.INFO, 
@@ -19,31 +20,43 @@ class CorrelatedStocksStrategy(bt.Strategy):
     )
 
     def __init__(self):
-        # Initialize CrewAI agents
-        self.correlation_agent = CorrelationAgent(stock1="AAPL", stock2="MSFT")
-        self.investment_decision_agent = InvestmentDecisionAgent(stock1="AAPL", stock2="MSFT")
+        # Initialize CrewAI agents; both answer with short JSON objects, on crewai's default model
+        model = os.getenv("OPENAI_MODEL_NAME") or "gpt-4o-mini"
+        self.correlation_agent = CorrelationAgent(stock1="AAPL", stock2="MSFT", llm=structured_llm(model))
+        self.investment_decision_agent = InvestmentDecisionAgent(stock1="AAPL", stock2="MSFT", llm=structured_llm(model))
 
         # Check initial correlation
         self.correlation_met = self.check_initial_correlation()
 
     def check_initial_correlation(self):
         # Create and run correlation task
-        task = self.correlation_agent.calculate_correlation()
+        task = self.correlation_agent.calculate_correlation(structured=True)
         crew = crewai.Crew(agents=[self.correlation_agent], tasks=[task], process=crewai.Process.sequential)
         result = crew.kickoff()
-        
-        # Extract correlation value from the result
-        correlation_result = result.tasks_output[0].raw
-        logging.info(f"Correlation response from CrewAI: {correlation_result}")
-
-        match = re.search(r"correlation between \w+ and \w+ is: ([\d.]+)", correlation_result)
-        if match:
-            correlation_value = float(match.group(1).strip().rstrip('.'))
-            logging.info(f"Calculated correlation: {correlation_value}")
-            return correlation_value >= self.params.correlation_threshold
-        else:
-            logging.error("Failed to extract correlation value from CrewAI response.")
+
+        try:
+            correlation = parse_structured(result, CorrelationResult)
+        except ValueError as e:
+            logging.error(f"Failed to read the correlation from the CrewAI response: {e}")
             return False
+        logging.info(f"Calculated correlation: {correlation.correlation} "
+                     f"(suitable for pairs trading: {correlation.suitable_for_pairs_trading})")
+        return correlation.correlation >= self.params.correlation_threshold
+
+    def get_decision(self):
+        """
+        Run the investment decision task. Returns 'buy', 'sell' or 'hold'; 'hold' if the answer is not valid.
+        """
+        task = self.investment_decision_agent.investment_decision(structured=True)
+        crew = crewai.Crew(agents=[self.investment_decision_agent], tasks=[task], process=crewai.Process.sequential)
+        try:
+            decision = parse_structured(crew.kickoff(), TradeDecision)
+        except ValueError as e:
+            logging.error(f"Failed to read the investment decision from the CrewAI response: {e}")
+            return 'hold'
+        logging.info(f"Investment decision from CrewAI: {decision.action} "
+                     f"(confidence {decision.confidence:.2f}): {decision.rationale}")
+        return decision.action
 
     def next(self):
         current_date = self.datas[0].datetime.date(0)
@@ -51,13 +64,7 @@ class CorrelatedStocksStrategy(bt.Strategy):
         if not self.position:
             # Check for buy signal when no position is open
             if self.correlation_met:
-                task = self.investment_decision_agent.investment_decision()
-                crew = crewai.Crew(agents=[self.investment_decision_agent], tasks=[task], process=crewai.Process.sequential)
-                decision_result = crew.kickoff().tasks_output[0].raw
-
-                # Log the decision and parse for a buy signal
-                logging.info(f"Investment decision from CrewAI: {decision_result}")
-                if "buy" in decision_result.lower():
+                if self.get_decision() == 'buy':
                     cash = self.broker.getcash()
                     price = self.data0.close[0]
                     size = (cash * self.params.allocation) // price
@@ -66,12 +73,7 @@ class CorrelatedStocksStrategy(bt.Strategy):
 
         elif self.position:
             # Check for sell signal when in a position
-            task = self.investment_decision_agent.investment_decision()
-            crew = crewai.Crew(agents=[self.investment_decision_agent], tasks=[task], process=crewai.Process.sequential)
-            decision_result = crew.kickoff().tasks_output[0].raw
-
-            logging.info(f"Investment decision from CrewAI: {decision_result}")
-            if "sell" in decision_result.lower():
+            if self.get_decision() == 'sell':
                 size = self.position.size
                 price = self.data0.close[0]
                 self.sell(size=size)
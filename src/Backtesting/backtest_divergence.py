@@ -1,17 +1,15 @@
 import os
-import re
 import numpy as np
 import pandas as pd
 from dotenv import load_dotenv
 from sklearn.metrics import mean_absolute_error
 from crewai import Crew
-from src.Agents.Analysis.stock_analysis_agents import StockAnalysisAgents
-from src.Agents.Analysis.stock_analysis_tasks import StockAnalysisTasks
 from src.Agents.divergence_agents.divergence_agent import DivergenceAnalysisAgents, DivergenceAnalysisTasks
 from src.Data_Retrieval.data_fetcher import DataFetcher
 from src.Indicators.rsi_divergence import RSIIndicator
 from src.Indicators.macd_indicator import MACDIndicator
 from src.Indicators.detect_divergence import DivergenceDetector
+from src.Helpers.structured_output import DivergenceSignals, parse_structured, structured_llm
 
 # Load environment variables
 load_dotenv()
@@ -23,13 +21,11 @@ class FinancialCrew:
 
     def run(self):
         # Initialize agents and tasks
-        agents = StockAnalysisAgents()
         divergence_agents = DivergenceAnalysisAgents()
-        tasks = StockAnalysisTasks()
         divergence_tasks = DivergenceAnalysisTasks()
 
-        # Initialize the divergence trading advisor agent
-        divergence_agent = divergence_agents.divergence_trading_advisor()
+        # Initialize the divergence trading advisor agent; it answers with a short JSON object
+        divergence_agent = divergence_agents.divergence_trading_advisor(llm=structured_llm("gpt-4"))
 
         # Fetch stock data
         data_fetcher = DataFetcher()
@@ -43,8 +39,8 @@ class FinancialCrew:
         else:
             raise ValueError(f"Unsupported indicator: {self.indicator_name}")
 
-        # Create a divergence detection task
-        divergence_task = divergence_tasks.detect_divergence(
+        # Create a divergence detection task answered as DivergenceSignals
+        divergence_task = divergence_tasks.divergence_signals(
             divergence_agent, stock_data, indicator_data, self.indicator_name
         )
 
@@ -92,51 +88,19 @@ class Backtester:
     def extract_divergence_signals(self, crew_output):
         """
         Extracts bullish and bearish divergence dates from CrewOutput.
-        Parses the raw text to find dates mentioned in the narrative.
+        Reads the DivergenceSignals object the divergence task answers with.
         """
-        bullish_divergence_dates = []
-        bearish_divergence_dates = []
-
         try:
-            # Access the raw text from CrewOutput
-            if hasattr(crew_output, 'tasks_output') and len(crew_output.tasks_output) > 0:
-                task_output = crew_output.tasks_output[0]
-
-                if hasattr(task_output, 'raw'):
-                    raw_text = task_output.raw
-                    print(f"Raw CrewOutput Text:\n{raw_text}\n")
-
-                    # Use regex to extract dates from the raw text
-                    bullish_pattern = r'Bullish Divergences?:\s*([\d-]+\s*\d{2}:\d{2}:\d{2}(?:,\s*[\d-]+\s*\d{2}:\d{2}:\d{2})*)'
-                    bearish_pattern = r'Bearish Divergences?:\s*([\d-]+\s*\d{2}:\d{2}:\d{2}(?:,\s*[\d-]+\s*\d{2}:\d{2}:\d{2})*)'
-
-                    bullish_match = re.search(bullish_pattern, raw_text, re.IGNORECASE)
-                    bearish_match = re.search(bearish_pattern, raw_text, re.IGNORECASE)
-
-                    if bullish_match:
-                        bullish_dates_str = bullish_match.group(1)
-                        bullish_divergence_dates = [
-                            pd.to_datetime(date.strip()) for date in bullish_dates_str.split(',')
-                        ]
-                        print(f"Extracted Bullish Divergence Dates: {bullish_divergence_dates}")
-                    else:
-                        print("No Bullish Divergence dates found in the CrewOutput.")
-
-                    if bearish_match:
-                        bearish_dates_str = bearish_match.group(1)
-                        bearish_divergence_dates = [
-                            pd.to_datetime(date.strip()) for date in bearish_dates_str.split(',')
-                        ]
-                        print(f"Extracted Bearish Divergence Dates: {bearish_divergence_dates}")
-                    else:
-                        print("No Bearish Divergence dates found in the CrewOutput.")
-                else:
-                    print("TaskOutput does not have a 'raw' attribute.")
-            else:
-                print("No task output found in CrewOutput.")
-        except Exception as e:
+            signals = parse_structured(crew_output, DivergenceSignals)
+        except ValueError as e:
             print(f"Error extracting divergence signals: {e}")
+            return [], []
 
+        bullish_divergence_dates = [pd.Timestamp(date) for date in signals.bullish_dates]
+        bearish_divergence_dates = [pd.Timestamp(date) for date in signals.bearish_dates]
+        print(f"Extracted Bullish Divergence Dates: {bullish_divergence_dates}")
+        print(f"Extracted Bearish Divergence Dates: {bearish_divergence_dates}")
+        print(f"Recommendation: {signals.action} (confidence {signals.confidence:.2f})")
         return bullish_divergence_dates, bearish_divergence_dates
 
     def run_non_crewai_system(self, stock_data, indicator_data):
@@ -7,19 +7,13 @@ from crewai import Crew
 from src.Agents.Analysis.stock_analysis_agents import StockAnalysisAgents
 from src.Agents.Analysis.stock_analysis_tasks import StockAnalysisTasks
 from yahooquery import Ticker
-import langchain_openai as lang_oai
+from src.Helpers.llm_registry import get_llm
 
 import re
 
 # Load environment variables
 load_dotenv()
 
-gpt_4o_high_tokens = lang_oai.ChatOpenAI(
-    model_name="gpt-4o",
-    temperature=0.0,
-    max_tokens=1500
-)
-
 # ---------- Utility Function ----------
 def preprocess_data(data_df):
     """Prepares the data for Backtrader."""
@@ -47,7 +41,7 @@ class DividendCrewAIStrategy(bt.Strategy):
 
     def fetch_dividend_forecast(self):
         """Fetches and parses the daily dividend growth forecast from CrewAI."""
-        agents = StockAnalysisAgents(gpt_model=gpt_4o_high_tokens)
+        agents = StockAnalysisAgents(gpt_model=get_llm("gpt-4o", temperature=0.0, max_tokens=1500))
         tasks = StockAnalysisTasks()
         dividend_forecasting_agent = agents.dividend_forecasting_agent(self.params.company)
 
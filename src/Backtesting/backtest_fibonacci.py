@@ -6,6 +6,7 @@ import os
 from src.Agents.Analysis.stock_analysis_agents import StockAnalysisAgents
 from src.Agents.Analysis.stock_analysis_tasks import StockAnalysisTasks
 from src.Indicators.fibonacci import FibonacciRetracement
+from src.Backtesting.results_store import BacktestResultsStore, run_and_store, strategy_config
 from crewai import Crew
 import sys
 
@@ -117,71 +118,35 @@ class FibonacciStrategy(bt.Strategy):
         if trade.isclosed:
             self.log(f'OPERATION PROFIT, GROSS {trade.pnl:.2f}, NET {trade.pnlcomm:.2f}')
 
-def run_strategy(strategy_class, strategy_name, data_df, company=None):
-    cerebro = bt.Cerebro()
-    cerebro.broker.setcash(100000.0)
-    cerebro.broker.setcommission(commission=0.001)
-
-    # Create the data feed with adjusted column names
-    data = bt.feeds.PandasData(
-        dataname=data_df,
-        datetime=None,  # Use index as datetime
-        open='Open',
-        high='High',
-        low='Low',
-        close='Close',
-        volume='Volume',
-        openinterest=-1
-    )
-    cerebro.adddata(data)
-
-    # Modify this part to conditionally pass 'company'
+def run_strategy(strategy_class, strategy_name, data_df, company=None, store=None):
+    # Only strategies that require it get the 'company' parameter
+    strategy_params = dict(data_df=data_df, printlog=True)
     if company:
-        # Strategy requires 'company' parameter
-        cerebro.addstrategy(strategy_class, company=company, data_df=data_df, printlog=True)
-    else:
-        # Strategy does not require 'company' parameter
-        cerebro.addstrategy(strategy_class, data_df=data_df, printlog=True)
-
-    cerebro.addanalyzer(bt.analyzers.SharpeRatio, _name='sharpe')
-    cerebro.addanalyzer(bt.analyzers.DrawDown, _name='drawdown')
-    cerebro.addanalyzer(bt.analyzers.TimeReturn, timeframe=bt.TimeFrame.NoTimeFrame, _name='timereturn')
-
-    print(f'\nRunning {strategy_name}...')
-    print(f'Starting Portfolio Value: {cerebro.broker.getvalue():.2f}')
-    results = cerebro.run()
-    strat = results[0]
-    print(f'Final Portfolio Value: {cerebro.broker.getvalue():.2f}')
-
-    sharpe = strat.analyzers.sharpe.get_analysis()
-    drawdown = strat.analyzers.drawdown.get_analysis()
-    timereturn = strat.analyzers.timereturn.get_analysis()
-
-    strategy_returns = pd.Series(timereturn)
-    cumulative_return = (strategy_returns + 1.0).prod() - 1.0
-    start_date = data_df.index[0]
-    end_date = data_df.index[-1]
-    num_years = (end_date - start_date).days / 365.25
-    annual_return = (1 + cumulative_return) ** (1 / num_years) - 1 if num_years != 0 else 0.0
-
-    print(f'\n{strategy_name} Performance Metrics:')
-    print('----------------------------------------')
-    print(f"Sharpe Ratio: {sharpe.get('sharperatio', 'N/A')}")
-    print(f"Total Return: {cumulative_return * 100:.2f}%")
-    print(f"Annual Return: {annual_return * 100:.2f}%")
-    print(f"Max Drawdown: {drawdown.max.drawdown:.2f}%")
-
-    # Plot the strategy results (comment out if not needed)
-    # cerebro.plot(style='candlestick')
-
-    return {
-        'strategy_name': strategy_name,
-        'sharpe_ratio': sharpe.get('sharperatio', 'N/A'),
-        'total_return': cumulative_return * 100,
-        'annual_return': annual_return * 100,
-        'max_drawdown': drawdown.max.drawdown,
+        strategy_params['company'] = company
+    config = {
+        **strategy_config(strategy_class, **strategy_params),
+        'company': company,
+        'cash': 100000.0,
+        'commission': 0.001,
     }
 
+    def build(cerebro):
+        # Create the data feed with adjusted column names
+        data = bt.feeds.PandasData(
+            dataname=data_df,
+            datetime=None,  # Use index as datetime
+            open='Open',
+            high='High',
+            low='Low',
+            close='Close',
+            volume='Volume',
+            openinterest=-1
+        )
+        cerebro.adddata(data)
+        cerebro.addstrategy(strategy_class, **strategy_params)
+
+    return run_and_store(build, strategy_name, data_df, config, store)
+
 if __name__ == '__main__':
     company = 'AAPL'
     data_df = yf.download(company, start='2020-01-01', end='2024-10-30')
@@ -203,25 +168,30 @@ if __name__ == '__main__':
     # Remove any unnecessary columns
     data_df = data_df[['Open', 'High', 'Low', 'Close', 'Volume']]
 
+    # Runs with an identical configuration and data are served from the results store
+    store = BacktestResultsStore()
+
     # Run the CrewAI Fibonacci Strategy
     fib_metrics_crewai = run_strategy(
         FibonacciCrewAIStrategy,
         'Fibonacci CrewAI Strategy',
         data_df.copy(),
-        company
+        company,
+        store=store
     )
 
     # Run the Non-CrewAI Fibonacci Strategy
     fib_metrics_noncrewai = run_strategy(
         FibonacciStrategy,
         'Non-CrewAI Fibonacci Strategy',
-        data_df.copy()
+        data_df.copy(),
         # Do not pass 'company' here; it's optional and defaults to None
+        store=store
     )
 
     # Compare the performance metrics
     print("\nComparison of Strategies:")
     print("-------------------------")
-    metrics = ['strategy_name', 'sharpe_ratio', 'total_return', 'annual_return', 'max_drawdown']
+    metrics = ['strategy_name', 'sharpe_ratio', 'sortino_ratio', 'total_return', 'annual_return', 'max_drawdown', 'calmar_ratio']
     df_metrics = pd.DataFrame([fib_metrics_crewai, fib_metrics_noncrewai], columns=metrics)
     print(df_metrics.to_string(index=False))
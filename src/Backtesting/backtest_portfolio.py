@@ -0,0 +1,202 @@
+from datetime import datetime
+import logging
+import numpy as np
+import pandas as pd
+from src.Backtesting.performance_metrics import TRADING_DAYS_PER_YEAR, compute_metrics, print_metrics
+
+
+logging.basicConfig(level=logging.INFO,
+                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+# How many bars ahead the drift check looks at once. Keeps each step bounded
+# when a portfolio goes a long time without breaching the drift threshold.
+DRIFT_LOOKAHEAD = TRADING_DAYS_PER_YEAR
+
+
+def target_weights_from_portfolio(portfolio_data) -> dict:
+    """
+    Flatten PortfolioDataAgent-style portfolio data into target weights.
+
+    Args:
+        portfolio_data (list): Asset classes with 'holdings', each holding having 'ticker' and 'weight'.
+
+    Returns:
+        dict: Ticker to target weight.
+    """
+    weights = {}
+    for asset in portfolio_data:
+        for holding in asset['holdings']:
+            weights[holding['ticker']] = weights.get(holding['ticker'], 0.0) + holding['weight']
+    return weights
+
+
+class PortfolioBacktester:
+    def __init__(self, prices: pd.DataFrame, target_weights, rebalance='M',
+                 drift_threshold=None, cash=100000.0, commission=0.001):
+        """
+        Initializes the PortfolioBacktester class.
+
+        Args:
+            prices (pd.DataFrame): Close prices with a DatetimeIndex and one column per ticker.
+            target_weights (dict | pd.Series): Ticker to target weight. Weights summing to less
+                than 1.0 leave the remainder in cash.
+            rebalance (str, optional): Pandas period alias for scheduled rebalancing ('W', 'M', 'Q', 'Y').
+                None disables scheduled rebalancing.
+            drift_threshold (float, optional): Rebalance whenever any holding drifts more than this
+                (absolute weight) away from its target. None disables drift rebalancing.
+            cash (float): Starting portfolio value.
+            commission (float): Proportional cost charged on traded value at each rebalance.
+        """
+        target_weights = pd.Series(target_weights, dtype=float)
+        missing = [ticker for ticker in target_weights.index if ticker not in prices.columns]
+        if missing:
+            raise ValueError(f"No price data for tickers: {', '.join(missing)}")
+        if (target_weights < 0).any() or target_weights.sum() > 1.0 + 1e-9:
+            raise ValueError("Target weights must be non-negative and sum to at most 1.")
+        if not isinstance(prices.index, pd.DatetimeIndex):
+            raise ValueError("DataFrame index must be a DatetimeIndex.")
+        if prices.empty:
+            raise ValueError("Price data is empty.")
+
+        self.prices = prices[target_weights.index].sort_index().ffill()
+        self.target_weights = target_weights
+        self.rebalance = rebalance
+        self.drift_threshold = drift_threshold
+        self.cash = cash
+        self.commission = commission
+
+    def _scheduled_rebalances(self) -> np.ndarray:
+        """
+        Bar positions of the first trading day of each rebalance period.
+        """
+        if self.rebalance is None:
+            return np.array([], dtype=int)
+        periods = self.prices.index.to_period(self.rebalance)
+        starts = np.flatnonzero(periods[1:] != periods[:-1]) + 1
+        return starts
+
+    def _weights_at(self, prices_row: np.ndarray) -> np.ndarray:
+        """
+        Target weights restricted to assets that have a price on this bar, renormalized.
+        """
+        target = self.target_weights.values
+        available = np.isfinite(prices_row)
+        weights = np.where(available, target, 0.0)
+        if weights.sum() > 0:
+            weights *= target.sum() / weights.sum()
+        return weights
+
+    def run(self) -> dict:
+        """
+        Run the backtest.
+
+        Bars between two rebalances are evaluated as one block: each holding's growth
+        relative to the rebalance bar is a row of the aligned price matrix, so the only
+        Python loop is over rebalances, never over instruments or individual bars.
+
+        Returns:
+            dict: 'equity' (pd.Series), 'returns' (pd.Series), 'rebalances' (pd.DataFrame of
+            weights, turnover and cost at each rebalance) and 'metrics' (dict).
+        """
+        prices = self.prices.values
+        n_bars = prices.shape[0]
+        scheduled = self._scheduled_rebalances()
+
+        equity = np.empty(n_bars)
+        value = float(self.cash)
+        held = np.zeros(prices.shape[1])
+        rebalance_rows = []
+
+        start = 0
+        while True:
+            weights = self._weights_at(prices[start])
+            turnover = np.abs(weights - held).sum()
+            cost = value * self.commission * turnover
+            value -= cost
+            rebalance_rows.append((self.prices.index[start], turnover, cost, weights))
+
+            later = scheduled[scheduled > start]
+            stop = later[0] if later.size else n_bars - 1
+            base = np.where(weights > 0, prices[start], 1.0)
+            cash_weight = 1.0 - weights.sum()
+
+            # Walk forward in bounded windows until the next rebalance bar is reached
+            pos = start
+            while True:
+                hi = min(stop, pos + DRIFT_LOOKAHEAD)
+                growth = np.nan_to_num(prices[pos:hi + 1] / base) * weights
+                block_value = growth.sum(axis=1) + cash_weight
+                end = hi
+                if self.drift_threshold is not None:
+                    drift = np.abs(growth / block_value[:, None] - weights).max(axis=1)
+                    if pos == start:
+                        drift[0] = 0.0
+                    breach = np.flatnonzero(drift > self.drift_threshold)
+                    if breach.size:
+                        end = pos + breach[0]
+                equity[pos:end + 1] = value * block_value[:end - pos + 1]
+                if end < hi or hi == stop:
+                    break
+                pos = hi + 1
+
+            if end == n_bars - 1:
+                break
+            held = growth[end - pos] / block_value[end - pos]
+            value = equity[end]
+            start = end
+
+        equity = pd.Series(equity, index=self.prices.index, name='equity')
+        returns = equity.pct_change().fillna(0.0)
+        rebalances = pd.DataFrame(
+            [weights for _, _, _, weights in rebalance_rows],
+            index=pd.DatetimeIndex([date for date, _, _, _ in rebalance_rows], name='date'),
+            columns=self.prices.columns,
+        )
+        rebalances['turnover'] = [turnover for _, turnover, _, _ in rebalance_rows]
+        rebalances['cost'] = [cost for _, _, cost, _ in rebalance_rows]
+
+        return {
+            'equity': equity,
+            'returns': returns,
+            'rebalances': rebalances,
+            'metrics': self.compute_metrics(equity, returns, rebalances),
+        }
+
+    def compute_metrics(self, equity: pd.Series, returns: pd.Series, rebalances: pd.DataFrame) -> dict:
+        """
+        Portfolio-level performance metrics. Turnover is the traded fraction of the
+        portfolio per year, taken from the rebalances rather than from a position series.
+        """
+        metrics = compute_metrics(returns.values[1:])
+        years = (len(returns) - 1) / TRADING_DAYS_PER_YEAR
+        metrics['turnover'] = rebalances['turnover'].sum() / years if years > 0 else np.nan
+        metrics['rebalance_count'] = len(rebalances)
+        return metrics
+
+
+def load_prices(tickers, start, end) -> pd.DataFrame:
+    """
+    Download aligned close prices for many tickers in a single request.
+    """
+    import yfinance as yf
+
+    data = yf.download(list(tickers), start=start.strftime('%Y-%m-%d'), end=end.strftime('%Y-%m-%d'))
+    prices = data['Close']
+    if isinstance(prices, pd.Series):
+        prices = prices.to_frame(name=list(tickers)[0])
+    prices.index = pd.to_datetime(prices.index)
+    return prices
+
+
+if __name__ == '__main__':
+    from src.Agents.Scenario_Agents.portfolio_data_agent import PortfolioDataAgent
+
+    weights = target_weights_from_portfolio(PortfolioDataAgent().portfolio_data)
+    prices = load_prices(weights.keys(), datetime(2010, 1, 1), datetime.today())
+
+    for name, kwargs in [('Monthly Rebalance', dict(rebalance='M')),
+                         ('5% Drift Rebalance', dict(rebalance=None, drift_threshold=0.05)),
+                         ('Buy and Hold', dict(rebalance=None))]:
+        result = PortfolioBacktester(prices, weights, **kwargs).run()
+        print_metrics(name, result['metrics'])
+        print(f"Rebalances: {result['metrics']['rebalance_count']}")
@@ -1,18 +1,21 @@
 import os
-import re
+import json
 import numpy as np
 from fredapi import Fred
 from dotenv import load_dotenv
 from sklearn.metrics import mean_absolute_error
+from textwrap import dedent
 from crewai import Crew, Task
 from src.Agents.Analysis.stock_analysis_agents import StockAnalysisAgents
-from src.Agents.Analysis.stock_analysis_tasks import StockAnalysisTasks
-import json
+from src.Helpers.structured_output import SectorForecast, expected_json, parse_structured, structured_llm
 
 # Load environment variables (e.g., FRED API key)
 load_dotenv()
 
 
+SECTORS = ["Technology", "Finance", "Healthcare", "Energy", "Consumer Discretionary"]
+
+
 class EconomicCrew:
     def __init__(self):
         self.fred_api_key = os.getenv('FRED_API_KEY')
@@ -82,15 +85,32 @@ class EconomicCrew:
             "PolicyChanges": policy_changes
         }
 
-    def simulate_predictions(self, combined_data):
-        agents = StockAnalysisAgents()
-        tasks = StockAnalysisTasks()
+    def sector_prediction_task(self, agent, combined_data):
+        """
+        Create the sector prediction task. The agent answers with a SectorForecast JSON object,
+        one expected return per sector.
+        """
+        return Task(
+            description=dedent(f"""
+                Using the following macroeconomic indicators, financial reports and policy changes,
+                predict which sectors are likely to perform well in the coming quarter:
+
+                {json.dumps(combined_data, default=str)}
+
+                Give an expected return (as a decimal, e.g. 0.05 for +5%) and a confidence between
+                0 and 1 for each of these sectors: {', '.join(SECTORS)}.
+            """),
+            agent=agent,
+            expected_output=expected_json(SectorForecast),
+            output_pydantic=SectorForecast
+        )
 
-        # Create an economic forecasting agent
-        economic_forecasting_agent = agents.economic_forecasting_agent()
+    def simulate_predictions(self, combined_data):
+        # Create an economic forecasting agent that answers with a short JSON object
+        economic_forecasting_agent = StockAnalysisAgents(gpt_model=structured_llm()).economic_forecasting_agent()
 
         # Create the sector prediction task
-        sector_prediction_task = tasks.predict_sector_performance(
+        sector_prediction_task = self.sector_prediction_task(
             agent=economic_forecasting_agent,
             combined_data=combined_data
         )
@@ -110,62 +130,18 @@ class EconomicCrew:
     def extract_predictions(self, crew_output):
         """
         Extracts sector predictions from the CrewOutput object.
-        Parses the narrative text to assign numerical values to each sector.
+        Reads the SectorForecast the sector prediction task answers with.
+
+        Returns:
+            dict: Expected return by sector, or {} if the output is not a valid SectorForecast.
         """
         try:
-            # Inspect the structure of CrewOutput for debugging
-            print("Inspecting CrewOutput structure...")
-            print(crew_output)
-
-            # Check if 'tasks_output' attribute exists and is non-empty
-            if hasattr(crew_output, 'tasks_output') and len(crew_output.tasks_output) > 0:
-                task_output = crew_output.tasks_output[0]
-
-                # Attempt to access the 'raw' attribute
-                if hasattr(task_output, 'raw'):
-                    prediction_text = task_output.raw
-                else:
-                    print("TaskOutput does not have a 'raw' attribute.")
-                    print("Available attributes:", dir(task_output))
-                    return {}
-
-                # Parse predictions from the text
-                predictions = self.parse_narrative_predictions(prediction_text)
-                return predictions
-            else:
-                print("No task output found in CrewOutput.")
-                return {}
-        except Exception as e:
+            forecast = parse_structured(crew_output, SectorForecast)
+        except ValueError as e:
             print(f"Error extracting predictions: {e}")
             return {}
 
-    def parse_narrative_predictions(self, text):
-        """
-        Parses the narrative text to extract sector predictions.
-        Assigns numerical values based on qualitative descriptions.
-        """
-        sector_predictions = {}
-        sectors = ["Technology", "Finance", "Healthcare", "Energy", "Consumer Discretionary"]
-
-        for sector in sectors:
-            # Create a regex pattern to find lines like "- **Technology Sector:** Likely to perform well."
-            pattern = rf"-\s*\*\*{sector} Sector\*\*:\s*(.+)"
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                prediction = match.group(1).strip().lower()
-                # Assign numerical values based on keywords
-                if "perform well" in prediction or "likely to grow" in prediction or "expected to benefit" in prediction:
-                    sector_predictions[sector] = 0.05  # Positive prediction
-                elif "stable" in prediction or "neutral" in prediction:
-                    sector_predictions[sector] = 0.0   # Neutral prediction
-                elif "face challenges" in prediction or "may face challenges" in prediction or "may be negatively impacted" in prediction:
-                    sector_predictions[sector] = -0.05  # Negative prediction
-                else:
-                    sector_predictions[sector] = 0.0   # Default to neutral if unclear
-            else:
-                # If no specific prediction found, default to 0.0
-                sector_predictions[sector] = 0.0
-
+        sector_predictions = {prediction.sector: prediction.expected_return for prediction in forecast.predictions}
         print(f"Parsed Predictions: {sector_predictions}")
         return sector_predictions
 
@@ -255,7 +231,7 @@ class Backtester:
         """
         Runs the backtest for both CrewAI and non-CrewAI systems.
         """
-        sectors = ["Technology", "Finance", "Healthcare", "Energy", "Consumer Discretionary"]
+        sectors = SECTORS
 
         # Backtest CrewAI system
         crewai_results = self.backtest_crewai(sectors)
@@ -3,6 +3,7 @@ import logging
 import backtrader as bt
 import numpy as np
 from src.Data_Retrieval.data_fetcher import DataFetcher
+from src.Backtesting.performance_metrics import add_metric_analyzers, metrics_from_strategy, print_metrics
 
 
 logging.basicConfig(level=logging.INFO, 
@@ -72,32 +73,22 @@ def run_backtest(strategy_class, data_feed, cash=10000, commission=0.001):
  
 
     # Add analyzers to the backtest
-    cerebro.addanalyzer(bt.analyzers.SharpeRatio, _name='sharpe', riskfreerate=0.01)
-    cerebro.addanalyzer(bt.analyzers.Returns, _name='returns')
-    cerebro.addanalyzer(bt.analyzers.DrawDown, _name='drawdown')
+    add_metric_analyzers(cerebro)
 
     
     # Run the backtest
     logging.info(f"Running {strategy_class.__name__} Strategy...")
     result = cerebro.run()
     
-    # Extract the strategy and analyzer data
+    # Extract the strategy and compute the shared metrics
     strat = result[0]
-    sharpe = strat.analyzers.sharpe.get_analysis()
-    returns = strat.analyzers.returns.get_analysis()
-    drawdown = strat.analyzers.drawdown.get_analysis()
-    max_drawdown_duration = drawdown.get('maxdrawdownperiod', 'N/A')  # Use 'N/A' if missing
+    metrics, _ = metrics_from_strategy(strat, risk_free_rate=0.01)
  
     # Log the detailed analysis
     logging.info(f"Returns Analysis {strategy_class.__name__}:")
-    logging.info("\n%s", returns)  # Log the whole analysis dictionary
-
-    print(f"  Sharpe Ratio: {sharpe['sharperatio']:.2f}")
-    print(f"  Total Return: {returns['rtot']*100:.2f}%")
-    print(f"  Avg Daily Return: {returns['ravg']*100:.2f}%")
-    print(f"  Avg Annual Return: {((1+returns['ravg'])**252 - 1)*100:.2f}%")
-    print(f"  Max Drawdown: {drawdown.drawdown*100:.2f}%")
-    print(f"  Max Drawdown Duration: {max_drawdown_duration}")
+    logging.info("\n%s", metrics)  # Log the whole metrics dictionary
+
+    print_metrics(strategy_class.__name__, metrics)
 
     cerebro.plot()
 
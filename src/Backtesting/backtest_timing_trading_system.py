@@ -5,6 +5,7 @@ import yfinance as yf
 import logging
 import os
 from dotenv import load_dotenv
+from src.Backtesting.results_store import BacktestResultsStore, run_and_store, strategy_config
 
 # Load environment variables (e.g., for API keys if needed)
 load_dotenv()
@@ -103,13 +104,20 @@ class BuyAndHold(bt.Strategy):
                 logging.info(f'SELL EXECUTED, Price: {order.executed.price:.2f}')
 
 
-def run_strategy(strategy_class, strategy_name, data_df, stock=None):
+def run_strategy(strategy_class, strategy_name, data_df, stock=None, store=None):
     """
     Runs a Backtrader strategy and returns performance metrics.
     """
-    cerebro = bt.Cerebro()
-    cerebro.broker.setcash(100000.0)
-    cerebro.broker.setcommission(commission=0.001)
+    # Add strategy with parameters
+    strategy_params = {}
+    if strategy_class == TimingTradingSystemStrategy and stock:
+        strategy_params = dict(stock=stock, printlog=True)
+    config = {
+        **strategy_config(strategy_class, **strategy_params),
+        'stock': stock,
+        'cash': 100000.0,
+        'commission': 0.001,
+    }
 
     # Ensure data_df has the required columns
     required_columns = ['Open', 'High', 'Low', 'Close', 'Volume']
@@ -117,67 +125,22 @@ def run_strategy(strategy_class, strategy_name, data_df, stock=None):
         if col not in data_df.columns:
             raise ValueError(f"Missing required column: {col}")
 
-    # Create the data feed with explicit column mappings
-    data = bt.feeds.PandasData(
-        dataname=data_df,
-        datetime=None,  # Use index as datetime
-        open='Open',
-        high='High',
-        low='Low',
-        close='Close',
-        volume='Volume',
-        openinterest=-1
-    )
-    cerebro.adddata(data)
+    def build(cerebro):
+        # Create the data feed with explicit column mappings
+        data = bt.feeds.PandasData(
+            dataname=data_df,
+            datetime=None,  # Use index as datetime
+            open='Open',
+            high='High',
+            low='Low',
+            close='Close',
+            volume='Volume',
+            openinterest=-1
+        )
+        cerebro.adddata(data)
+        cerebro.addstrategy(strategy_class, **strategy_params)
 
-    # Add strategy with parameters
-    if strategy_class == TimingTradingSystemStrategy and stock:
-        cerebro.addstrategy(strategy_class, stock=stock, printlog=True)
-    else:
-        cerebro.addstrategy(strategy_class)
-
-    # Add analyzers
-    cerebro.addanalyzer(bt.analyzers.SharpeRatio, _name='sharpe')
-    cerebro.addanalyzer(bt.analyzers.DrawDown, _name='drawdown')
-    cerebro.addanalyzer(bt.analyzers.TimeReturn, timeframe=bt.TimeFrame.NoTimeFrame, _name='timereturn')
-
-    print(f'\nRunning {strategy_name}...')
-    print(f'Starting Portfolio Value: {cerebro.broker.getvalue():.2f}')
-    results = cerebro.run()
-    strat = results[0]
-    print(f'Final Portfolio Value: {cerebro.broker.getvalue():.2f}')
-
-    # Retrieve analyzers
-    sharpe = strat.analyzers.sharpe.get_analysis()
-    drawdown = strat.analyzers.drawdown.get_analysis()
-    timereturn = strat.analyzers.timereturn.get_analysis()
-
-    # Calculate performance metrics
-    strategy_returns = pd.Series(timereturn)
-    cumulative_return = (strategy_returns + 1.0).prod() - 1.0
-
-    start_date = data_df.index[0]
-    end_date = data_df.index[-1]
-    num_years = (end_date - start_date).days / 365.25
-    annual_return = (1 + cumulative_return) ** (1 / num_years) - 1 if num_years else 0.0
-
-    print(f'\n{strategy_name} Performance Metrics:')
-    print('----------------------------------------')
-    print(f"Sharpe Ratio: {sharpe.get('sharperatio', 'N/A')}")
-    print(f"Total Return: {cumulative_return * 100:.2f}%")
-    print(f"Annual Return: {annual_return * 100:.2f}%")
-    print(f"Max Drawdown: {drawdown.max.drawdown:.2f}%")
-
-    # Uncomment the following line to plot the strategy results
-    # cerebro.plot(style='candlestick')
-
-    return {
-        'strategy_name': strategy_name,
-        'sharpe_ratio': sharpe.get('sharperatio', 'N/A'),
-        'total_return': cumulative_return * 100,
-        'annual_return': annual_return * 100,
-        'max_drawdown': drawdown.max.drawdown,
-    }
+    return run_and_store(build, strategy_name, data_df, config, store)
 
 
 def main():
@@ -202,13 +165,17 @@ def main():
     required_columns = ['Open', 'High', 'Low', 'Close', 'Volume']
     data_df = data_df[required_columns]
 
+    # Runs with an identical configuration and data are served from the results store
+    store = BacktestResultsStore()
+
     # Run TimingTradingSystemStrategy
     try:
         timing_trading_system_metrics = run_strategy(
             TimingTradingSystemStrategy,
             'Timing Trading System Strategy',
             data_df.copy(),
-            stock
+            stock,
+            store=store
         )
     except Exception as e:
         print(f"Error running Timing Trading System Strategy: {e}")
@@ -219,7 +186,8 @@ def main():
         buy_and_hold_metrics = run_strategy(
             BuyAndHold,
             'Buy and Hold Strategy',
-            data_df.copy()
+            data_df.copy(),
+            store=store
         )
     except Exception as e:
         print(f"Error running Buy and Hold Strategy: {e}")
@@ -229,7 +197,7 @@ def main():
     print("\nPerformance Comparison:")
     print("----------------------------------------")
     if timing_trading_system_metrics and buy_and_hold_metrics:
-        metrics = ['strategy_name', 'sharpe_ratio', 'total_return', 'annual_return', 'max_drawdown']
+        metrics = ['strategy_name', 'sharpe_ratio', 'sortino_ratio', 'total_return', 'annual_return', 'max_drawdown', 'calmar_ratio']
         df_metrics = pd.DataFrame([timing_trading_system_metrics, buy_and_hold_metrics], columns=metrics)
         print(df_metrics.to_string(index=False))
     else:
@@ -5,6 +5,8 @@ from dotenv import load_dotenv
 import os
 from src.Agents.Earnings_Calls_Sec_Filings_Agents.earnings_sec_analysis_agents import EarningsSecAnalysisAgents
 from crewai import Crew
+from src.Helpers.filing_store import get_filing_store
+from src.Helpers.structured_output import TradeDecision, parse_structured
 import sys
 import requests
 
@@ -34,13 +36,27 @@ class CrewAIEarningsCallsStrategy(bt.Strategy):
         self.crew_output = {}
 
     def fetch_sec_filings(self):
-        from yahooquery import Ticker
-        ticker = Ticker(self.params.company)
-        sec_filings = ticker.sec_filings
-        if sec_filings.empty:
+        # The filing list is kept in the local filing store and only re-pulled from Yahoo once
+        # per refresh interval, instead of at every earnings call date
+        store = get_filing_store()
+        store.update(self.params.company, '', self._yahoo_filings, source='yahoo')
+        filings = store.filings(self.params.company, source='yahoo')
+        if not filings:
             print("No SEC filings found for the company.")
             return None
-        return sec_filings.to_json()
+        return pd.DataFrame([filing['metadata'] for filing in filings]).to_json()
+
+    def _yahoo_filings(self, since=None):
+        # Yahoo cannot filter by date; filings already stored are skipped by the store
+        from yahooquery import Ticker
+        sec_filings = Ticker(self.params.company).sec_filings
+        if not isinstance(sec_filings, pd.DataFrame) or sec_filings.empty:
+            return []
+        sec_filings = sec_filings.reset_index()
+        if since is not None:
+            sec_filings = sec_filings[sec_filings['date'].astype(str) >= since[:10]]
+        return [{'filed_at': str(row['date']), 'url': row['edgarUrl'], 'metadata': row}
+                for row in sec_filings.to_dict('records')]
 
     def fetch_earnings_calls(self):
         url = f'https://v2.api.earningscall.biz/events?apikey={os.getenv("EARNINGSCAST_API_KEY")}&exchange={self.params.exchange}&symbol={self.params.company}'
@@ -76,29 +92,27 @@ class CrewAIEarningsCallsStrategy(bt.Strategy):
             self.financial_analyst_agent, sec_data)
         self.earnings_call_task = self.sec_earnings_agents.analyze_earnings_calls(
             self.financial_analyst_agent, earnings_data)
+        self.decision_task = self.sec_earnings_agents.investment_decision(
+            self.financial_analyst_agent, [self.sec_filings_task, self.earnings_call_task])
 
         # Re-run CrewAI agents
         crew = Crew(
             agents=[self.financial_analyst_agent],
-            tasks=[self.sec_filings_task, self.earnings_call_task],
+            tasks=[self.sec_filings_task, self.earnings_call_task, self.decision_task],
             verbose=True
         )
         self.crew_output = crew.kickoff()
 
     def get_recommendation_from_crew_output(self):
-        # Simple keyword-based sentiment analysis
-        analysis_text = ''
-        for key in self.crew_output:
-            analysis_text += self.crew_output[key]
-
-        analysis_text = analysis_text.lower()
-
-        if 'buy' in analysis_text or 'strong growth' in analysis_text or 'positive outlook' in analysis_text:
-            return 'buy'
-        elif 'sell' in analysis_text or 'decline' in analysis_text or 'negative outlook' in analysis_text:
-            return 'sell'
-        else:
+        # The decision task answers with a TradeDecision; hold until there is a valid one
+        if not self.crew_output:
+            return 'hold'
+        try:
+            decision = parse_structured(self.crew_output, TradeDecision)
+        except ValueError as e:
+            print(f"Could not read the CrewAI decision: {e}")
             return 'hold'
+        return decision.action
 
     def next(self):
         current_date = self.datas[0].datetime.date(0)
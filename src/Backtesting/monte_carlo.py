@@ -0,0 +1,118 @@
+import numpy as np
+import pandas as pd
+from src.Backtesting.performance_metrics import (
+    TRADING_DAYS_PER_YEAR, cagr, equity_from_returns, max_drawdown, sharpe_ratio,
+)
+
+# Upper bound on the number of cells in a single (paths x days) block. Larger
+# path counts are processed in chunks so memory stays flat for long histories.
+MAX_CELLS_PER_CHUNK = 4_000_000
+
+
+class MonteCarloBootstrap:
+    def __init__(self, returns, n_paths=10000, method='block', block_size=20,
+                 periods_per_year=TRADING_DAYS_PER_YEAR, seed=None):
+        """
+        Initializes the MonteCarloBootstrap class.
+
+        Args:
+            returns (pd.Series | np.ndarray): Daily (per-period) strategy returns, e.g. 0.01 for +1%.
+            n_paths (int): The number of resampled paths to generate.
+            method (str): 'block' for a circular block bootstrap (keeps short-term autocorrelation),
+                or 'shuffle' to permute the observed returns (trade-order shuffle).
+            block_size (int): The block length used by the block bootstrap.
+            periods_per_year (int): The number of return periods in a year, used for annualization.
+            seed (int, optional): Seed for the random generator so results are reproducible.
+        """
+        returns = np.asarray(returns, dtype=np.float64).ravel()
+        returns = returns[np.isfinite(returns)]
+        if returns.size < 2:
+            raise ValueError("At least two returns are required for bootstrapping.")
+        if method not in ('block', 'shuffle'):
+            raise ValueError(f"Unsupported bootstrap method: {method}")
+        if n_paths < 1:
+            raise ValueError("n_paths must be a positive integer.")
+
+        self.returns = returns
+        self.n_paths = int(n_paths)
+        self.method = method
+        self.block_size = int(max(1, min(block_size, returns.size)))
+        self.periods_per_year = periods_per_year
+        self.rng = np.random.default_rng(seed)
+
+    def resample(self, n_paths=None) -> np.ndarray:
+        """
+        Generate resampled return paths.
+
+        Args:
+            n_paths (int, optional): Number of paths to generate. Defaults to self.n_paths.
+
+        Returns:
+            np.ndarray: A 2-D array of shape (n_paths, n_returns) with one resampled path per row.
+        """
+        n_paths = self.n_paths if n_paths is None else n_paths
+        n = self.returns.size
+
+        if self.method == 'shuffle':
+            # Shuffling keeps the same set of returns (and terminal wealth) but changes
+            # their order, which stresses path-dependent metrics such as drawdown.
+            paths = np.broadcast_to(self.returns, (n_paths, n))
+            return self.rng.permuted(paths, axis=1)
+
+        # Circular block bootstrap: draw random block starts and gather whole blocks
+        # from a strided view of the series, wrapped around its end.
+        n_blocks = -(-n // self.block_size)
+        wrapped = np.concatenate([self.returns, self.returns[:self.block_size - 1]])
+        blocks = np.lib.stride_tricks.sliding_window_view(wrapped, self.block_size)
+        starts = self.rng.integers(0, n, size=(n_paths, n_blocks))
+        return blocks[starts].reshape(n_paths, -1)[:, :n]
+
+    def path_metrics(self, paths: np.ndarray) -> dict:
+        """
+        Compute Sharpe ratio, CAGR and max drawdown for every row of a paths array.
+
+        Args:
+            paths (np.ndarray): A 2-D array of returns with one path per row.
+
+        Returns:
+            dict: Arrays of 'sharpe', 'cagr' and 'max_drawdown' with one value per path.
+        """
+        equity = np.concatenate([np.ones((paths.shape[0], 1)), equity_from_returns(paths, axis=1)], axis=1)
+        return {
+            'sharpe': sharpe_ratio(paths, periods_per_year=self.periods_per_year, axis=1),
+            'cagr': cagr(paths, periods_per_year=self.periods_per_year, axis=1),
+            'max_drawdown': max_drawdown(equity, axis=1),
+        }
+
+    def run(self, confidence=0.95) -> pd.DataFrame:
+        """
+        Resample the returns and summarize the distribution of each metric.
+
+        Args:
+            confidence (float): The two-sided confidence level for the intervals.
+
+        Returns:
+            pd.DataFrame: One row per metric with the observed value, the bootstrap mean
+            and the lower/upper bounds of the confidence interval.
+        """
+        chunk = max(1, MAX_CELLS_PER_CHUNK // self.returns.size)
+        collected = {'sharpe': [], 'cagr': [], 'max_drawdown': []}
+        remaining = self.n_paths
+        while remaining > 0:
+            size = min(chunk, remaining)
+            for name, values in self.path_metrics(self.resample(size)).items():
+                collected[name].append(values)
+            remaining -= size
+
+        observed = self.path_metrics(self.returns[None, :])
+        alpha = (1.0 - confidence) / 2.0
+        rows = {}
+        for name, values in collected.items():
+            values = np.concatenate(values)
+            rows[name] = {
+                'observed': observed[name][0],
+                'mean': np.nanmean(values),
+                'lower': np.nanquantile(values, alpha),
+                'upper': np.nanquantile(values, 1.0 - alpha),
+            }
+        return pd.DataFrame.from_dict(rows, orient='index')
@@ -0,0 +1,220 @@
+import numpy as np
+import pandas as pd
+
+TRADING_DAYS_PER_YEAR = 252
+
+METRIC_NAMES = [
+    'total_return', 'cagr', 'sharpe_ratio', 'sortino_ratio', 'max_drawdown',
+    'max_drawdown_duration', 'calmar_ratio', 'hit_rate', 'turnover', 'exposure',
+]
+
+# All functions below take time along axis 0 by default. A 1-D array is one strategy;
+# a 2-D array holds one strategy per column, so a whole parameter sweep is reduced at
+# once. The helpers accept axis=1 for row-per-path arrays such as bootstrap samples.
+# Annualization always uses the number of return periods / periods_per_year.
+
+
+def returns_from_equity(equity) -> np.ndarray:
+    """
+    Convert an equity curve (or matrix of curves) into period returns.
+    """
+    equity = np.asarray(equity, dtype=np.float64)
+    return equity[1:] / equity[:-1] - 1.0
+
+
+def equity_from_returns(returns, start=1.0, axis=0) -> np.ndarray:
+    """
+    Compound period returns into an equity curve that excludes the starting value.
+    """
+    return start * np.cumprod(1.0 + np.asarray(returns, dtype=np.float64), axis=axis)
+
+
+def sharpe_ratio(returns, risk_free_rate=0.0, periods_per_year=TRADING_DAYS_PER_YEAR, axis=0):
+    """
+    Annualized Sharpe ratio. risk_free_rate is an annual rate.
+    """
+    excess = np.asarray(returns, dtype=np.float64) - risk_free_rate / periods_per_year
+    std = excess.std(axis=axis, ddof=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(std > 0, excess.mean(axis=axis) / std * np.sqrt(periods_per_year), np.nan)
+
+
+def sortino_ratio(returns, risk_free_rate=0.0, periods_per_year=TRADING_DAYS_PER_YEAR, axis=0):
+    """
+    Annualized Sortino ratio using the downside deviation below the risk free rate.
+    """
+    excess = np.asarray(returns, dtype=np.float64) - risk_free_rate / periods_per_year
+    downside = np.sqrt((np.minimum(excess, 0.0) ** 2).mean(axis=axis))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(downside > 0, excess.mean(axis=axis) / downside * np.sqrt(periods_per_year), np.nan)
+
+
+def cagr(returns, periods_per_year=TRADING_DAYS_PER_YEAR, axis=0):
+    """
+    Compound annual growth rate.
+    """
+    returns = np.asarray(returns, dtype=np.float64)
+    growth = np.prod(1.0 + returns, axis=axis)
+    years = returns.shape[axis] / periods_per_year
+    with np.errstate(invalid='ignore'):
+        return np.where(growth > 0, growth ** (1.0 / years) - 1.0, -1.0)
+
+
+def drawdowns(equity, axis=0) -> np.ndarray:
+    """
+    Fractional drawdown from the running peak at every bar.
+    """
+    equity = np.asarray(equity, dtype=np.float64)
+    return 1.0 - equity / np.maximum.accumulate(equity, axis=axis)
+
+
+def max_drawdown(equity, axis=0):
+    """
+    Largest peak-to-trough loss as a fraction of the peak.
+    """
+    return drawdowns(equity, axis=axis).max(axis=axis)
+
+
+def max_drawdown_duration(equity):
+    """
+    Longest number of bars spent below a previous peak.
+    """
+    equity = np.asarray(equity, dtype=np.float64)
+    bars = np.arange(equity.shape[0]).reshape((-1,) + (1,) * (equity.ndim - 1))
+    at_peak = equity >= np.maximum.accumulate(equity, axis=0)
+    last_peak = np.maximum.accumulate(np.where(at_peak, bars, 0), axis=0)
+    return (bars - last_peak).max(axis=0)
+
+
+def compute_metrics(returns=None, equity=None, positions=None, risk_free_rate=0.0,
+                    periods_per_year=TRADING_DAYS_PER_YEAR, names=None):
+    """
+    Compute the standard backtest metrics for one strategy or many at once.
+
+    Args:
+        returns (array-like, optional): Period returns, time along axis 0.
+        equity (array-like, optional): Equity curve(s), used when returns are not given.
+        positions (array-like, optional): Fraction of equity invested at each bar, aligned with
+            returns. Enables turnover and exposure; without it exposure is the share of
+            bars with a non-zero return and turnover is NaN.
+        risk_free_rate (float): Annual risk free rate for Sharpe and Sortino.
+        periods_per_year (int): Return periods per year, used for all annualization.
+        names (list, optional): Strategy names for 2-D input. Taken from DataFrame columns if omitted.
+
+    Returns:
+        dict | pd.DataFrame: A dict of floats for a single strategy, or a DataFrame with one
+        row per strategy and one column per metric. Returns and drawdowns are fractions.
+    """
+    if returns is None and equity is None:
+        raise ValueError("Either returns or equity must be provided.")
+    if names is None:
+        source = returns if returns is not None else equity
+        if isinstance(source, pd.DataFrame):
+            names = list(source.columns)
+
+    if returns is None:
+        returns = returns_from_equity(equity)
+    returns = np.nan_to_num(np.asarray(returns, dtype=np.float64))
+    if returns.shape[0] < 2:
+        raise ValueError("At least two return periods are required.")
+
+    # Curve starts at 1.0 so a loss on the very first bar counts as a drawdown
+    start = np.ones((1,) + returns.shape[1:])
+    curve = np.concatenate([start, equity_from_returns(returns)], axis=0)
+    years = returns.shape[0] / periods_per_year
+
+    growth_rate = cagr(returns, periods_per_year)
+    worst = max_drawdown(curve)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        calmar = np.where(worst > 0, growth_rate / worst, np.nan)
+        active = np.count_nonzero(returns, axis=0)
+        hit_rate = np.where(active > 0, (returns > 0).sum(axis=0) / active, np.nan)
+
+    if positions is not None:
+        positions = np.nan_to_num(np.asarray(positions, dtype=np.float64))
+        turnover = np.abs(np.diff(positions, axis=0, prepend=0.0)).sum(axis=0) / years
+        exposure = (positions != 0).mean(axis=0)
+    else:
+        turnover = np.full(returns.shape[1:], np.nan)
+        exposure = (returns != 0).mean(axis=0)
+
+    metrics = {
+        'total_return': curve[-1] - 1.0,
+        'cagr': growth_rate,
+        'sharpe_ratio': sharpe_ratio(returns, risk_free_rate, periods_per_year),
+        'sortino_ratio': sortino_ratio(returns, risk_free_rate, periods_per_year),
+        'max_drawdown': worst,
+        'max_drawdown_duration': max_drawdown_duration(curve),
+        'calmar_ratio': calmar,
+        'hit_rate': hit_rate,
+        'turnover': turnover,
+        'exposure': exposure,
+    }
+
+    if returns.ndim == 1:
+        return {name: float(value) for name, value in metrics.items()}
+    return pd.DataFrame(metrics, index=names, columns=METRIC_NAMES)
+
+
+def add_metric_analyzers(cerebro):
+    """
+    Attach the analyzers metrics_from_strategy() needs to a backtrader Cerebro.
+    """
+    import backtrader as bt
+
+    cerebro.addanalyzer(bt.analyzers.TimeReturn, timeframe=bt.TimeFrame.Days, _name='dailyreturn')
+    cerebro.addanalyzer(bt.analyzers.PositionsValue, cash=True, _name='positionsvalue')
+    cerebro.addanalyzer(bt.analyzers.Transactions, _name='transactions')
+
+
+def metrics_from_strategy(strat, risk_free_rate=0.0):
+    """
+    Compute metrics for a finished backtrader strategy run with add_metric_analyzers().
+
+    Returns:
+        tuple: (metrics dict, daily returns as pd.Series)
+    """
+    daily_returns = pd.Series(strat.analyzers.dailyreturn.get_analysis(), dtype=float)
+
+    # PositionsValue rows are [value of each data feed..., cash]
+    values = pd.DataFrame.from_dict(strat.analyzers.positionsvalue.get_analysis(), orient='index')
+    invested = values.iloc[:, :-1].abs().sum(axis=1)
+    positions = (invested / (invested + values.iloc[:, -1])).reindex(daily_returns.index).fillna(0.0)
+
+    metrics = compute_metrics(daily_returns.values, positions=positions.values, risk_free_rate=risk_free_rate)
+    return metrics, daily_returns
+
+
+def trades_from_strategy(strat) -> list:
+    """
+    Executed transactions of a strategy run with add_metric_analyzers() as plain records.
+    """
+    trades = []
+    for date, transactions in strat.analyzers.transactions.get_analysis().items():
+        for amount, price, _, symbol, value in transactions:
+            trades.append({
+                'date': date.isoformat(),
+                'symbol': symbol,
+                'size': amount,
+                'price': price,
+                'value': value,
+            })
+    return trades
+
+
+def print_metrics(strategy_name, metrics):
+    """
+    Print a metrics dict in the format the backtests use.
+    """
+    print(f'\n{strategy_name} Performance Metrics:')
+    print('----------------------------------------')
+    print(f"Sharpe Ratio: {metrics['sharpe_ratio']:.2f}")
+    print(f"Sortino Ratio: {metrics['sortino_ratio']:.2f}")
+    print(f"Total Return: {metrics['total_return'] * 100:.2f}%")
+    print(f"Annual Return (CAGR): {metrics['cagr'] * 100:.2f}%")
+    print(f"Max Drawdown: {metrics['max_drawdown'] * 100:.2f}%")
+    print(f"Max Drawdown Duration: {metrics['max_drawdown_duration']:.0f} bars")
+    print(f"Calmar Ratio: {metrics['calmar_ratio']:.2f}")
+    print(f"Hit Rate: {metrics['hit_rate'] * 100:.2f}%")
+    print(f"Annual Turnover: {metrics['turnover']:.2f}")
+    print(f"Exposure: {metrics['exposure'] * 100:.2f}%")
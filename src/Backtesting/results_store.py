@@ -0,0 +1,340 @@
+import hashlib
+import json
+import logging
+import math
+import sqlite3
+import zlib
+from datetime import datetime
+import numpy as np
+import pandas as pd
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    config_hash TEXT NOT NULL,
+    data_fingerprint TEXT NOT NULL,
+    strategy_name TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    config_json TEXT NOT NULL,
+    summary_json TEXT NOT NULL,
+    equity_index BLOB,
+    equity_values BLOB,
+    trades_json TEXT,
+    UNIQUE (config_hash, data_fingerprint)
+);
+CREATE TABLE IF NOT EXISTS metrics (
+    run_id INTEGER NOT NULL REFERENCES runs(run_id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    value REAL,
+    PRIMARY KEY (run_id, name)
+);
+CREATE INDEX IF NOT EXISTS idx_metrics_name_run ON metrics (name, run_id);
+CREATE INDEX IF NOT EXISTS idx_metrics_name_value ON metrics (name, value);
+CREATE INDEX IF NOT EXISTS idx_runs_strategy ON runs (strategy_name, run_id);
+"""
+
+
+def config_hash(config: dict) -> str:
+    """
+    Stable hash of a backtest configuration (key order does not matter).
+    """
+    payload = json.dumps(config, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def data_fingerprint(data_df: pd.DataFrame) -> str:
+    """
+    Hash of the price data a backtest ran on, including its index and column names.
+    Take it before the run: some strategies add indicator columns to the frame they are given.
+    """
+    hasher = hashlib.sha256()
+    hasher.update(json.dumps([str(col) for col in data_df.columns]).encode('utf-8'))
+    hasher.update(pd.util.hash_pandas_object(data_df, index=True).values.tobytes())
+    return hasher.hexdigest()
+
+
+def _to_float(value):
+    """
+    Convert a metric to a float for the metrics table, or None if it is not numeric.
+    """
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return None
+    return None if math.isnan(value) else value
+
+
+class BacktestResultsStore:
+    def __init__(self, db_path: str = "./backtest_results.db"):
+        """
+        Initializes the BacktestResultsStore class.
+
+        Args:
+            db_path (str): Path of the SQLite database file. Use ':memory:' for a throwaway store.
+        """
+        self.db_path = db_path
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def load(self, config: dict, fingerprint: str):
+        """
+        Look up a previous run with the same configuration and data.
+
+        Args:
+            config (dict): Everything that determines the result (strategy, parameters, cash, ...).
+            fingerprint (str): data_fingerprint() of the price data, taken before the run.
+
+        Returns:
+            dict | None: The stored run (see get_run) or None if this run is new.
+        """
+        row = self.conn.execute(
+            "SELECT run_id FROM runs WHERE config_hash = ? AND data_fingerprint = ?",
+            (config_hash(config), fingerprint),
+        ).fetchone()
+        if row is None:
+            return None
+        self.logger.info(f"Results store hit for run {row[0]}")
+        return self.get_run(row[0])
+
+    def save(self, config: dict, fingerprint: str, strategy_name: str, summary: dict,
+             equity: pd.Series = None, trades: list = None) -> int:
+        """
+        Store a finished run. A run with the same configuration and data replaces the old one.
+
+        Args:
+            config (dict): Everything that determines the result (strategy, parameters, cash, ...).
+            fingerprint (str): data_fingerprint() of the price data, taken before the run.
+            strategy_name (str): Display name of the strategy.
+            summary (dict): The metrics returned by the backtest. Numeric values are indexed.
+            equity (pd.Series, optional): Equity curve with a DatetimeIndex.
+            trades (list, optional): JSON-serializable trade records.
+
+        Returns:
+            int: The run id.
+        """
+        equity_index = equity_values = None
+        if equity is not None:
+            equity_index = zlib.compress(pd.DatetimeIndex(equity.index).as_unit('ns').asi8.tobytes())
+            equity_values = zlib.compress(np.asarray(equity.values, dtype=np.float64).tobytes())
+
+        with self.conn:
+            cursor = self.conn.execute(
+                "INSERT OR REPLACE INTO runs (config_hash, data_fingerprint, strategy_name, created_at, "
+                "config_json, summary_json, equity_index, equity_values, trades_json) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    config_hash(config),
+                    fingerprint,
+                    strategy_name,
+                    datetime.now().isoformat(),
+                    json.dumps(config, sort_keys=True, default=str),
+                    json.dumps(summary, default=str),
+                    equity_index,
+                    equity_values,
+                    json.dumps(trades, default=str) if trades is not None else None,
+                ),
+            )
+            run_id = cursor.lastrowid
+            self.conn.executemany(
+                "INSERT INTO metrics (run_id, name, value) VALUES (?, ?, ?)",
+                [(run_id, name, _to_float(value)) for name, value in summary.items()
+                 if _to_float(value) is not None],
+            )
+        return run_id
+
+    def get_run(self, run_id: int) -> dict:
+        """
+        Load a stored run with its summary, equity curve and trades.
+        """
+        row = self.conn.execute(
+            "SELECT run_id, strategy_name, created_at, config_json, summary_json, "
+            "equity_index, equity_values, trades_json FROM runs WHERE run_id = ?",
+            (run_id,),
+        ).fetchone()
+        if row is None:
+            raise KeyError(f"No stored run with id {run_id}")
+
+        equity = None
+        if row[5] is not None:
+            index = pd.DatetimeIndex(np.frombuffer(zlib.decompress(row[5]), dtype='datetime64[ns]'))
+            values = np.frombuffer(zlib.decompress(row[6]), dtype=np.float64)
+            equity = pd.Series(values, index=index, name='equity')
+
+        return {
+            'run_id': row[0],
+            'strategy_name': row[1],
+            'created_at': row[2],
+            'config': json.loads(row[3]),
+            'summary': json.loads(row[4]),
+            'equity': equity,
+            'trades': json.loads(row[7]) if row[7] is not None else None,
+        }
+
+    def get_or_run(self, config: dict, data_df: pd.DataFrame, run_fn):
+        """
+        Serve a run from the store, or execute run_fn() and store its result.
+
+        Args:
+            run_fn (callable): Returns a dict with 'strategy_name', 'summary' and optionally
+                'equity' and 'trades'.
+
+        Returns:
+            dict: The stored run.
+        """
+        fingerprint = data_fingerprint(data_df)
+        cached = self.load(config, fingerprint)
+        if cached is not None:
+            return cached
+        result = run_fn()
+        run_id = self.save(config, fingerprint, result['strategy_name'], result['summary'],
+                           equity=result.get('equity'), trades=result.get('trades'))
+        return self.get_run(run_id)
+
+    def best(self, metric: str = 'sharpe_ratio', last_n: int = 500, top: int = 1,
+             ascending: bool = False) -> pd.DataFrame:
+        """
+        Best runs by a metric among the most recent last_n runs that recorded it.
+
+        Returns:
+            pd.DataFrame: run_id, strategy_name, created_at and the metric value.
+        """
+        order = 'ASC' if ascending else 'DESC'
+        query = f"""
+            SELECT r.run_id, r.strategy_name, r.created_at, m.value
+            FROM (SELECT run_id, value FROM metrics WHERE name = ?
+                  ORDER BY run_id DESC LIMIT ?) AS m
+            JOIN runs r ON r.run_id = m.run_id
+            ORDER BY m.value {order}
+            LIMIT ?
+        """
+        # The metric name is only ever bound as a parameter; the column is renamed afterwards
+        best = pd.read_sql_query(query, self.conn, params=(metric, last_n, top))
+        return best.rename(columns={'value': metric})
+
+    def history(self, strategy_name: str = None, limit: int = 100) -> pd.DataFrame:
+        """
+        Recent runs with all of their numeric metrics as columns.
+        """
+        where = "WHERE r.strategy_name = ?" if strategy_name else ""
+        params = (strategy_name, limit) if strategy_name else (limit,)
+        query = f"""
+            SELECT r.run_id, r.strategy_name, r.created_at, m.name, m.value
+            FROM (SELECT * FROM runs r {where} ORDER BY r.run_id DESC LIMIT ?) AS r
+            LEFT JOIN metrics m ON m.run_id = r.run_id
+        """
+        rows = pd.read_sql_query(query, self.conn, params=params)
+        if rows.empty:
+            return rows
+        table = rows.pivot_table(index=['run_id', 'strategy_name', 'created_at'],
+                                 columns='name', values='value', dropna=False)
+        return table.reset_index().sort_values('run_id', ascending=False)
+
+
+OHLCV_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+
+def strategy_config(strategy_class, **params) -> dict:
+    """
+    The part of a backtest configuration that identifies a backtrader strategy: its name, its
+    parameters and a hash of its source, so a run is repeated once either changes.
+
+    Args:
+        strategy_class: The backtrader strategy class.
+        **params: Parameters passed to addstrategy; they override the class defaults. Data
+            frames are left out, the data fingerprint covers them.
+
+    Returns:
+        dict: 'strategy', 'params' and 'source_hash' entries for run_and_store's config.
+    """
+    import inspect
+    values = dict(strategy_class.params._getitems())
+    values.update(params)
+    try:
+        source = inspect.getsource(strategy_class)
+    except (OSError, TypeError):
+        # Classes defined interactively have no source file
+        source = strategy_class.__qualname__
+    return {
+        'strategy': strategy_class.__name__,
+        'params': {name: value for name, value in values.items() if not isinstance(value, pd.DataFrame)},
+        'source_hash': hashlib.sha256(source.encode('utf-8')).hexdigest()[:16],
+    }
+
+
+def run_and_store(cerebro_builder, strategy_name: str, data_df: pd.DataFrame, config: dict,
+                  store: BacktestResultsStore = None) -> dict:
+    """
+    Run a backtrader strategy, print its metrics and bootstrap intervals, and return its summary.
+    A run with the same config on the same data is served from the store instead.
+
+    Args:
+        cerebro_builder (callable): Called with a Cerebro whose broker holds config['cash'] and
+            config['commission']; adds the data feed and the strategy.
+        strategy_name (str): Name shown in the output and stored with the run.
+        data_df (pd.DataFrame): OHLCV data the strategy runs on.
+        config (dict): Everything that determines the result besides the data, including the
+            strategy_config of the strategy; must hold 'cash' and 'commission'.
+        store (BacktestResultsStore, optional): Store to serve and save runs.
+
+    Returns:
+        dict: strategy_name and the summary metrics, percentages scaled to 0-100.
+    """
+    import backtrader as bt
+    from src.Backtesting.monte_carlo import MonteCarloBootstrap
+    from src.Backtesting.performance_metrics import (
+        add_metric_analyzers, metrics_from_strategy, print_metrics, trades_from_strategy,
+    )
+
+    # Only the OHLCV columns feed backtrader; strategies may add indicator columns in place
+    fingerprint = data_fingerprint(data_df[OHLCV_COLUMNS])
+    if store is not None:
+        cached = store.load(config, fingerprint)
+        if cached is not None:
+            print(f'\n{strategy_name} served from the results store (run {cached["run_id"]})')
+            return cached['summary']
+
+    cerebro = bt.Cerebro()
+    cerebro.broker.setcash(config['cash'])
+    cerebro.broker.setcommission(commission=config['commission'])
+    cerebro_builder(cerebro)
+    add_metric_analyzers(cerebro)
+
+    print(f'\nRunning {strategy_name}...')
+    print(f'Starting Portfolio Value: {cerebro.broker.getvalue():.2f}')
+    strat = cerebro.run()[0]
+    print(f'Final Portfolio Value: {cerebro.broker.getvalue():.2f}')
+
+    metrics, daily_returns = metrics_from_strategy(strat)
+    print_metrics(strategy_name, metrics)
+
+    # Bootstrap the daily returns to see how much of the result is luck
+    if len(daily_returns) > 1:
+        bootstrap = MonteCarloBootstrap(daily_returns).run()
+        print(f'\n{strategy_name} Bootstrap 95% Confidence Intervals:')
+        print(bootstrap.to_string(float_format=lambda v: f'{v:.4f}'))
+
+    summary = {
+        'strategy_name': strategy_name,
+        'sharpe_ratio': metrics['sharpe_ratio'],
+        'sortino_ratio': metrics['sortino_ratio'],
+        'total_return': metrics['total_return'] * 100,
+        'annual_return': metrics['cagr'] * 100,
+        'max_drawdown': metrics['max_drawdown'] * 100,
+        'max_drawdown_duration': metrics['max_drawdown_duration'],
+        'calmar_ratio': metrics['calmar_ratio'],
+        'hit_rate': metrics['hit_rate'] * 100,
+        'turnover': metrics['turnover'],
+        'exposure': metrics['exposure'] * 100,
+    }
+
+    if store is not None:
+        store.save(config, fingerprint, strategy_name, summary,
+                   equity=config['cash'] * (1.0 + daily_returns).cumprod(),
+                   trades=trades_from_strategy(strat))
+    return summary
@@ -0,0 +1,55 @@
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+import requests
+from src.Helpers.article_scraper import ArticleScraper
+from src.Helpers.web_cache import WebCache
+
+
+def page(html='<html></html>', status_code=200, headers=None):
+    return MagicMock(text=html, status_code=status_code, headers=headers or {})
+
+
+def slow_download(url, headers=None):
+    time.sleep(2.0 if 'slow' in url else 0.2)
+    if 'broken' in url:
+        raise requests.exceptions.ConnectionError('connection refused')
+    return page(f'<html>{url}</html>')
+
+
+class TestArticleScraper(unittest.TestCase):
+    def setUp(self):
+        self.scraper = ArticleScraper(max_workers=4, timeout=0.5, grace=0.1, cache=WebCache(':memory:'))
+        self.extract = patch.object(self.scraper, 'extract', side_effect=lambda html, url: f'text of {url}').start()
+        patch.object(self.scraper, 'download', side_effect=slow_download).start()
+
+    def tearDown(self):
+        patch.stopall()
+        self.scraper.close()
+
+    def test_articles_download_concurrently(self):
+        urls = [f'https://news.example.com/{i}' for i in range(4)]
+        start = time.perf_counter()
+        texts = self.scraper.scrape_many(urls)
+        self.assertLess(time.perf_counter() - start, 0.5)
+        self.assertEqual(texts, [f'text of {url}' for url in urls])
+
+    def test_slow_and_failed_articles_return_partial_results(self):
+        urls = ['https://news.example.com/ok', 'https://slow.example.com/a', 'https://broken.example.com/b']
+        start = time.perf_counter()
+        texts = self.scraper.scrape_many(urls)
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertEqual(texts[0], 'text of https://news.example.com/ok')
+        self.assertTrue(texts[1].startswith('Error: Timed out'))
+        self.assertTrue(texts[2].startswith('Error: Failed to scrape the article'))
+        self.assertEqual(self.scraper.scrape_many([]), [])
+
+    def test_shared_session_is_pooled(self):
+        scraper = ArticleScraper(max_workers=6, cache=WebCache(':memory:'))
+        adapter = scraper.session.get_adapter('https://news.example.com')
+        self.assertEqual(adapter._pool_maxsize, 6)
+        scraper.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
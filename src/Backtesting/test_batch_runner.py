@@ -0,0 +1,72 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from src.Helpers.rate_limiter import RateLimiter
+from src.UI.batch_runner import BatchCrewRunner, read_tickers
+
+
+class FakeOutput:
+    def __init__(self, raw):
+        self.raw = raw
+
+
+class FakeCrew:
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def __init__(self, ticker):
+        self.ticker = ticker
+
+    def run(self):
+        with FakeCrew.lock:
+            FakeCrew.running += 1
+            FakeCrew.peak = max(FakeCrew.peak, FakeCrew.running)
+        time.sleep(0.1)
+        with FakeCrew.lock:
+            FakeCrew.running -= 1
+        if self.ticker == 'BAD':
+            raise RuntimeError('no data')
+        return FakeOutput(f'{self.ticker}: buy')
+
+
+class TestBatchCrewRunner(unittest.TestCase):
+    def setUp(self):
+        FakeCrew.peak = 0
+        self.results_path = os.path.join(tempfile.mkdtemp(), 'results.jsonl')
+
+    def test_runs_tickers_concurrently_and_records_failures(self):
+        runner = BatchCrewRunner(FakeCrew, workers=4, results_path=self.results_path)
+        start = time.perf_counter()
+        records = runner.run(['aapl', 'MSFT', 'NVDA', 'BAD', 'AAPL'])
+        self.assertLess(time.perf_counter() - start, 0.35)
+        self.assertEqual(FakeCrew.peak, 4)
+        by_ticker = {record['ticker']: record for record in records}
+        self.assertEqual(sorted(by_ticker), ['AAPL', 'BAD', 'MSFT', 'NVDA'])
+        self.assertEqual(by_ticker['AAPL']['result']['raw'], 'AAPL: buy')
+        self.assertEqual(by_ticker['BAD']['status'], 'error')
+
+    def test_resume_skips_completed_tickers(self):
+        BatchCrewRunner(FakeCrew, results_path=self.results_path).run(['AAPL', 'BAD'])
+        records = BatchCrewRunner(FakeCrew, results_path=self.results_path).run(['AAPL', 'BAD', 'MSFT'])
+        self.assertEqual(sorted(record['ticker'] for record in records), ['BAD', 'MSFT'])
+
+    def test_rate_limiter_spaces_requests(self):
+        limiter = RateLimiter(requests_per_minute=600)
+        start = time.perf_counter()
+        for _ in range(4):
+            limiter.acquire()
+        # First request is immediate, the next three wait 0.1s each
+        self.assertGreaterEqual(time.perf_counter() - start, 0.28)
+
+    def test_read_tickers(self):
+        path = os.path.join(tempfile.mkdtemp(), 'watchlist.txt')
+        with open(path, 'w') as f:
+            f.write("AAPL, MSFT\n# semis\nNVDA  # comment\n\n")
+        self.assertEqual(read_tickers(path), ['AAPL', 'MSFT', 'NVDA'])
+
+
+if __name__ == '__main__':
+    unittest.main()
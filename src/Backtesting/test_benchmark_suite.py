@@ -0,0 +1,53 @@
+import unittest
+import numpy as np
+from src.Benchmarks.benchmark_suite import BENCHMARKS, check_import_budgets, compare, run_benchmarks
+from src.Benchmarks.synthetic_data import make_close_matrix, make_ohlcv
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+    def test_synthetic_ohlcv_is_consistent_and_reproducible(self):
+        data = make_ohlcv(1_000, seed=3)
+        self.assertTrue((data['High'] >= data[['Open', 'Close']].max(axis=1)).all())
+        self.assertTrue((data['Low'] <= data[['Open', 'Close']].min(axis=1)).all())
+        np.testing.assert_array_equal(data.values, make_ohlcv(1_000, seed=3).values)
+
+    def test_large_series_use_minute_bars(self):
+        prices = make_close_matrix(60_000, 2)
+        self.assertTrue(prices.index.is_monotonic_increasing)
+        self.assertEqual(prices.shape, (60_000, 2))
+
+    def test_run_produces_entry_per_benchmark(self):
+        report = run_benchmarks(1_000, 5, repeat=1, name_filter='cache.')
+        names = [entry['name'] for entry in report['results']]
+        self.assertEqual(names, [spec['name'] for spec in BENCHMARKS if 'cache.' in spec['name']])
+        for entry in report['results']:
+            self.assertEqual(entry['status'], 'ok')
+            self.assertGreater(entry['median_s'], 0)
+        self.assertEqual(report['meta']['bars'], 1_000)
+
+    def test_caps_are_recorded(self):
+        report = run_benchmarks(10_000, 5, repeat=1, name_filter='monte_carlo')
+        self.assertEqual(report['results'][0]['bars'], 5_040)
+
+    def test_compare_flags_regressions(self):
+        entry = {'name': 'x', 'bars': 1_000, 'symbols': 1, 'status': 'ok', 'median_s': 1.0}
+        baseline = {'results': [entry]}
+        slower = {'results': [dict(entry, median_s=1.5)]}
+        self.assertEqual(compare(slower, baseline, tolerance=0.25)[0]['name'], 'x')
+        self.assertEqual(compare(slower, baseline, tolerance=0.6), [])
+
+    def test_import_budgets(self):
+        budgets = {
+            'src.globals': (5.0, ('crewai', 'litellm')),
+            'src.Indicators.bollinger': (0.0, ()),
+            'src.no_such_module': (1.0, ()),
+        }
+        entries = {entry['name']: entry for entry in check_import_budgets(budgets, repeat=1)}
+        self.assertEqual(entries['import.src.globals']['status'], 'ok')
+        self.assertEqual(entries['import.src.globals']['loaded'], [])
+        self.assertEqual(entries['import.src.Indicators.bollinger']['status'], 'over_budget')
+        self.assertEqual(entries['import.src.no_such_module']['status'], 'skipped')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+from src.Helpers.browser_pool import BrowserPool, fetch_page, needs_javascript
+
+ARTICLE = '<html><body><article>' + '<p>Quarterly revenue grew strongly.</p>' * 40 + '</article></body></html>'
+APP_SHELL = '<html><body><div id="root"></div><noscript>Please enable JavaScript</noscript><script>app()</script></body></html>'
+
+
+class FakeDriver:
+    def __init__(self, states=('loading', 'interactive', 'complete')):
+        self.states = list(states)
+        self.alive = True
+        self.pages = []
+
+    def set_page_load_timeout(self, seconds):
+        pass
+
+    def get(self, url):
+        self.pages.append(url)
+
+    def execute_script(self, script):
+        if not self.alive:
+            raise ConnectionError('browser crashed')
+        return self.states.pop(0) if len(self.states) > 1 else self.states[0]
+
+    @property
+    def page_source(self):
+        return f'<html>{self.pages[-1]}</html>'
+
+    def quit(self):
+        self.alive = False
+
+
+class TestBrowserPool(unittest.TestCase):
+    def test_drivers_are_reused_and_recycled(self):
+        pool = BrowserPool(size=1, max_pages=3, driver_factory=FakeDriver)
+        for i in range(5):
+            self.assertEqual(pool.render(f'https://example.com/{i}'), f'<html>https://example.com/{i}</html>')
+        self.assertEqual(pool.stats(), {'created': 2, 'recycled': 1, 'idle': 1})
+        pool.close()
+
+    def test_unhealthy_driver_is_replaced(self):
+        pool = BrowserPool(size=2, driver_factory=FakeDriver)
+        pool.render('https://example.com/a')
+        with pool.driver() as driver:
+            driver.alive = False
+        pool.render('https://example.com/b')
+        self.assertEqual(pool.created, 2)
+
+    def test_pool_bounds_open_browsers(self):
+        drivers = []
+        pool = BrowserPool(size=2, driver_factory=lambda: drivers.append(FakeDriver()) or drivers[-1])
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            list(executor.map(pool.render, [f'https://example.com/{i}' for i in range(12)]))
+        self.assertLessEqual(len(drivers), 2)
+        self.assertEqual(sum(len(driver.pages) for driver in drivers), 12)
+
+    def test_static_pages_skip_the_browser(self):
+        self.assertFalse(needs_javascript(ARTICLE))
+        self.assertTrue(needs_javascript(APP_SHELL))
+
+        pool = MagicMock()
+        session = MagicMock()
+        session.get.return_value = MagicMock(text=ARTICLE, headers={'Content-Type': 'text/html'})
+        self.assertEqual(fetch_page('https://example.com/news', pool=pool, session=session), ARTICLE)
+        pool.render.assert_not_called()
+
+        session.get.return_value = MagicMock(text=APP_SHELL, headers={'Content-Type': 'text/html'})
+        pool.render.return_value = ARTICLE
+        self.assertEqual(fetch_page('https://example.com/app', pool=pool, session=session), ARTICLE)
+        pool.render.assert_called_once_with('https://example.com/app')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,7 +2,7 @@ import unittest
 from unittest.mock import patch, MagicMock
 import pandas as pd
 from src.Indicators.bollinger import BollingerBands
-from src.Agents.Bollinger_agent.bollinger_agent import BollingerAnalysisAgents
+# The agent module imports crewai, which takes seconds; only the agent tests load it
 
 # Unit Test Cases
 
@@ -30,12 +30,14 @@ class TestBollingerBands(unittest.TestCase):
             bollinger.calculate_bands()
 
     def test_bollinger_agent_initialization(self):
+        from src.Agents.Bollinger_agent.bollinger_agent import BollingerAnalysisAgents
         # Test for agent initialization
         agent = BollingerAnalysisAgents().bollinger_bands_investment_advisor()
         self.assertEqual(agent.role, 'Bollinger Bands Investment Advisor')
 
-    @patch('src.Agents.Bollinger_agent.bollinger_agent.ChatOpenAI')
+    @patch('src.Agents.Bollinger_agent.bollinger_agent.get_llm')
     def test_bollinger_analysis_method(self, mock_openai):
+        from src.Agents.Bollinger_agent.bollinger_agent import BollingerAnalysisAgents
         # Test for agent analysis method
         mock_openai.return_value = MagicMock()
         agent = BollingerAnalysisAgents().bollinger_bands_investment_advisor()
@@ -50,6 +52,7 @@ class TestBollingerBands(unittest.TestCase):
 
     @patch('src.Agents.Bollinger_agent.bollinger_agent.BollingerAnalysisAgents.bollinger_bands_investment_advisor')
     def test_api_interaction_error_handling(self, mock_agent):
+        from src.Agents.Bollinger_agent.bollinger_agent import BollingerAnalysisAgents
         # Test case for API interaction error handling
         mock_agent.side_effect = Exception("API Error")
         with self.assertRaises(Exception):
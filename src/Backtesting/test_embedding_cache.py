@@ -0,0 +1,66 @@
+import tempfile
+import unittest
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from src.Helpers.embedding_cache import CachedEmbeddings, EmbeddingCache
+
+
+class RecordingEmbeddings(DeterministicFakeEmbedding):
+    batches: list = []
+
+    def embed_documents(self, texts):
+        self.batches.append(list(texts))
+        return super().embed_documents(texts)
+
+
+class TestEmbeddingCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.client = RecordingEmbeddings(size=8, batches=[])
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def embedder(self, batch_size=3):
+        return CachedEmbeddings(self.client, cache=EmbeddingCache(self.directory.name), batch_size=batch_size)
+
+    def test_uncached_texts_are_batched_without_duplicates(self):
+        texts = [f'chunk {i}' for i in range(7)] + ['chunk 0', 'chunk 1']
+        vectors = self.embedder().embed_documents(texts)
+        self.assertEqual([len(batch) for batch in self.client.batches], [3, 3, 1])
+        self.assertEqual(vectors[7], vectors[0])
+        self.assertEqual(len(vectors), 9)
+
+    def test_cached_vectors_match_and_are_not_requested_again(self):
+        boilerplate = ['Risk factors apply.', 'Forward-looking statements.']
+        expected = self.client.embed_documents(boilerplate + ['Revenue grew.'])
+        self.client.batches.clear()
+
+        embedder = self.embedder()
+        embedder.embed_documents(boilerplate + ['Revenue grew.'])
+        # Another filing, read in a new process, shares the boilerplate
+        embedder = self.embedder()
+        vectors = embedder.embed_documents(boilerplate + ['Margins fell.'])
+        self.assertEqual(self.client.batches[-1], ['Margins fell.'])
+        for vector, reference in zip(vectors[:2], expected[:2]):
+            self.assertEqual(len(vector), 8)
+            for value, reference_value in zip(vector, reference):
+                self.assertAlmostEqual(value, reference_value, places=6)
+        self.assertEqual(embedder.cache.stats()['hits'], 2)
+
+    def test_queries_are_cached_separately(self):
+        embedder = self.embedder()
+        embedder.embed_documents(['What is the revenue?'])
+        embedder.embed_query('What is the revenue?')
+        embedder.embed_query('What is the revenue?')
+        self.assertEqual(embedder.requests, 2)
+        self.assertEqual(embedder.cache.stats()['entries'], 2)
+
+    def test_dimension_mismatch_is_rejected(self):
+        cache = EmbeddingCache(self.directory.name)
+        cache.set_many('model', {'a': [0.0, 1.0]})
+        with self.assertRaises(ValueError):
+            cache.set_many('model', {'b': [0.0, 1.0, 2.0]})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+import os
+import tempfile
+import unittest
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from langchain_core.vectorstores import InMemoryVectorStore
+from src.Helpers.filing_index import NO_MATCH, FilingIndexStore, filing_key
+
+FILING_URL = 'https://www.sec.gov/Archives/edgar/data/320193/000032019323000106/aapl-20230930.htm'
+FILING_TEXT = '\n'.join(
+    [f'Item {i}. Revenue from segment {i} grew {i} percent year over year.' for i in range(200)]
+    + ['Risk factors: supply chain disruptions in Asia could delay shipments.']
+)
+
+
+class CountingEmbeddings(DeterministicFakeEmbedding):
+    documents_embedded: int = 0
+    queries_embedded: int = 0
+
+    def embed_documents(self, texts):
+        self.documents_embedded += len(texts)
+        return super().embed_documents(texts)
+
+    def embed_query(self, text):
+        self.queries_embedded += 1
+        return super().embed_query(text)
+
+
+class LocalVectorStore(InMemoryVectorStore):
+    """InMemoryVectorStore with FAISS's save_local / load_local interface."""
+
+    def save_local(self, path):
+        self.dump(os.path.join(path, 'index.json'))
+
+    @classmethod
+    def load_local(cls, path, embeddings, **kwargs):
+        return cls.load(os.path.join(path, 'index.json'), embeddings)
+
+
+class TestFilingIndexStore(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.embeddings = CountingEmbeddings(size=16)
+        self.downloads = []
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def store(self):
+        return FilingIndexStore(self.directory.name, embeddings=self.embeddings, vectorstore_cls=LocalVectorStore)
+
+    def download(self, url):
+        self.downloads.append(url)
+        return FILING_TEXT
+
+    def test_filing_key_is_the_accession_number(self):
+        self.assertEqual(filing_key(FILING_URL), '0000320193-23-000106')
+        self.assertEqual(filing_key('https://www.sec.gov/ix?doc=0000320193-23-000106.txt'), '0000320193-23-000106')
+        self.assertTrue(filing_key('https://example.com/filing.htm').startswith('url-'))
+
+    def test_later_questions_only_embed_the_query(self):
+        store = self.store()
+        answer = store.search(FILING_URL, 'How much did revenue grow?', self.download)
+        self.assertIn('Revenue from segment', answer)
+        documents_embedded = self.embeddings.documents_embedded
+        self.assertGreater(documents_embedded, 1)
+
+        store.search(FILING_URL, 'What are the risk factors?', self.download)
+        self.assertEqual(self.downloads, [FILING_URL])
+        self.assertEqual(self.embeddings.documents_embedded, documents_embedded)
+        self.assertEqual(self.embeddings.queries_embedded, 2)
+
+    def test_index_is_reused_across_processes(self):
+        self.store().search(FILING_URL, 'How much did revenue grow?', self.download)
+        documents_embedded = self.embeddings.documents_embedded
+
+        answer = self.store().search(FILING_URL, 'What are the risk factors?', self.download)
+        self.assertIn('Revenue from segment', answer)
+        self.assertEqual(self.downloads, [FILING_URL])
+        self.assertEqual(self.embeddings.documents_embedded, documents_embedded)
+
+    def test_index_is_rebuilt_when_chunking_changes(self):
+        self.store().search(FILING_URL, 'How much did revenue grow?', self.download)
+        FilingIndexStore(self.directory.name, embeddings=self.embeddings, vectorstore_cls=LocalVectorStore,
+                         chunk_size=500).search(FILING_URL, 'How much did revenue grow?', self.download)
+        self.assertEqual(len(self.downloads), 2)
+
+    def test_lexical_mode_makes_no_embedding_calls(self):
+        store = FilingIndexStore(self.directory.name, embeddings=self.embeddings, vectorstore_cls=LocalVectorStore,
+                                 mode='lexical')
+        answer = store.search(FILING_URL, 'supply chain risk factors', self.download, k=1)
+        self.assertIn('supply chain disruptions', answer)
+        self.assertEqual(store.search(FILING_URL, 'cryptocurrency', self.download), NO_MATCH)
+        self.assertEqual((self.embeddings.documents_embedded, self.embeddings.queries_embedded), (0, 0))
+        self.assertTrue(os.path.exists(os.path.join(self.directory.name, filing_key(FILING_URL), 'bm25.json')))
+
+    def test_hybrid_mode_embeds_only_the_candidates(self):
+        store = FilingIndexStore(self.directory.name, embeddings=self.embeddings, vectorstore_cls=LocalVectorStore,
+                                 mode='hybrid', rerank_candidates=5)
+        ask = 'revenue risk factors'
+        chunks = store.retrieve(FILING_URL, ask, self.download, k=2)
+        candidates = store.retrieve(FILING_URL, ask, self.download, k=5, mode='lexical')
+        self.assertEqual(len(chunks), 2)
+        self.assertTrue(set(chunks) <= set(candidates))
+        self.assertEqual(self.embeddings.documents_embedded, 5)
+        self.assertLess(self.embeddings.documents_embedded, len(store.chunks(FILING_URL, self.download)))
+
+    def test_unknown_mode_is_rejected(self):
+        with self.assertRaises(ValueError):
+            FilingIndexStore(self.directory.name, mode='keyword')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import unittest
+from src.Helpers.filing_store import FilingStore
+
+FILING_URL = 'https://www.sec.gov/Archives/edgar/data/320193/000032019324000081/aapl-20240629.htm'
+
+
+def filing(accession, filed_at):
+    return {'accession': accession, 'filed_at': filed_at, 'url': f'https://www.sec.gov/{accession}.htm',
+            'metadata': {'accessionNo': accession, 'formType': '10-Q'}}
+
+
+class SecApi:
+    """Filing listings as sec-api returns them, newest filings first."""
+
+    def __init__(self, filings):
+        self.filings = filings
+        self.calls = []
+
+    def __call__(self, since):
+        self.calls.append(since)
+        return [f for f in self.filings if since is None or f['filed_at'][:10] >= since[:10]]
+
+
+class TestFilingStore(unittest.TestCase):
+    def setUp(self):
+        self.store = FilingStore(':memory:', refresh_seconds=3600)
+        self.downloads = []
+
+    def tearDown(self):
+        self.store.close()
+
+    def download(self, url):
+        self.downloads.append(url)
+        return '<html><body><script>var x;</script><p>Total net sales were $85,777 million.</p></body></html>'
+
+    def test_only_newer_filings_are_fetched(self):
+        source = SecApi([filing('0000320193-24-000069', '2024-05-03T18:04:17-04:00'),
+                         filing('0000320193-24-000006', '2024-02-02T18:03:47-05:00')])
+        self.assertEqual(len(self.store.update('aapl', '10-Q', source)), 2)
+        self.assertEqual(self.store.latest('AAPL', '10-Q')['accession'], '0000320193-24-000069')
+
+        source.filings.insert(0, filing('0000320193-24-000081', '2024-08-02T18:04:36-04:00'))
+        new = self.store.update('AAPL', '10-Q', source, force=True)
+        self.assertEqual(source.calls, [None, '2024-05-03T18:04:17-04:00'])
+        self.assertEqual([f['accession'] for f in new], ['0000320193-24-000081'])
+        self.assertEqual(len(self.store.filings('AAPL', '10-Q')), 3)
+
+    def test_source_is_checked_once_per_refresh_interval(self):
+        source = SecApi([filing('0000320193-24-000069', '2024-05-03T18:04:17-04:00')])
+        for _ in range(3):
+            self.store.update('AAPL', '10-Q', source)
+        self.assertEqual(len(source.calls), 1)
+        self.store.refresh_seconds = 0
+        self.store.update('AAPL', '10-Q', source)
+        self.assertEqual(len(source.calls), 2)
+
+    def test_sources_and_forms_are_kept_apart(self):
+        self.store.update('AAPL', '10-Q', SecApi([filing('0000320193-24-000069', '2024-05-03')]))
+        self.assertIsNone(self.store.latest('AAPL', '10-K'))
+        self.assertIsNone(self.store.latest('AAPL', '10-Q', source='yahoo'))
+
+    def test_documents_are_downloaded_and_parsed_once(self):
+        for _ in range(3):
+            text = self.store.text(FILING_URL, self.download)
+            html = self.store.html(FILING_URL, self.download)
+        self.assertEqual(text, 'Total net sales were $85,777 million.')
+        self.assertIn('<script>', html)
+        self.assertEqual(self.downloads, [FILING_URL])
+        stats = self.store.stats()
+        self.assertEqual((stats['documents'], stats['downloads']), (1, 1))
+
+    def test_failed_downloads_are_not_stored(self):
+        def broken(url):
+            raise ConnectionError('403 Forbidden')
+        with self.assertRaises(ConnectionError):
+            self.store.text(FILING_URL, broken)
+        self.assertEqual(self.store.text(FILING_URL, self.download), 'Total net sales were $85,777 million.')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+import os
+import tempfile
+import unittest
+from src.Helpers.lexical_index import BM25Index, tokenize
+
+CHUNKS = [
+    "Net revenue for the quarter was $94,930 million, up 6% year over year.",
+    "Risk factors: the company depends on suppliers in Asia for components.",
+    "The board declared a cash dividend of $0.24 per share.",
+    "Revenue from services grew, while revenue from hardware declined.",
+    "Legal proceedings are described in Note 10 to the financial statements.",
+]
+
+
+class TestBM25Index(unittest.TestCase):
+    def test_tokenize_keeps_numbers_and_drops_stopwords(self):
+        self.assertEqual(tokenize("The revenue was $94,930 million in 2023."), ['revenue', '94,930', 'million', '2023'])
+
+    def test_search_ranks_matching_chunks_first(self):
+        index = BM25Index.build(CHUNKS)
+        self.assertEqual(index.search('What was the dividend per share?', k=1)[0][0], 2)
+        positions = [doc_id for doc_id, _ in index.search('revenue', k=5)]
+        self.assertEqual(sorted(positions), [0, 3])
+        # The chunk mentioning revenue twice ranks first
+        self.assertEqual(positions[0], 3)
+        self.assertEqual(index.search('cryptocurrency mining'), [])
+
+    def test_saved_index_gives_the_same_results(self):
+        index = BM25Index.build(CHUNKS)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'bm25.json')
+            index.save(path)
+            loaded = BM25Index.load(path)
+        query = 'suppliers risk in Asia'
+        self.assertEqual(loaded.search(query), index.search(query))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import time
+import unittest
+from unittest.mock import patch
+from src.Helpers.llm_cache import CachedLLM, LLMResponseCache, make_key
+
+
+def completion_response(content):
+    return {'choices': [{'message': {'content': content}}]}
+
+
+class TestLLMResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = LLMResponseCache(':memory:')
+        self.messages = [{'role': 'user', 'content': 'Summarize AAPL'}]
+
+    def tearDown(self):
+        self.cache.close()
+
+    def test_key_depends_on_every_input(self):
+        key = make_key('gpt-4o', 0.0, self.messages)
+        self.assertEqual(key, make_key('gpt-4o', 0.0, [dict(self.messages[0])]))
+        self.assertNotEqual(key, make_key('gpt-4', 0.0, self.messages))
+        self.assertNotEqual(key, make_key('gpt-4o', 0.5, self.messages))
+        self.assertNotEqual(key, make_key('gpt-4o', 0.0, self.messages, tools=[{'name': 'search'}]))
+        self.assertNotEqual(key, make_key('gpt-4o', 0.0, self.messages, max_tokens=100))
+
+    def test_expired_entries_are_misses(self):
+        self.cache.ttl_seconds = 60
+        self.cache.set('k', 'answer')
+        self.assertEqual(self.cache.get('k'), 'answer')
+        with patch('src.Helpers.llm_cache.time.time', return_value=time.time() + 120):
+            self.assertIsNone(self.cache.get('k'))
+        self.assertEqual(self.cache.stats()['entries'], 0)
+
+    def test_least_recently_used_entries_are_evicted(self):
+        self.cache.max_bytes = 25
+        self.cache.set('a', 'x' * 10)
+        self.cache.set('b', 'y' * 10)
+        time.sleep(0.01)
+        self.cache.get('a')
+        self.cache.set('c', 'z' * 10)
+        self.assertIsNone(self.cache.get('b'))
+        self.assertEqual(self.cache.get('a'), 'x' * 10)
+        self.assertEqual(self.cache.get('c'), 'z' * 10)
+        self.assertLessEqual(self.cache.stats()['bytes'], 25)
+
+    @patch('crewai.llm.litellm.completion')
+    def test_repeated_calls_are_served_from_cache(self, completion):
+        completion.return_value = completion_response('Buy')
+        llm = CachedLLM(model='gpt-4o', temperature=0.0, response_cache=self.cache)
+        self.assertEqual(llm.call(self.messages), 'Buy')
+        self.assertEqual(llm.call(self.messages), 'Buy')
+        self.assertEqual(completion.call_count, 1)
+        self.assertEqual(self.cache.stats()['hits'], 1)
+
+    @patch('crewai.llm.litellm.completion')
+    def test_sampled_calls_are_not_cached(self, completion):
+        completion.return_value = completion_response('Hold')
+        llm = CachedLLM(model='gpt-4o', temperature=0.7, response_cache=self.cache)
+        llm.call(self.messages)
+        llm.call(self.messages)
+        self.assertEqual(completion.call_count, 2)
+        self.assertEqual(self.cache.stats()['entries'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import os
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+import litellm
+from src.Helpers.llm_cache import CachedLLM, set_concurrency_limit, set_rate_limiter
+from src.Helpers.llm_registry import LLMRegistry
+from src.Helpers.stub_llm import StubLLM
+
+
+class TestLLMRegistry(unittest.TestCase):
+    def tearDown(self):
+        set_concurrency_limit(None)
+        set_rate_limiter(None)
+
+    def test_one_client_per_configuration(self):
+        registry = LLMRegistry()
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            clients = list(pool.map(lambda _: registry.get('gpt-4o', temperature=0), range(16)))
+        self.assertTrue(all(client is clients[0] for client in clients))
+        self.assertIsInstance(clients[0], CachedLLM)
+        self.assertIs(registry.get('gpt-4o', temperature=0.0, max_tokens=None), clients[0])
+        self.assertIsNot(registry.get('gpt-4o', temperature=0.0, max_tokens=1500), clients[0])
+        self.assertEqual(registry.stats(), {'clients': 2, 'models': ['openai:gpt-4o']})
+        registry.close()
+
+    def test_shared_connection_pool(self):
+        registry = LLMRegistry(max_connections=5)
+        registry.get('gpt-4o')
+        pool = litellm.client_session
+        self.assertIsNotNone(pool)
+        registry.get('gpt-4')
+        self.assertIs(litellm.client_session, pool)
+        registry.close()
+        self.assertIsNone(litellm.client_session)
+        self.assertEqual(registry.stats()['clients'], 0)
+
+    def test_global_concurrency_limit(self):
+        with patch.dict(os.environ, {'LLM_BACKEND': 'stub', 'LLM_STUB_LATENCY': '0.1'}):
+            registry = LLMRegistry(max_concurrent_requests=2)
+            llms = [registry.get('gpt-4o'), registry.get('gpt-4', max_tokens=100)]
+        self.assertTrue(all(isinstance(llm, StubLLM) for llm in llms))
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            list(pool.map(lambda i: llms[i % 2].call('hello'), range(6)))
+        self.assertGreaterEqual(time.perf_counter() - start, 0.3)
+        registry.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+import numpy as np
+import pandas as pd
+from src.Backtesting.monte_carlo import MonteCarloBootstrap
+
+
+class TestMonteCarloBootstrap(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(7)
+        self.returns = pd.Series(rng.normal(0.0005, 0.01, 500))
+
+    def test_block_resample_shape(self):
+        bootstrap = MonteCarloBootstrap(self.returns, n_paths=200, block_size=10, seed=1)
+        paths = bootstrap.resample()
+        self.assertEqual(paths.shape, (200, 500))
+        # Every resampled value must come from the observed returns
+        self.assertTrue(np.isin(paths, self.returns.values).all())
+
+    def test_shuffle_preserves_terminal_wealth(self):
+        bootstrap = MonteCarloBootstrap(self.returns, n_paths=50, method='shuffle', seed=1)
+        metrics = bootstrap.path_metrics(bootstrap.resample())
+        observed = bootstrap.path_metrics(bootstrap.returns[None, :])
+        np.testing.assert_allclose(metrics['cagr'], observed['cagr'][0])
+        np.testing.assert_allclose(metrics['sharpe'], observed['sharpe'][0])
+
+    def test_max_drawdown_known_path(self):
+        bootstrap = MonteCarloBootstrap([0.1, -0.5, 0.2], seed=1)
+        metrics = bootstrap.path_metrics(np.array([[0.1, -0.5, 0.2]]))
+        self.assertAlmostEqual(metrics['max_drawdown'][0], 0.5)
+
+    def test_run_returns_confidence_intervals(self):
+        result = MonteCarloBootstrap(self.returns, n_paths=1000, seed=3).run(confidence=0.9)
+        self.assertListEqual(list(result.index), ['sharpe', 'cagr', 'max_drawdown'])
+        self.assertTrue((result['lower'] <= result['upper']).all())
+        self.assertGreaterEqual(result.loc['max_drawdown', 'lower'], 0)
+
+    def test_seed_is_reproducible(self):
+        first = MonteCarloBootstrap(self.returns, n_paths=100, seed=11).run()
+        second = MonteCarloBootstrap(self.returns, n_paths=100, seed=11).run()
+        pd.testing.assert_frame_equal(first, second)
+
+    def test_invalid_inputs(self):
+        with self.assertRaises(ValueError):
+            MonteCarloBootstrap([0.01])
+        with self.assertRaises(ValueError):
+            MonteCarloBootstrap(self.returns, method='unknown')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import unittest
+import numpy as np
+import pandas as pd
+from src.Backtesting.performance_metrics import (
+    cagr, compute_metrics, max_drawdown, max_drawdown_duration, returns_from_equity, sharpe_ratio, sortino_ratio,
+)
+
+
+class TestPerformanceMetrics(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(21)
+        self.returns = rng.normal(0.0004, 0.012, 756)
+
+    def test_known_drawdown_and_duration(self):
+        equity = np.array([100, 110, 99, 88, 95, 112, 100])
+        self.assertAlmostEqual(max_drawdown(equity), 0.2)
+        # Below the 110 peak for bars 2, 3 and 4
+        self.assertEqual(max_drawdown_duration(equity), 3)
+
+    def test_single_strategy_returns_dict(self):
+        metrics = compute_metrics(self.returns)
+        self.assertIsInstance(metrics, dict)
+        expected_sharpe = self.returns.mean() / self.returns.std(ddof=1) * np.sqrt(252)
+        self.assertAlmostEqual(metrics['sharpe_ratio'], expected_sharpe)
+        expected_cagr = np.prod(1 + self.returns) ** (252 / len(self.returns)) - 1
+        self.assertAlmostEqual(metrics['cagr'], expected_cagr)
+        self.assertAlmostEqual(metrics['calmar_ratio'], metrics['cagr'] / metrics['max_drawdown'])
+        self.assertTrue(np.isnan(metrics['turnover']))
+
+    def test_equity_and_returns_agree(self):
+        equity = 1000 * np.cumprod(1 + self.returns)
+        from_equity = compute_metrics(equity=np.concatenate([[1000], equity]))
+        from_returns = compute_metrics(self.returns)
+        for name in from_returns:
+            if not np.isnan(from_returns[name]):
+                self.assertAlmostEqual(from_equity[name], from_returns[name], places=9)
+
+    def test_matrix_matches_columns(self):
+        sweep = pd.DataFrame({
+            'fast': self.returns,
+            'slow': self.returns[::-1],
+            'flat': np.where(np.arange(756) % 2 == 0, self.returns, 0.0),
+        })
+        table = compute_metrics(sweep)
+        self.assertListEqual(list(table.index), ['fast', 'slow', 'flat'])
+        for name in sweep.columns:
+            single = compute_metrics(sweep[name].values)
+            for metric, value in single.items():
+                if not np.isnan(value):
+                    self.assertAlmostEqual(table.loc[name, metric], value)
+        self.assertAlmostEqual(table.loc['flat', 'exposure'], 0.5)
+
+    def test_ratios_reduce_along_either_axis(self):
+        paths = np.random.default_rng(3).normal(0.0004, 0.012, (5, 252))
+        for metric in (sharpe_ratio, sortino_ratio, cagr):
+            by_row = metric(paths, axis=1)
+            np.testing.assert_allclose(by_row, metric(paths.T))
+            self.assertAlmostEqual(by_row[2], float(metric(paths[2])))
+
+    def test_positions_drive_turnover_and_exposure(self):
+        positions = np.zeros(504)
+        positions[100:200] = 1.0
+        metrics = compute_metrics(np.full(504, 0.001) * positions, positions=positions)
+        self.assertAlmostEqual(metrics['turnover'], 1.0)  # in and out once over two years
+        self.assertAlmostEqual(metrics['exposure'], 100 / 504)
+        self.assertAlmostEqual(metrics['hit_rate'], 1.0)
+
+    def test_returns_from_equity(self):
+        np.testing.assert_allclose(returns_from_equity([100, 110, 99]), [0.1, -0.1])
+
+    def test_missing_input(self):
+        with self.assertRaises(ValueError):
+            compute_metrics()
+
+
+if __name__ == '__main__':
+    unittest.main()
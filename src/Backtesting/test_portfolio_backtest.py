@@ -0,0 +1,62 @@
+import unittest
+import numpy as np
+import pandas as pd
+from src.Backtesting.backtest_portfolio import PortfolioBacktester, target_weights_from_portfolio
+
+
+class TestPortfolioBacktester(unittest.TestCase):
+    def setUp(self):
+        index = pd.bdate_range('2020-01-01', periods=300)
+        rng = np.random.default_rng(5)
+        returns = rng.normal(0.0003, 0.01, size=(300, 4))
+        self.prices = pd.DataFrame(100 * np.cumprod(1 + returns, axis=0),
+                                   index=index, columns=['SPY', 'DIA', 'AGG', 'GLD'])
+        self.weights = {'SPY': 0.3, 'DIA': 0.2, 'AGG': 0.25, 'GLD': 0.25}
+
+    def test_target_weights_from_portfolio(self):
+        portfolio_data = [
+            {'asset_class': 'Equity', 'holdings': [{'ticker': 'SPY', 'position': 1, 'weight': 0.6}]},
+            {'asset_class': 'Bonds', 'holdings': [{'ticker': 'AGG', 'position': 1, 'weight': 0.4}]},
+        ]
+        self.assertEqual(target_weights_from_portfolio(portfolio_data), {'SPY': 0.6, 'AGG': 0.4})
+
+    def test_buy_and_hold_matches_weighted_growth(self):
+        result = PortfolioBacktester(self.prices, self.weights, rebalance=None, commission=0.0).run()
+        expected = (self.prices / self.prices.iloc[0] * pd.Series(self.weights)).sum(axis=1) * 100000
+        np.testing.assert_allclose(result['equity'].values, expected.values)
+        self.assertEqual(len(result['rebalances']), 1)
+
+    def test_monthly_rebalance_resets_weights(self):
+        result = PortfolioBacktester(self.prices, self.weights, rebalance='M', commission=0.0).run()
+        rebalances = result['rebalances']
+        self.assertTrue((rebalances.index[1:].day <= 5).all())
+        self.assertGreater(len(rebalances), 10)
+        # Matches a bar-by-bar simulation of the same schedule
+        units = None
+        equity = []
+        periods = self.prices.index.to_period('M')
+        for i, (date, row) in enumerate(self.prices.iterrows()):
+            value = 100000.0 if units is None else (units * row).sum()
+            if units is None or periods[i] != periods[i - 1]:
+                units = pd.Series(self.weights) * value / row
+            equity.append(value)
+        np.testing.assert_allclose(result['equity'].values, equity)
+
+    def test_drift_threshold_triggers_rebalance(self):
+        prices = self.prices.copy()
+        prices.loc[prices.index[150]:, 'GLD'] *= 2.0
+        result = PortfolioBacktester(prices, self.weights, rebalance=None, drift_threshold=0.05).run()
+        self.assertIn(prices.index[150], result['rebalances'].index)
+
+    def test_commission_reduces_equity(self):
+        free = PortfolioBacktester(self.prices, self.weights, commission=0.0).run()
+        costly = PortfolioBacktester(self.prices, self.weights, commission=0.01).run()
+        self.assertLess(costly['equity'].iloc[-1], free['equity'].iloc[-1])
+
+    def test_missing_ticker(self):
+        with self.assertRaises(ValueError):
+            PortfolioBacktester(self.prices, {'QQQ': 1.0})
+
+
+if __name__ == '__main__':
+    unittest.main()
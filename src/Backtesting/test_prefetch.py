@@ -0,0 +1,57 @@
+import time
+import unittest
+from unittest.mock import MagicMock
+from src.Helpers.prefetch import Prefetcher
+
+
+def slow_fetch(value, delay=0.2):
+    time.sleep(delay)
+    return value
+
+
+class TestPrefetcher(unittest.TestCase):
+    def setUp(self):
+        self.prefetcher = Prefetcher(max_workers=4)
+
+    def tearDown(self):
+        self.prefetcher.shutdown()
+
+    def test_fetches_overlap(self):
+        start = time.perf_counter()
+        for key in ('prices', 'news', 'filings'):
+            self.prefetcher.prefetch(key, slow_fetch, key)
+        results = [self.prefetcher.get(key) for key in ('prices', 'news', 'filings')]
+        self.assertEqual(results, ['prices', 'news', 'filings'])
+        self.assertLess(time.perf_counter() - start, 0.5)
+        self.assertEqual(self.prefetcher.stats()['hits'], 3)
+
+    def test_prefetched_result_is_not_fetched_again(self):
+        fetch = MagicMock(return_value='articles')
+        self.prefetcher.prefetch('news', fetch)
+        self.prefetcher.prefetch('news', fetch)
+        self.assertEqual(self.prefetcher.get('news', fetch), 'articles')
+        fetch.assert_called_once()
+
+    def test_missing_and_failed_prefetch_fall_back_to_loader(self):
+        self.assertEqual(self.prefetcher.get('prices', lambda: 'loaded'), 'loaded')
+        self.assertEqual(self.prefetcher.stats()['misses'], 1)
+        with self.assertRaises(KeyError):
+            self.prefetcher.get('unknown')
+
+        def fail():
+            raise ConnectionError('offline')
+        self.prefetcher.prefetch('news', fail)
+        self.assertEqual(self.prefetcher.get('news', lambda: 'retried'), 'retried')
+
+    def test_results_expire(self):
+        prefetcher = Prefetcher(ttl=0.05)
+        fetch = MagicMock(side_effect=['old', 'new'])
+        prefetcher.prefetch('news', fetch)
+        self.assertEqual(prefetcher.get('news', fetch), 'old')
+        time.sleep(0.1)
+        self.assertEqual(prefetcher.get('news', fetch), 'new')
+        prefetcher.shutdown()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import json
+import unittest
+import numpy as np
+import pandas as pd
+from src.Helpers.prompt_compaction import compact_json, count_tokens, summarize_macd, truncate_to_tokens
+from src.Indicators.macd import MACDIndicator
+
+
+class TestPromptCompaction(unittest.TestCase):
+    def setUp(self):
+        index = pd.bdate_range('2020-01-01', periods=1000)
+        close = 100 + np.cumsum(np.random.default_rng(1).normal(0, 1, len(index)))
+        self.macd_data = MACDIndicator(pd.DataFrame({'Close': close}, index=index)).calculate_macd()
+
+    def test_macd_summary_is_an_order_of_magnitude_smaller(self):
+        summary = summarize_macd(self.macd_data)
+        full = self.macd_data.to_string(index=False)
+        self.assertLess(count_tokens(summary) * 10, count_tokens(full))
+        self.assertIn('Current regime', summary)
+        self.assertIn(self.macd_data.index[-1].strftime('%Y-%m-%d'), summary)
+
+    def test_macd_summary_reports_crossovers(self):
+        macd = pd.DataFrame({'MACD Line': [-1.0, -0.5, 0.5, 1.0, 0.2],
+                             'Signal Line': [0.0, 0.0, 0.0, 0.0, 0.5]})
+        summary = summarize_macd(macd)
+        self.assertIn('Crossovers: 2 total', summary)
+        self.assertIn('2 bullish', summary)
+        self.assertIn('4 bearish', summary)
+
+    def test_truncate_to_tokens(self):
+        text = 'revenue grew strongly ' * 500
+        truncated = truncate_to_tokens(text, 100)
+        self.assertLessEqual(count_tokens(truncated), 100)
+        self.assertIn('truncated', truncated)
+        self.assertEqual(truncate_to_tokens('short', 100), 'short')
+
+    def test_compact_json_keeps_structure_within_budget(self):
+        filings = {'form': {str(i): '10-Q' for i in range(200)},
+                   'url': {str(i): f'https://www.sec.gov/Archives/{i:010d}.htm' for i in range(200)},
+                   'empty': None}
+        compacted = compact_json(json.dumps(filings), max_tokens=300)
+        self.assertLessEqual(count_tokens(compacted), 300)
+        parsed = json.loads(compacted)
+        self.assertEqual(parsed['form']['0'], '10-Q')
+        self.assertNotIn('empty', parsed)
+
+    def test_compact_json_handles_text_and_missing_data(self):
+        self.assertEqual(compact_json(None), 'No data available.')
+        self.assertLessEqual(count_tokens(compact_json('not json ' * 1000, max_tokens=50)), 50)
+
+
+if __name__ == '__main__':
+    unittest.main()
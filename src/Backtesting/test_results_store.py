@@ -0,0 +1,129 @@
+import unittest
+import numpy as np
+import pandas as pd
+from src.Backtesting.results_store import (
+    BacktestResultsStore, config_hash, data_fingerprint, run_and_store, strategy_config,
+)
+from src.Benchmarks.synthetic_data import make_ohlcv
+
+
+class TestBacktestResultsStore(unittest.TestCase):
+    def setUp(self):
+        self.store = BacktestResultsStore(':memory:')
+        index = pd.bdate_range('2023-01-02', periods=5)
+        self.data = pd.DataFrame({'Close': [100.0, 101.0, 99.5, 102.0, 103.0]}, index=index)
+        self.config = {'strategy': 'MACDStrategy', 'company': 'AAPL', 'cash': 100000.0}
+        self.equity = pd.Series([100000.0, 100500.0, 99800.0, 101200.0, 102000.0], index=index)
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_config_hash_ignores_key_order(self):
+        reordered = dict(reversed(list(self.config.items())))
+        self.assertEqual(config_hash(self.config), config_hash(reordered))
+
+    def test_fingerprint_changes_with_data(self):
+        changed = self.data.copy()
+        changed.iloc[2, 0] = 99.6
+        self.assertNotEqual(data_fingerprint(self.data), data_fingerprint(changed))
+
+    def test_save_and_load_round_trip(self):
+        fingerprint = data_fingerprint(self.data)
+        summary = {'strategy_name': 'MACD', 'sharpe_ratio': 1.2, 'max_drawdown': 0.7}
+        trades = [{'date': '2023-01-03', 'size': 10, 'price': 101.0}]
+        run_id = self.store.save(self.config, fingerprint, 'MACD', summary, self.equity, trades)
+
+        cached = self.store.load(self.config, fingerprint)
+        self.assertEqual(cached['run_id'], run_id)
+        self.assertEqual(cached['summary'], summary)
+        self.assertEqual(cached['trades'], trades)
+        np.testing.assert_allclose(cached['equity'].values, self.equity.values)
+        self.assertTrue((cached['equity'].index == self.equity.index).all())
+        self.assertIsNone(self.store.load({'strategy': 'Other'}, fingerprint))
+
+    def test_get_or_run_serves_repeats_from_store(self):
+        calls = []
+
+        def run():
+            calls.append(1)
+            return {'strategy_name': 'MACD', 'summary': {'sharpe_ratio': 0.9}, 'equity': self.equity}
+
+        first = self.store.get_or_run(self.config, self.data, run)
+        second = self.store.get_or_run(self.config, self.data, run)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(first['run_id'], second['run_id'])
+
+    def test_best_over_recent_runs(self):
+        fingerprint = data_fingerprint(self.data)
+        sharpes = [0.5, 2.0, 1.0, 1.5, np.nan]
+        for i, sharpe in enumerate(sharpes):
+            config = dict(self.config, fast_period=i)
+            self.store.save(config, fingerprint, f'sweep-{i}', {'sharpe_ratio': sharpe})
+
+        best = self.store.best('sharpe_ratio', last_n=500)
+        self.assertEqual(best.iloc[0]['strategy_name'], 'sweep-1')
+        # Only the last two runs with a Sharpe ratio are considered
+        recent = self.store.best('sharpe_ratio', last_n=2)
+        self.assertEqual(recent.iloc[0]['strategy_name'], 'sweep-3')
+
+    def test_best_accepts_any_metric_name(self):
+        fingerprint = data_fingerprint(self.data)
+        self.store.save(self.config, fingerprint, 'MACD', {'1y return-%': 12.5})
+        best = self.store.best('1y return-%')
+        self.assertEqual(list(best.columns), ['run_id', 'strategy_name', 'created_at', '1y return-%'])
+        self.assertAlmostEqual(best.iloc[0]['1y return-%'], 12.5)
+
+    def test_replacing_a_run_replaces_its_metrics(self):
+        fingerprint = data_fingerprint(self.data)
+        self.store.save(self.config, fingerprint, 'MACD', {'sharpe_ratio': 0.1})
+        self.store.save(self.config, fingerprint, 'MACD', {'sharpe_ratio': 0.2})
+        history = self.store.history()
+        self.assertEqual(len(history), 1)
+        self.assertAlmostEqual(history.iloc[0]['sharpe_ratio'], 0.2)
+
+    def test_run_and_store_runs_once_per_config_and_data(self):
+        import backtrader as bt
+
+        class BuyAndHold(bt.Strategy):
+            def next(self):
+                if not self.position:
+                    self.buy(size=10)
+
+        data_df = make_ohlcv(300, seed=1)
+        config = {'strategy': 'BuyAndHold', 'cash': 100000.0, 'commission': 0.001}
+        builds = []
+
+        def build(cerebro):
+            builds.append(cerebro.broker.getcash())
+            cerebro.adddata(bt.feeds.PandasData(dataname=data_df))
+            cerebro.addstrategy(BuyAndHold)
+
+        first = run_and_store(build, 'Buy and Hold', data_df, config, self.store)
+        second = run_and_store(build, 'Buy and Hold', data_df, config, self.store)
+        self.assertEqual(builds, [100000.0])
+        self.assertEqual(first, second)
+        self.assertGreater(first['exposure'], 0)
+        self.assertEqual(len(self.store.load(config, data_fingerprint(data_df))['trades']), 1)
+
+    def test_strategy_config_changes_with_parameters_and_source(self):
+        import backtrader as bt
+
+        class Crossover(bt.Strategy):
+            params = dict(fast_period=12, data_df=None)
+
+        class Edited(bt.Strategy):
+            params = dict(fast_period=12, data_df=None)
+
+            def next(self):
+                pass
+
+        config = strategy_config(Crossover, data_df=self.data)
+        self.assertEqual(config['params'], {'fast_period': 12})
+        self.assertNotEqual(config_hash(config), config_hash(strategy_config(Crossover, fast_period=10)))
+        Edited.__name__ = 'Crossover'
+        self.assertNotEqual(config['source_hash'], strategy_config(Edited)['source_hash'])
+        self.assertEqual(config_hash(config), config_hash(strategy_config(Crossover, data_df=self.data.iloc[:2])))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+from src.Helpers.safe_eval import compile_program, evaluate, evaluate_all, format_number
+
+
+class TestSafeEval(unittest.TestCase):
+    def test_arithmetic(self):
+        self.assertEqual(evaluate('200*7'), 1400)
+        self.assertEqual(evaluate('5000/2*10'), 25000)
+        self.assertEqual(evaluate('-(2 + 3) ** 2 % 7'), 3)
+        self.assertAlmostEqual(evaluate('2 * pi'), 6.283185307, places=6)
+
+    def test_finance_functions(self):
+        self.assertEqual(evaluate('pct_change(80, 100)'), 25)
+        self.assertEqual(evaluate('pct_change([100, 120, 150])'), [20, 25])
+        self.assertAlmostEqual(evaluate('cagr(100, 150, 2)'), 22.4744871, places=6)
+        self.assertAlmostEqual(evaluate('stdev([1, 2, 3, 4])'), 1.2909944, places=6)
+        self.assertEqual(evaluate('mean(1, 2, 3)'), evaluate('mean([1, 2, 3])'))
+        self.assertEqual(evaluate('round(3.14159, 2)'), 3.14)
+        self.assertAlmostEqual(evaluate('cagr(150, 100, 2)'), -18.3503419, places=6)
+
+    def test_cagr_rejects_non_positive_values(self):
+        for source in ('cagr(-100, 150, 2)', 'cagr(100, -150, 2)', 'cagr(0, 150, 2)', 'cagr([100, -1], 150, 2)'):
+            with self.assertRaises(ValueError, msg=source):
+                evaluate(source)
+
+    def test_lists_are_evaluated_element_wise(self):
+        self.assertEqual(format_number(evaluate('[100, 120, 150] * 1.1')), '[110, 132, 165]')
+        self.assertEqual(evaluate('[1, 2] + [3, 4]'), [4, 6])
+        self.assertEqual(evaluate('pct_change([100, 200], [110, 180])'), [10, -10])
+        self.assertEqual(evaluate('prices * 2', {'prices': [1.5, 2]}), [3, 4])
+
+    def test_several_statements_in_one_call(self):
+        results = evaluate_all('revenue = [100, 120, 150]\ngrowth = pct_change(revenue); round(mean(growth), 1)')
+        self.assertEqual(results, {'revenue': [100, 120, 150], 'growth': [20, 25], 'round(mean(growth), 1)': 22.5})
+
+    def test_unsafe_input_is_rejected(self):
+        for source in ('__import__("os").system("ls")', 'open("secrets")', '(1).__class__', 'x.y',
+                       '"a" * 3', 'lambda: 1', '[i for i in range(9)]', 'import os', 'mean(values=[1])',
+                       'abs = 1', '9 ** 9 ** 9', '1e308 * 10', '9' * 400 + ' + 1'):
+            with self.assertRaises(ValueError, msg=source):
+                evaluate(source)
+
+    def test_invalid_arithmetic_raises_value_error(self):
+        for source in ('1 / 0', 'log(0)', 'sqrt(-1)', '(-8) ** (1 / 3)', 'stdev([1])', '[1, 2] + [1, 2, 3]',
+                       'unknown + 1', '2 +', ''):
+            with self.assertRaises(ValueError, msg=source):
+                evaluate(source)
+
+    def test_long_flat_sums(self):
+        self.assertEqual(evaluate('+'.join(['1'] * 400)), 400)
+        # Deeper expressions evaluate or raise ValueError, depending on the recursion limit
+        for source in ('+'.join(['1'] * 1500), '+'.join(['1'] * 4900), '(' * 300 + '1' + ')' * 300):
+            try:
+                evaluate(source)
+            except ValueError:
+                pass
+
+    def test_tool_returns_errors_as_text(self):
+        try:
+            from src.Agents.Analysis.Tools.calculator_tools import CalculatorTools
+        except ImportError as e:
+            self.skipTest(f"Tool dependencies are not installed: {e}")
+        self.assertTrue(CalculatorTools.calculate.run('9' * 400 + '+1').startswith('Error:'))
+        self.assertTrue(CalculatorTools.calculate.run('+'.join(['1'] * 3000)).startswith('Error:'))
+
+    def test_parsed_expressions_are_cached(self):
+        compile_program.cache_clear()
+        for _ in range(3):
+            evaluate('x * 1.05', {'x': 100})
+        info = compile_program.cache_info()
+        self.assertEqual((info.misses, info.hits), (1, 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
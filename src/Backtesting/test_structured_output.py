@@ -0,0 +1,48 @@
+import json
+import os
+import unittest
+from unittest.mock import patch
+import pandas as pd
+from crewai import Agent, Crew, Task
+from src.Helpers.structured_output import (
+    CorrelationResult, DivergenceSignals, TradeDecision, parse_structured
+)
+from src.Helpers.stub_llm import StubLLM
+
+
+class TestStructuredOutput(unittest.TestCase):
+    def setUp(self):
+        os.environ.setdefault('OPENAI_API_KEY', 'test-key')
+
+    def test_parse_json_from_raw_text(self):
+        raw = 'Here is my answer:\n{"action": "buy", "confidence": 0.8, "rationale": "Strong quarter."}'
+        decision = parse_structured(raw, TradeDecision)
+        self.assertEqual((decision.action, decision.confidence), ('buy', 0.8))
+        self.assertEqual(parse_structured({'stock1': 'AAPL', 'stock2': 'MSFT', 'correlation': 0.91,
+                                           'suitable_for_pairs_trading': True}, CorrelationResult).correlation, 0.91)
+
+    def test_invalid_output_raises_value_error(self):
+        for raw in ('I would probably buy.', '{"action": "accumulate", "confidence": 0.5, "rationale": "x"}',
+                    '{"action": "buy", "confidence": 1.5, "rationale": "x"}', ''):
+            with self.assertRaises(ValueError):
+                parse_structured(raw, TradeDecision)
+
+    @patch('crewai.llm.litellm.completion')
+    def test_task_output_is_validated_by_crewai(self, completion):
+        answer = json.dumps({'bullish_dates': ['2024-03-01 00:00:00'], 'bearish_dates': [],
+                             'action': 'buy', 'confidence': 0.7})
+        llm = StubLLM(default_response=f"Thought: I now know the final answer\nFinal Answer: {answer}")
+        agent = Agent(role='Advisor', goal='Decide', backstory='Expert', llm=llm, verbose=False)
+        task = Task(description='Confirm the divergences', expected_output='JSON',
+                    agent=agent, output_pydantic=DivergenceSignals)
+        output = Crew(agents=[agent], tasks=[task], verbose=False).kickoff()
+
+        completion.assert_not_called()
+        self.assertIsInstance(output.pydantic, DivergenceSignals)
+        signals = parse_structured(output, DivergenceSignals)
+        self.assertEqual([pd.Timestamp(date) for date in signals.bullish_dates], [pd.Timestamp('2024-03-01')])
+        self.assertIs(parse_structured(output.tasks_output[0], DivergenceSignals), output.tasks_output[0].pydantic)
+
+
+if __name__ == '__main__':
+    unittest.main()
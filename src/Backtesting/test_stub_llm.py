@@ -0,0 +1,66 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+from crewai import Agent, Crew, Task
+from langchain_openai import ChatOpenAI
+from src.Helpers.llm_cache import cached_llm
+from src.Helpers.stub_llm import StubLLM
+from src.Helpers.token_budget import TokenBudget, TokenLedger
+
+
+class TestStubLLM(unittest.TestCase):
+    def setUp(self):
+        os.environ.setdefault('OPENAI_API_KEY', 'test-key')
+
+    def test_scripted_responses_and_token_counts(self):
+        llm = StubLLM(responses=[(r'stock (?P<ticker>[A-Z]+)', 'Final Answer: BUY $ticker')],
+                      default_response='Final Answer: HOLD', prompt_tokens=120, completion_tokens=30)
+        self.assertEqual(llm.respond([{'role': 'user', 'content': 'Analyze stock NVDA'}]),
+                         ('Final Answer: BUY NVDA', 120, 30))
+        self.assertEqual(llm.call([{'role': 'user', 'content': 'Analyze the market'}]), 'Final Answer: HOLD')
+        self.assertEqual(llm.calls, 1)
+
+    def test_script_file(self):
+        path = os.path.join(tempfile.mkdtemp(), 'script.json')
+        with open(path, 'w') as f:
+            json.dump({'responses': [{'pattern': 'divergence', 'response': 'Final Answer: none'}],
+                       'default': 'Final Answer: default'}, f)
+        llm = StubLLM.from_file(path)
+        self.assertEqual(llm.call('Find a divergence'), 'Final Answer: none')
+        self.assertEqual(llm.call('Anything else'), 'Final Answer: default')
+
+    def test_latency_is_deterministic_for_a_seed(self):
+        first, second = StubLLM(latency=0.01, jitter=0.05, seed=7), StubLLM(latency=0.01, jitter=0.05, seed=7)
+        start = time.perf_counter()
+        for llm in (first, second):
+            for _ in range(3):
+                llm.call('hello')
+        self.assertGreaterEqual(time.perf_counter() - start, 0.06)
+        self.assertAlmostEqual(first.total_latency, second.total_latency)
+
+    @patch('crewai.llm.litellm.completion')
+    def test_crew_runs_offline_with_token_accounting(self, completion):
+        llm = StubLLM(prompt_tokens=500, completion_tokens=50)
+        agent = Agent(role='Analyst', goal='Analyze', backstory='Expert', llm=llm, verbose=False)
+        tasks = [Task(description=f'Report {i}', expected_output='A report', agent=agent) for i in range(2)]
+        ledger = TokenLedger(path=None)
+        output = TokenBudget(ledger=ledger).run(Crew(agents=[agent], tasks=tasks, verbose=False))
+
+        completion.assert_not_called()
+        self.assertIn('HOLD', output.raw)
+        self.assertEqual(output.token_usage.total_tokens, 1100)
+        self.assertEqual([record['total_tokens'] for record in ledger.records], [550, 550])
+
+    def test_cached_llm_switches_to_stub_backend(self):
+        with patch.dict(os.environ, {'LLM_BACKEND': 'stub', 'LLM_STUB_LATENCY': '0.02'}):
+            llm = cached_llm(ChatOpenAI(model='gpt-4o-mini', temperature=0.0))
+        self.assertIsInstance(llm, StubLLM)
+        self.assertEqual((llm.model, llm.temperature, llm.latency), ('gpt-4o-mini', 0.0, 0.02))
+        self.assertNotIsInstance(cached_llm(ChatOpenAI(model='gpt-4o', temperature=0.0)), StubLLM)
+
+
+if __name__ == '__main__':
+    unittest.main()
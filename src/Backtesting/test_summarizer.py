@@ -0,0 +1,48 @@
+import os
+import time
+import unittest
+from src.Helpers.stub_llm import StubLLM
+from src.Helpers.summarizer import MapReduceSummarizer, chunk_text, dedupe_text
+
+NAVIGATION = 'Home | Markets | Tech | Subscribe\nShare on Twitter\n'
+
+
+def page(paragraphs: int) -> str:
+    return ''.join(f'{NAVIGATION}Paragraph {i}: ' + 'revenue grew in the quarter. ' * 30 + '\n'
+                   for i in range(paragraphs))
+
+
+class TestMapReduceSummarizer(unittest.TestCase):
+    def setUp(self):
+        os.environ.setdefault('OPENAI_API_KEY', 'test-key')
+        self.llm = StubLLM(responses=[(r'Merge them', 'Merged summary'), (r'Paragraph (?P<n>\d+)', 'Summary $n')],
+                           latency=0.2)
+
+    def test_boilerplate_is_deduplicated_and_chunked(self):
+        text = dedupe_text(page(3))
+        self.assertEqual(text.count('Share on Twitter'), 1)
+        chunks = chunk_text('a' * 2500 + '\n' + 'b' * 10, chunk_size=1000)
+        self.assertEqual([len(chunk) for chunk in chunks], [1000, 1000, 511])
+
+    def test_chunks_are_summarized_concurrently_then_merged(self):
+        summarizer = MapReduceSummarizer(llm=self.llm, chunk_size=1000, max_workers=10)
+        start = time.perf_counter()
+        summary = summarizer.summarize(page(10))
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(summary, 'Merged summary')
+        self.assertEqual(summarizer.llm_calls, 11)
+        # One round of ten concurrent chunk summaries plus the reduce, not eleven sequential calls
+        self.assertLess(elapsed, 1.0)
+
+    def test_chunk_summaries_are_cached_by_content(self):
+        summarizer = MapReduceSummarizer(llm=self.llm, chunk_size=1000, max_workers=10)
+        summarizer.summarize(page(4))
+        calls = summarizer.llm_calls
+        self.assertEqual(summarizer.summarize(page(4)), 'Merged summary')
+        self.assertEqual(summarizer.llm_calls, calls)
+        self.assertEqual(summarizer.summarize('Paragraph 7 only'), 'Summary 7')
+
+
+if __name__ == '__main__':
+    unittest.main()
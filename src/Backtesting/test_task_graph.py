@@ -0,0 +1,81 @@
+import os
+import threading
+import time
+import unittest
+from unittest.mock import patch
+from crewai import Agent, LLM, Task
+from src.Helpers.task_graph import TaskGraphExecutor
+
+
+class TestTaskGraphExecutor(unittest.TestCase):
+    def setUp(self):
+        os.environ.setdefault('OPENAI_API_KEY', 'test-key')
+        self.prompts = []
+        self.lock = threading.Lock()
+
+    def make_agent(self, role):
+        return Agent(role=role, goal='Analyze', backstory='Expert',
+                     llm=LLM(model='gpt-4o', temperature=0.0), verbose=False)
+
+    def make_task(self, name, agent, context=None):
+        return Task(description=f"Produce the {name} report.", expected_output=f"{name} report",
+                    agent=agent, context=context)
+
+    def fake_completion(self, **kwargs):
+        prompt = kwargs['messages'][-1]['content']
+        with self.lock:
+            self.prompts.append(prompt)
+        time.sleep(0.3)
+        name = prompt.split('Produce the ')[1].split(' report')[0]
+        return {'choices': [{'message': {'content': f"Thought: done\nFinal Answer: {name} done"}}]}
+
+    @patch('crewai.llm.litellm.completion')
+    def test_independent_tasks_run_concurrently(self, completion):
+        completion.side_effect = self.fake_completion
+        tasks = [self.make_task(name, self.make_agent(name)) for name in ('sec', 'earnings', 'news')]
+        executor = TaskGraphExecutor([task.agent for task in tasks], tasks)
+        self.assertEqual(executor.critical_path_length, 1)
+
+        start = time.perf_counter()
+        output = executor.kickoff()
+        self.assertLess(time.perf_counter() - start, 0.8)
+        self.assertEqual([task.raw for task in output.tasks_output], ['sec done', 'earnings done', 'news done'])
+        self.assertEqual(output.raw, 'news done')
+
+    @patch('crewai.llm.litellm.completion')
+    def test_dependent_task_receives_outputs(self, completion):
+        completion.side_effect = self.fake_completion
+        sec = self.make_task('sec', self.make_agent('sec'))
+        earnings = self.make_task('earnings', self.make_agent('earnings'))
+        advisor = self.make_agent('advisor')
+        recommend = self.make_task('recommend', advisor)
+        executor = TaskGraphExecutor([sec.agent, earnings.agent, advisor], [sec, earnings, recommend],
+                                     dependencies={recommend: [sec, earnings]})
+        self.assertEqual(executor.critical_path_length, 2)
+
+        output = executor.kickoff()
+        recommend_prompt = [prompt for prompt in self.prompts if 'recommend report' in prompt][0]
+        self.assertIn('sec done', recommend_prompt)
+        self.assertIn('earnings done', recommend_prompt)
+        self.assertEqual(output.raw, 'recommend done')
+
+    @patch('crewai.llm.litellm.completion')
+    def test_token_usage_sums_all_agents(self, completion):
+        completion.side_effect = self.fake_completion
+        tasks = [self.make_task(name, self.make_agent(name)) for name in ('sec', 'earnings')]
+        for tokens, task in zip((100, 50), tasks):
+            # crewai's private per-agent counter, which CrewOutput.token_usage is built from
+            task.agent._token_process.sum_prompt_tokens(tokens)
+        output = TaskGraphExecutor([task.agent for task in tasks], tasks).kickoff()
+        self.assertEqual(output.token_usage.prompt_tokens, 150)
+
+    def test_cycles_are_rejected(self):
+        agent = self.make_agent('analyst')
+        first = self.make_task('first', agent)
+        second = self.make_task('second', agent, context=[first])
+        with self.assertRaises(ValueError):
+            TaskGraphExecutor([agent], [first, second], dependencies={first: [second]})
+
+
+if __name__ == '__main__':
+    unittest.main()
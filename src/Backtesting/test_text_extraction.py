@@ -0,0 +1,49 @@
+import unittest
+from src.Helpers.text_extraction import extract_text
+
+ARTICLE = """<html><head><title>Apple</title><script>var tracking = 1;</script><style>p { color: red }</style></head>
+<body>
+  <nav><a href="/">Home</a> <a href="/markets">Markets</a> <a href="/tech">Tech</a></nav>
+  <div class="header-share">Share on Twitter</div>
+  <div id="story-body">
+    <h1>Apple beats estimates</h1>
+    <p>Apple reported revenue of <b>$94.9 billion</b>, up 6%, beating analyst estimates, driven by iPhone sales.</p>
+    <p>Services revenue, a key growth driver, hit a record, the company said, while Mac sales declined.</p>
+  </div>
+  <div class="links"><a href="/a">Markets wrap: stocks rally as yields fall again</a> <a href="/b">Ten stocks to buy</a></div>
+  <footer>Copyright 2024. All rights reserved by the publisher of this website.</footer>
+</body></html>"""
+
+FILING = """<html><body><table>
+<tr><td>Net sales</td><td>$</td><td>94,930</td><td>$</td><td>89,498</td></tr>
+<tr><td>Cost of sales</td><td>$</td><td>51,051</td><td>$</td><td>48,186</td></tr>
+</table><div>Table of Contents</div><p>Risk factors are described below.</p><div>Table of Contents</div></body></html>"""
+
+
+class TestTextExtraction(unittest.TestCase):
+    def test_main_content_is_kept_and_boilerplate_dropped(self):
+        text = extract_text(ARTICLE)
+        self.assertEqual(text.splitlines(), [
+            'Apple beats estimates',
+            'Apple reported revenue of $94.9 billion, up 6%, beating analyst estimates, driven by iPhone sales.',
+            'Services revenue, a key growth driver, hit a record, the company said, while Mac sales declined.',
+        ])
+        self.assertLess(len(text), len(ARTICLE) / 3)
+
+    def test_full_document_mode_keeps_tables(self):
+        text = extract_text(FILING, main_content=False, dedupe=False)
+        self.assertIn('Net sales $ 94,930 $ 89,498', text)
+        self.assertIn('Cost of sales $ 51,051 $ 48,186', text)
+        self.assertEqual(text.count('Table of Contents'), 2)
+        self.assertEqual(extract_text(FILING, main_content=False).count('Table of Contents'), 1)
+
+    def test_scripts_and_whitespace_never_reach_the_text(self):
+        text = extract_text(ARTICLE, main_content=False)
+        self.assertNotIn('tracking', text)
+        self.assertNotIn('color', text)
+        self.assertNotIn('  ', text)
+        self.assertNotIn('\n\n', text)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import os
+import unittest
+from unittest.mock import patch
+from crewai import Agent, Crew, LLM, Process, Task
+from src.Helpers.token_budget import TokenBudget, TokenBudgetExceeded, TokenLedger, agent_token_usage, token_cost
+
+
+class TestTokenBudget(unittest.TestCase):
+    def setUp(self):
+        os.environ.setdefault('OPENAI_API_KEY', 'test-key')
+        self.agent = Agent(role='Analyst', goal='Analyze', backstory='Expert',
+                           llm=LLM(model='gpt-4o', temperature=0.0), verbose=False)
+        self.ledger = TokenLedger(path=None)
+        self.usage = (120, 30)
+        self.prompts = []
+
+    def make_task(self, data):
+        return Task(description=f"Analyze this data.\n{data}\nAnswer with buy, sell or hold.",
+                    expected_output='buy, sell or hold', agent=self.agent)
+
+    def fake_completion(self, **kwargs):
+        self.prompts.append(kwargs['messages'][-1]['content'])
+        # Stand-in for the API: count usage the way crewai's token callback would
+        self.agent._token_process.sum_prompt_tokens(self.usage[0])
+        self.agent._token_process.sum_completion_tokens(self.usage[1])
+        self.agent._token_process.sum_successful_requests(1)
+        return {'choices': [{'message': {'content': 'Thought: done\nFinal Answer: hold'}}]}
+
+    def test_pricing(self):
+        self.assertAlmostEqual(token_cost('gpt-4o', 1_000_000, 0), 2.5)
+        self.assertAlmostEqual(token_cost('openai/gpt-4o-mini', 0, 1_000_000), 0.6)
+
+    def test_agent_usage_comes_from_crewai_counters(self):
+        # Budgets depend on this private crewai counter; an upgrade that drops it must fail here
+        self.assertTrue(hasattr(self.agent._token_process, 'get_summary'))
+        self.fake_completion(messages=[{'role': 'user', 'content': 'Analyze'}])
+        usage = agent_token_usage(self.agent)
+        self.assertEqual((usage.prompt_tokens, usage.completion_tokens, usage.successful_requests), (120, 30, 1))
+
+    def test_agents_without_counters_report_no_usage(self):
+        with self.assertLogs('src.Helpers.token_budget', level='WARNING'):
+            usage = agent_token_usage(object())
+        self.assertEqual(usage.total_tokens, 0)
+
+    def test_long_descriptions_are_truncated_keeping_both_ends(self):
+        task = self.make_task('1.2345 ' * 5000)
+        budget = TokenBudget(per_task_tokens=200, ledger=self.ledger)
+        budget.fit_task(task)
+        self.assertTrue(task.description.startswith('Analyze this data.'))
+        self.assertTrue(task.description.endswith('Answer with buy, sell or hold.'))
+        self.assertIn('truncated', task.description)
+
+    def test_preflight_rejects_runs_over_the_crew_budget(self):
+        tasks = [self.make_task('x') for _ in range(3)]
+        with self.assertRaises(TokenBudgetExceeded):
+            TokenBudget(per_crew_tokens=500, ledger=self.ledger).preflight(tasks)
+
+    @patch('crewai.llm.litellm.completion')
+    def test_usage_is_recorded_per_task(self, completion):
+        completion.side_effect = self.fake_completion
+        crew = Crew(agents=[self.agent], tasks=[self.make_task('a'), self.make_task('b')],
+                    process=Process.sequential)
+        TokenBudget(ledger=self.ledger, crew_name='test').run(crew)
+
+        records = self.ledger.load()
+        self.assertEqual(len(records), 2)
+        self.assertEqual(list(records['total_tokens']), [150, 150])
+        self.assertEqual(records['run_id'].nunique(), 1)
+        self.assertAlmostEqual(records['cost_usd'].iloc[0], token_cost('gpt-4o', 120, 30))
+
+    @patch('crewai.llm.litellm.completion')
+    def test_inputs_are_truncated_before_the_run(self, completion):
+        completion.side_effect = self.fake_completion
+        crew = Crew(agents=[self.agent], tasks=[self.make_task('{prices}')], process=Process.sequential)
+        TokenBudget(per_task_tokens=200, ledger=self.ledger).run(crew, inputs={'prices': '1.2345 ' * 5000})
+        self.assertIn('truncated', self.prompts[0])
+        self.assertLess(len(self.prompts[0]), 5000)
+
+    @patch('crewai.llm.litellm.completion')
+    def test_run_stops_once_the_crew_budget_is_used(self, completion):
+        completion.side_effect = self.fake_completion
+        self.usage = (900, 100)
+        tasks = [self.make_task('a'), self.make_task('b'), self.make_task('c')]
+        crew = Crew(agents=[self.agent], tasks=tasks, process=Process.sequential)
+        with self.assertRaises(TokenBudgetExceeded):
+            TokenBudget(per_crew_tokens=1500, ledger=self.ledger).run(crew)
+        # The third task never ran
+        self.assertEqual(len(self.ledger.load()), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import os
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+from src.Helpers.article_scraper import ArticleScraper
+from src.Helpers.web_cache import WebCache, serper_request
+
+
+class TestWebCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = WebCache(':memory:', search_ttl_seconds=0.2, article_ttl_seconds=0.2)
+
+    def tearDown(self):
+        self.cache.close()
+
+    @patch.dict(os.environ, {'SERPER_API_KEY': 'test-key'})
+    @patch('src.Helpers.web_cache.requests.post')
+    def test_search_responses_are_cached_per_query(self, post):
+        post.return_value = MagicMock(json=MagicMock(return_value={'news': [{'title': 'AAPL beats'}]}))
+        for _ in range(3):
+            self.assertEqual(serper_request('news', 'AAPL', cache=self.cache)['news'][0]['title'], 'AAPL beats')
+        serper_request('search', 'AAPL', cache=self.cache)
+        self.assertEqual(post.call_count, 2)
+
+        time.sleep(0.25)
+        serper_request('news', 'AAPL', cache=self.cache)
+        self.assertEqual(post.call_count, 3)
+
+    def test_rerun_does_not_download_articles_again(self):
+        scraper = ArticleScraper(cache=self.cache)
+        with patch.object(scraper, 'download', return_value=MagicMock(text='<html/>', status_code=200,
+                                                                       headers={'ETag': '"v1"'})) as download, \
+                patch.object(scraper, 'extract', return_value='Article text'):
+            urls = ['https://news.example.com/a', 'https://news.example.com/b']
+            self.assertEqual(scraper.scrape_many(urls), ['Article text', 'Article text'])
+            self.assertEqual(scraper.scrape_many(urls), ['Article text', 'Article text'])
+            self.assertEqual(download.call_count, 2)
+        scraper.close()
+
+    def test_stale_article_is_revalidated_with_etag(self):
+        self.cache.set_article('https://news.example.com/a', 'Cached text', etag='"v1"')
+        time.sleep(0.25)
+        scraper = ArticleScraper(cache=self.cache)
+        not_modified = MagicMock(text='', status_code=304, headers={})
+        with patch.object(scraper, 'download', return_value=not_modified) as download:
+            self.assertEqual(scraper.scrape('https://news.example.com/a'), 'Cached text')
+            download.assert_called_once_with('https://news.example.com/a', headers={'If-None-Match': '"v1"'})
+        self.assertTrue(self.cache.get_article('https://news.example.com/a')['fresh'])
+        scraper.close()
+
+    def test_size_bound_evicts_least_recently_used(self):
+        cache = WebCache(':memory:', max_bytes=25)
+        cache.set_article('https://a', 'x' * 10)
+        cache.set_article('https://b', 'y' * 10)
+        cache.get_article('https://a')
+        cache.set_article('https://c', 'z' * 10)
+        self.assertIsNone(cache.get_article('https://b'))
+        self.assertIsNotNone(cache.get_article('https://a'))
+        self.assertEqual(cache.stats()['articles'], 2)
+        cache.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,555 @@
+######################################
+# Performance benchmarks for the indicators, the backtest engines and the caches.
+#
+# Run from the repository root:
+#   python -m src.Benchmarks.benchmark_suite --bars 100000 --symbols 500 --output bench.json
+#   python -m src.Benchmarks.benchmark_suite --bars 100000 --symbols 500 --compare bench.json
+#
+# Results are JSON so runs from different commits can be diffed; --compare exits
+# with status 1 when any benchmark got slower than the tolerance allows.
+#
+# Import-time budgets (each module is imported in a fresh interpreter):
+#   python -m src.Benchmarks.benchmark_suite --imports-only
+######################################
+import argparse
+import json
+import logging
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+import numpy as np
+import pandas as pd
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, REPO_ROOT)
+
+from src.Benchmarks.synthetic_data import make_close_matrix, make_filing_chunks, make_ohlcv, make_returns_matrix
+
+BENCHMARKS = []
+
+
+def benchmark(name, max_bars=None, max_symbols=None):
+    """
+    Register a benchmark. The decorated function receives a BenchmarkContext and returns
+    the zero-argument callable to time. Caps keep slow engines usable at large sizes;
+    the sizes actually used are recorded with the result.
+    """
+    def register(setup):
+        BENCHMARKS.append({
+            'name': name,
+            'setup': setup,
+            'max_bars': max_bars,
+            'max_symbols': max_symbols,
+        })
+        return setup
+    return register
+
+
+class BenchmarkContext:
+    def __init__(self, bars, symbols, seed=0):
+        """
+        Initializes the BenchmarkContext class.
+
+        Args:
+            bars (int): Bars per symbol requested on the command line.
+            symbols (int): Number of symbols for multi-asset benchmarks.
+            seed (int): Seed for the synthetic data.
+        """
+        self.requested_bars = bars
+        self.requested_symbols = symbols
+        self.bars = bars
+        self.symbols = symbols
+        self.seed = seed
+        self.tmp_dir = tempfile.mkdtemp(prefix='benchmarks_')
+        self._cache = {}
+
+    def limit(self, max_bars=None, max_symbols=None):
+        self.bars = min(self.requested_bars, max_bars) if max_bars else self.requested_bars
+        self.symbols = min(self.requested_symbols, max_symbols) if max_symbols else self.requested_symbols
+
+    def _cached(self, key, build):
+        if key not in self._cache:
+            self._cache[key] = build()
+        return self._cache[key]
+
+    def ohlcv(self, seed_offset=0) -> pd.DataFrame:
+        return self._cached(('ohlcv', self.bars, seed_offset),
+                            lambda: make_ohlcv(self.bars, seed=self.seed + seed_offset))
+
+    def close_matrix(self) -> pd.DataFrame:
+        return self._cached(('close', self.bars, self.symbols),
+                            lambda: make_close_matrix(self.bars, self.symbols, seed=self.seed))
+
+    def returns_matrix(self) -> np.ndarray:
+        return self._cached(('returns', self.bars, self.symbols),
+                            lambda: make_returns_matrix(self.bars, self.symbols, seed=self.seed))
+
+
+#### Indicators
+
+@benchmark('indicators.bollinger.calculate_bands')
+def bench_bollinger(ctx):
+    from src.Indicators.bollinger import BollingerBands
+    data = ctx.ohlcv()
+    return lambda: BollingerBands(data).calculate_bands()
+
+
+@benchmark('indicators.backtest_bollinger.calculate_bands')
+def bench_backtest_bollinger(ctx):
+    from src.Indicators.backtest_bollinger import BollingerBands
+    data = ctx.ohlcv()
+    return lambda: BollingerBands(data).calculate_bands()
+
+
+@benchmark('indicators.commodity_correlation.calculate')
+def bench_commodity_correlation(ctx):
+    from src.Indicators.commodity_correlation import CommodityCorrelationIndicator
+    stock, commodity = ctx.ohlcv(), ctx.ohlcv(seed_offset=1)
+    return lambda: CommodityCorrelationIndicator(stock, commodity).calculate()
+
+
+@benchmark('indicators.correlation.calculate')
+def bench_correlation(ctx):
+    from src.Indicators.correlation import CorrelationIndicator
+    stock1, stock2 = ctx.ohlcv(), ctx.ohlcv(seed_offset=1)
+    return lambda: CorrelationIndicator(stock1, stock2).calculate(stock1)
+
+
+@benchmark('indicators.fibonacci.calculate_levels')
+def bench_fibonacci(ctx):
+    from src.Indicators.fibonacci import FibonacciRetracement
+    data = ctx.ohlcv()
+    return lambda: FibonacciRetracement(data).calculate_levels()
+
+
+@benchmark('indicators.macd.calculate_macd')
+def bench_macd(ctx):
+    from src.Indicators.macd import MACDIndicator
+    data = ctx.ohlcv()
+    # calculate_macd adds columns to its input, so each call gets a fresh copy
+    return lambda: MACDIndicator(data.copy()).calculate_macd()
+
+
+@benchmark('indicators.macd_indicator.calculate')
+def bench_macd_indicator(ctx):
+    from src.Indicators.macd_indicator import MACDIndicator
+    data = ctx.ohlcv()
+    return lambda: MACDIndicator().calculate(data)
+
+
+@benchmark('indicators.rsi.calculate')
+def bench_rsi(ctx):
+    from src.Indicators.rsi import RSIIndicator
+    data = ctx.ohlcv()
+    return lambda: RSIIndicator().calculate(data.copy())
+
+
+@benchmark('indicators.rsi_divergence.calculate')
+def bench_rsi_divergence(ctx):
+    from src.Indicators.rsi_divergence import RSIIndicator
+    data = ctx.ohlcv()
+    return lambda: RSIIndicator().calculate(data)
+
+
+@benchmark('indicators.sma.calculate')
+def bench_sma(ctx):
+    from src.Indicators.sma import SMAIndicator
+    data = ctx.ohlcv()
+    return lambda: SMAIndicator().calculate(data.copy())
+
+
+@benchmark('indicators.vwap.calculate', max_bars=2_000_000)
+def bench_vwap(ctx):
+    from src.Indicators.vwap import VWAPIndicator
+    data = ctx.ohlcv()
+    return lambda: VWAPIndicator().calculate(data.copy())
+
+
+@benchmark('indicators.detect_divergence.bullish_and_bearish', max_bars=2_000_000)
+def bench_divergence_detector(ctx):
+    from src.Indicators.detect_divergence import DivergenceDetector
+    from src.Indicators.rsi_divergence import RSIIndicator
+    data = ctx.ohlcv()
+    rsi = RSIIndicator().calculate(data)
+
+    def run():
+        detector = DivergenceDetector(data, rsi, 'RSI')
+        return detector.detect_bullish_divergence(), detector.detect_bearish_divergence()
+    return run
+
+
+#### Backtest engines
+
+@benchmark('backtest.performance_metrics.single')
+def bench_metrics_single(ctx):
+    from src.Backtesting.performance_metrics import compute_metrics
+    returns = ctx.returns_matrix()[:, 0]
+    return lambda: compute_metrics(returns)
+
+
+@benchmark('backtest.performance_metrics.sweep', max_bars=20_000, max_symbols=5_000)
+def bench_metrics_sweep(ctx):
+    from src.Backtesting.performance_metrics import compute_metrics
+    returns = ctx.returns_matrix()
+    return lambda: compute_metrics(returns)
+
+
+@benchmark('backtest.monte_carlo.block_10k_paths', max_bars=5_040)
+def bench_monte_carlo(ctx):
+    from src.Backtesting.monte_carlo import MonteCarloBootstrap
+    returns = ctx.returns_matrix()[:, 0]
+    return lambda: MonteCarloBootstrap(returns, n_paths=10_000, seed=ctx.seed).run()
+
+
+@benchmark('backtest.portfolio.monthly_rebalance', max_bars=20_000, max_symbols=5_000)
+def bench_portfolio_monthly(ctx):
+    from src.Backtesting.backtest_portfolio import PortfolioBacktester
+    prices = ctx.close_matrix()
+    weights = {ticker: 1.0 / ctx.symbols for ticker in prices.columns}
+    return lambda: PortfolioBacktester(prices, weights, rebalance='M').run()
+
+
+@benchmark('backtest.portfolio.drift_rebalance', max_bars=20_000, max_symbols=5_000)
+def bench_portfolio_drift(ctx):
+    from src.Backtesting.backtest_portfolio import PortfolioBacktester
+    prices = ctx.close_matrix()
+    weights = {ticker: 1.0 / ctx.symbols for ticker in prices.columns}
+    return lambda: PortfolioBacktester(prices, weights, rebalance=None, drift_threshold=0.05).run()
+
+
+@benchmark('backtest.backtrader.sma_cross', max_bars=100_000)
+def bench_backtrader_sma(ctx):
+    import backtrader as bt
+    from src.Backtesting.backtest_sma import SmaCross
+    from src.Backtesting.performance_metrics import add_metric_analyzers, metrics_from_strategy
+    data = ctx.ohlcv()
+
+    def run():
+        cerebro = bt.Cerebro(stdstats=False)
+        cerebro.addstrategy(SmaCross)
+        cerebro.adddata(bt.feeds.PandasData(dataname=data))
+        cerebro.broker.setcash(100000.0)
+        add_metric_analyzers(cerebro)
+        return metrics_from_strategy(cerebro.run()[0])
+    return run
+
+
+#### Caches
+
+@benchmark('cache.data_fingerprint')
+def bench_data_fingerprint(ctx):
+    from src.Backtesting.results_store import data_fingerprint
+    data = ctx.ohlcv()
+    return lambda: data_fingerprint(data)
+
+
+def _populated_store(ctx, runs=1_000):
+    from src.Backtesting.results_store import BacktestResultsStore
+    store = BacktestResultsStore(os.path.join(ctx.tmp_dir, f'results_{len(os.listdir(ctx.tmp_dir))}.db'))
+    rng = np.random.default_rng(ctx.seed)
+    for i in range(runs):
+        store.save({'strategy': 'bench', 'run': i}, 'fingerprint', f'bench-{i}',
+                   {'sharpe_ratio': rng.normal(), 'max_drawdown': rng.random()})
+    return store
+
+
+@benchmark('cache.results_store.hit')
+def bench_results_store_hit(ctx):
+    store = _populated_store(ctx)
+    return lambda: store.load({'strategy': 'bench', 'run': 500}, 'fingerprint')
+
+
+@benchmark('cache.results_store.miss')
+def bench_results_store_miss(ctx):
+    store = _populated_store(ctx)
+    return lambda: store.load({'strategy': 'bench', 'run': -1}, 'fingerprint')
+
+
+@benchmark('cache.results_store.best_of_last_500')
+def bench_results_store_best(ctx):
+    store = _populated_store(ctx)
+    return lambda: store.best('sharpe_ratio', last_n=500)
+
+
+#### Retrieval
+
+# About ten large 10-K filings of 1,000-character chunks
+FILING_CHUNKS = 2_000
+FILING_QUESTIONS = ('net revenue growth by segment', 'supplier risk and inventory impairment',
+                    'dividend per share and cash flow', 'litigation and regulation expense')
+
+
+@benchmark('retrieval.bm25_build')
+def bench_bm25_build(ctx):
+    from src.Helpers.lexical_index import BM25Index
+    chunks = ctx._cached('filing_chunks', lambda: make_filing_chunks(FILING_CHUNKS, seed=ctx.seed))
+    return lambda: BM25Index.build(chunks)
+
+
+@benchmark('retrieval.bm25_search')
+def bench_bm25_search(ctx):
+    from src.Helpers.lexical_index import BM25Index
+    chunks = ctx._cached('filing_chunks', lambda: make_filing_chunks(FILING_CHUNKS, seed=ctx.seed))
+    index = BM25Index.build(chunks)
+    return lambda: [index.search(question, k=4) for question in FILING_QUESTIONS]
+
+
+#### Import-time budgets
+
+LLM_STACK = ('crewai', 'litellm', 'langchain_openai')
+TOOL_DEPENDENCIES = ('selenium', 'unstructured', 'faiss', 'sec_api', 'newspaper')
+
+# Module -> (seconds allowed for a cold import, packages the import must not load)
+IMPORT_BUDGETS = {
+    'src.globals': (1.0, LLM_STACK),
+    'src.Helpers.llm_registry': (1.0, LLM_STACK),
+    'src.Indicators.bollinger': (1.5, LLM_STACK + TOOL_DEPENDENCIES),
+    'src.Indicators.macd': (1.5, LLM_STACK + TOOL_DEPENDENCIES),
+    'src.Backtesting.performance_metrics': (1.5, LLM_STACK + TOOL_DEPENDENCIES),
+    'src.Backtesting.results_store': (1.5, LLM_STACK + TOOL_DEPENDENCIES),
+    'src.Helpers.token_budget': (1.5, LLM_STACK + TOOL_DEPENDENCIES),
+    'src.Agents.Analysis.Tools.browser_tools': (3.0, ('crewai',) + TOOL_DEPENDENCIES),
+    'src.Agents.Analysis.Tools.calculator_tools': (3.0, ('crewai',) + TOOL_DEPENDENCIES),
+    'src.Agents.Analysis.Tools.search_tools': (3.0, ('crewai',) + TOOL_DEPENDENCIES),
+    'src.Agents.Analysis.Tools.sec_tools': (3.0, ('crewai',) + TOOL_DEPENDENCIES),
+    'src.Agents.Bollinger_agent.bollinger_agent': (10.0, TOOL_DEPENDENCIES),
+}
+
+IMPORT_PROBE = """
+import importlib, json, sys, time
+start = time.perf_counter()
+importlib.import_module(sys.argv[1])
+elapsed = time.perf_counter() - start
+print(json.dumps({'seconds': elapsed, 'loaded': [name for name in sys.argv[2:] if name in sys.modules]}))
+"""
+
+
+def measure_import(module: str, watch=(), repeat: int = 3, timeout: float = 120.0) -> dict:
+    """
+    Import module in fresh interpreters and report the fastest of repeat cold imports.
+
+    Returns:
+        dict: 'seconds' and the packages of watch that the import loaded ('loaded'),
+            or 'error' with the last line of the failing interpreter's output.
+    """
+    best = None
+    for _ in range(repeat):
+        process = subprocess.run([sys.executable, '-c', IMPORT_PROBE, module, *watch], cwd=REPO_ROOT,
+                                 capture_output=True, text=True, timeout=timeout)
+        if process.returncode != 0:
+            lines = process.stderr.strip().splitlines()
+            return {'error': lines[-1] if lines else f'exit status {process.returncode}'}
+        result = json.loads(process.stdout.strip().splitlines()[-1])
+        if best is None or result['seconds'] < best['seconds']:
+            best = result
+    return best
+
+
+def check_import_budgets(budgets: dict = None, repeat: int = 3, name_filter=None) -> list:
+    """
+    Measure the cold import time of every module in budgets (IMPORT_BUDGETS by default).
+
+    Returns:
+        list: One entry per module. Status 'over_budget' when the import took longer than
+            allowed or loaded a package it must not load, 'skipped' when a dependency is missing.
+    """
+    results = []
+    for module, (budget_s, forbidden) in (budgets or IMPORT_BUDGETS).items():
+        name = f'import.{module}'
+        if name_filter and name_filter not in name:
+            continue
+        entry = {'name': name, 'budget_s': budget_s}
+        measured = measure_import(module, forbidden, repeat=repeat)
+        if 'error' in measured:
+            missing = 'ModuleNotFoundError' in measured['error'] or 'ImportError' in measured['error']
+            entry.update(status='skipped' if missing else 'error', reason=measured['error'])
+        else:
+            over = measured['seconds'] > budget_s or measured['loaded']
+            entry.update(status='over_budget' if over else 'ok', seconds=measured['seconds'],
+                         loaded=measured['loaded'])
+        results.append(entry)
+        print(format_import_entry(entry), file=sys.stderr)
+    return results
+
+
+def format_import_entry(entry) -> str:
+    if 'seconds' not in entry:
+        return f"{entry['name']:<60} {entry['status'].upper()}: {entry['reason']}"
+    loaded = f"  loads {', '.join(entry['loaded'])}" if entry['loaded'] else ''
+    return (f"{entry['name']:<60} {entry['seconds'] * 1000:8.0f} ms of {entry['budget_s'] * 1000:6.0f} ms"
+            f"  {entry['status'].upper()}{loaded}")
+
+
+#### Runner
+
+def time_callable(fn, repeat, max_seconds):
+    """
+    Time fn() after one warm-up call. Stops early once max_seconds have been spent.
+    """
+    fn()
+    timings = []
+    budget_start = time.perf_counter()
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+        if time.perf_counter() - budget_start > max_seconds:
+            break
+    return timings
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(bars, symbols, repeat=5, max_seconds=10.0, name_filter=None, seed=0) -> dict:
+    """
+    Run every registered benchmark whose name contains name_filter.
+
+    Returns:
+        dict: 'meta' describing the environment and 'results' with one entry per benchmark.
+    """
+    ctx = BenchmarkContext(bars, symbols, seed=seed)
+    results = []
+    try:
+        for spec in BENCHMARKS:
+            if name_filter and name_filter not in spec['name']:
+                continue
+            ctx.limit(spec['max_bars'], spec['max_symbols'])
+            entry = {'name': spec['name'], 'bars': ctx.bars, 'symbols': ctx.symbols}
+            try:
+                fn = spec['setup'](ctx)
+                timings = time_callable(fn, repeat, max_seconds)
+            except ImportError as e:
+                entry.update(status='skipped', reason=f'missing dependency: {e.name or e}')
+            except Exception as e:
+                entry.update(status='error', reason=f'{type(e).__name__}: {e}')
+            else:
+                entry.update(
+                    status='ok',
+                    runs=len(timings),
+                    min_s=min(timings),
+                    median_s=float(np.median(timings)),
+                    max_s=max(timings),
+                )
+            results.append(entry)
+            print(format_entry(entry), file=sys.stderr)
+    finally:
+        shutil.rmtree(ctx.tmp_dir, ignore_errors=True)
+
+    return {
+        'meta': {
+            'timestamp': datetime.now().isoformat(),
+            'commit': git_commit(),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'pandas': pd.__version__,
+            'platform': platform.platform(),
+            'bars': bars,
+            'symbols': symbols,
+            'repeat': repeat,
+            'seed': seed,
+        },
+        'results': results,
+    }
+
+
+def format_entry(entry) -> str:
+    size = f"{entry['bars']:>10,} bars x {entry['symbols']:>5,}"
+    if entry['status'] != 'ok':
+        return f"{entry['name']:<50} {size}  {entry['status'].upper()}: {entry['reason']}"
+    return f"{entry['name']:<50} {size}  median {entry['median_s'] * 1000:10.3f} ms  min {entry['min_s'] * 1000:10.3f} ms"
+
+
+def compare(current: dict, baseline: dict, tolerance: float = 0.25) -> list:
+    """
+    Compare two benchmark reports.
+
+    Returns:
+        list: Regressions as dicts with name, baseline and current medians and the ratio.
+            A benchmark regresses when its median is more than (1 + tolerance) times the baseline
+            at the same data size.
+    """
+    key = lambda entry: (entry['name'], entry['bars'], entry['symbols'])
+    previous = {key(entry): entry for entry in baseline['results'] if entry['status'] == 'ok'}
+    regressions = []
+    for entry in current['results']:
+        before = previous.get(key(entry))
+        if entry['status'] != 'ok' or before is None:
+            continue
+        ratio = entry['median_s'] / before['median_s'] if before['median_s'] > 0 else float('inf')
+        print(f"{entry['name']:<50} {before['median_s'] * 1000:10.3f} ms -> "
+              f"{entry['median_s'] * 1000:10.3f} ms  x{ratio:.2f}", file=sys.stderr)
+        if ratio > 1.0 + tolerance:
+            regressions.append({
+                'name': entry['name'],
+                'baseline_s': before['median_s'],
+                'current_s': entry['median_s'],
+                'ratio': ratio,
+            })
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark indicators, backtests and caches.')
+    parser.add_argument('--bars', type=int, default=10_000, help='bars per symbol (1k to 10M)')
+    parser.add_argument('--symbols', type=int, default=50, help='symbols for multi-asset benchmarks (1 to 5,000)')
+    parser.add_argument('--repeat', type=int, default=5, help='timed runs per benchmark')
+    parser.add_argument('--max-seconds', type=float, default=10.0, help='time budget per benchmark')
+    parser.add_argument('--filter', default=None, help='only run benchmarks whose name contains this')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default=None, help='write the JSON report to this file')
+    parser.add_argument('--compare', default=None, help='baseline JSON report to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='allowed slowdown before failing')
+    parser.add_argument('--verbose', action='store_true', help='keep INFO logging from the code under test')
+    parser.add_argument('--imports', action='store_true', help='also check import-time budgets')
+    parser.add_argument('--imports-only', action='store_true', help='only check import-time budgets')
+    args = parser.parse_args(argv)
+
+    if not args.verbose:
+        # Strategies log every trade, which would dominate the timings
+        logging.disable(logging.INFO)
+
+    if args.imports_only:
+        report = {'meta': {'timestamp': datetime.now().isoformat(), 'commit': git_commit(),
+                           'python': platform.python_version()}, 'results': []}
+    else:
+        report = run_benchmarks(args.bars, args.symbols, repeat=args.repeat, max_seconds=args.max_seconds,
+                                name_filter=args.filter, seed=args.seed)
+    if args.imports or args.imports_only:
+        report['imports'] = check_import_budgets(name_filter=args.filter)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} benchmark(s) regressed by more than {args.tolerance:.0%}:", file=sys.stderr)
+            for regression in regressions:
+                print(f"  {regression['name']}: x{regression['ratio']:.2f}", file=sys.stderr)
+            return 1
+
+    over_budget = [entry['name'] for entry in report.get('imports', []) if entry['status'] == 'over_budget']
+    if over_budget:
+        print(f"\n{len(over_budget)} module(s) over their import budget: {', '.join(over_budget)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
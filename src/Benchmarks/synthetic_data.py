@@ -0,0 +1,94 @@
+import numpy as np
+import pandas as pd
+
+# Business days from 2000 run past the pandas timestamp limit after ~68k bars,
+# so larger series switch to minute bars.
+MAX_DAILY_BARS = 50_000
+
+
+def make_index(n_bars: int, freq: str = None, start: str = '2000-01-03') -> pd.DatetimeIndex:
+    """
+    Build a DatetimeIndex of n_bars bars. Daily business bars by default, minute bars for long series.
+    """
+    if freq is None:
+        freq = 'B' if n_bars <= MAX_DAILY_BARS else 'min'
+    return pd.date_range(start=start, periods=n_bars, freq=freq)
+
+
+def make_ohlcv(n_bars: int, seed: int = 0, freq: str = None, start_price: float = 100.0,
+               drift: float = 0.0003, volatility: float = 0.015) -> pd.DataFrame:
+    """
+    Generate a geometric random walk with consistent Open/High/Low/Close/Volume columns.
+
+    Args:
+        n_bars (int): Number of bars.
+        seed (int): Random seed, so every benchmark run sees identical data.
+        freq (str, optional): Pandas frequency of the index.
+        start_price (float): First open price.
+        drift (float): Mean log return per bar.
+        volatility (float): Standard deviation of the log return per bar.
+
+    Returns:
+        pd.DataFrame: OHLCV data indexed by timestamp.
+    """
+    rng = np.random.default_rng(seed)
+    log_returns = rng.normal(drift, volatility, n_bars)
+    close = start_price * np.exp(np.cumsum(log_returns))
+    open_ = np.concatenate([[start_price], close[:-1]])
+    spread = np.abs(rng.normal(0.0, volatility / 2, n_bars))
+    high = np.maximum(open_, close) * (1.0 + spread)
+    low = np.minimum(open_, close) * (1.0 - spread)
+    volume = rng.integers(100_000, 5_000_000, n_bars).astype(np.float64)
+
+    return pd.DataFrame({
+        'Open': open_,
+        'High': high,
+        'Low': low,
+        'Close': close,
+        'Volume': volume,
+    }, index=make_index(n_bars, freq))
+
+
+def make_close_matrix(n_bars: int, n_symbols: int, seed: int = 0, freq: str = None,
+                      drift: float = 0.0003, volatility: float = 0.015) -> pd.DataFrame:
+    """
+    Generate aligned close prices for many symbols with a shared market factor.
+
+    Returns:
+        pd.DataFrame: One column per symbol ('SYM0000', 'SYM0001', ...), indexed by timestamp.
+    """
+    rng = np.random.default_rng(seed)
+    market = rng.normal(drift, volatility / 2, (n_bars, 1))
+    idiosyncratic = rng.normal(0.0, volatility, (n_bars, n_symbols))
+    close = 100.0 * np.exp(np.cumsum(market + idiosyncratic, axis=0))
+    columns = [f'SYM{i:04d}' for i in range(n_symbols)]
+    return pd.DataFrame(close, index=make_index(n_bars, freq), columns=columns)
+
+
+def make_returns_matrix(n_bars: int, n_strategies: int, seed: int = 0,
+                        drift: float = 0.0003, volatility: float = 0.01) -> np.ndarray:
+    """
+    Generate per-bar returns for many strategies, time along axis 0.
+    """
+    rng = np.random.default_rng(seed)
+    return rng.normal(drift, volatility, (n_bars, n_strategies))
+
+
+FILING_VOCABULARY = (
+    'revenue', 'net', 'income', 'operating', 'margin', 'segment', 'risk', 'supplier', 'dividend', 'share',
+    'cash', 'flow', 'debt', 'interest', 'tax', 'quarter', 'fiscal', 'growth', 'decline', 'customer',
+    'litigation', 'regulation', 'inventory', 'impairment', 'goodwill', 'lease', 'currency', 'exchange',
+    'guidance', 'expense', 'research', 'development', 'services', 'products', 'subscription', 'backlog',
+)
+
+
+def make_filing_chunks(n_chunks: int, seed: int = 0, words_per_chunk: int = 150) -> list:
+    """
+    Generate text chunks resembling a financial filing: Zipf-distributed vocabulary words mixed with figures.
+    """
+    rng = np.random.default_rng(seed)
+    vocabulary = np.array(FILING_VOCABULARY + tuple(f'term{i}' for i in range(2_000)))
+    ranks = np.minimum(rng.zipf(1.3, (n_chunks, words_per_chunk)), len(vocabulary)) - 1
+    figures = rng.integers(1, 100_000, (n_chunks, 5))
+    return [' '.join(vocabulary[row]) + ' ' + ' '.join(f'{figure:,}' for figure in numbers)
+            for row, numbers in zip(ranks, figures)]
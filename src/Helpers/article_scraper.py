@@ -0,0 +1,145 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+import requests
+from requests.adapters import HTTPAdapter
+from src.Helpers.text_extraction import collapse_whitespace, extract_text
+from src.Helpers.web_cache import WebCache, conditional_headers, get_web_cache
+
+DEFAULT_MAX_WORKERS = 8
+# Seconds for connecting to a site and for each read from it
+DEFAULT_TIMEOUT = 10.0
+# Seconds on top of the per-request timeout before a batch gives up on slow articles
+DEFAULT_GRACE = 2.0
+USER_AGENT = 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36'
+
+
+class ArticleScraper:
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS, timeout: float = DEFAULT_TIMEOUT,
+                 grace: float = DEFAULT_GRACE, session: requests.Session = None, cache: WebCache = None):
+        """
+        Initializes the ArticleScraper class.
+
+        Downloads news articles concurrently over one pooled HTTP session and extracts their text,
+        so a batch of articles takes as long as its slowest article rather than the sum of all.
+
+        Args:
+            max_workers (int): Articles downloaded at the same time.
+            timeout (float): Connect and read timeout of each download, in seconds.
+            grace (float): Extra seconds a batch waits beyond timeout before returning without
+                the articles still downloading.
+            session (requests.Session, optional): Session to download with. A pooled one is created if None.
+            cache (WebCache, optional): Cache of article texts. The shared web cache if None.
+        """
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.grace = grace
+        self.session = session or self._create_session(max_workers)
+        self.cache = cache
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='article')
+
+    @staticmethod
+    def _create_session(pool_size: int) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers['User-Agent'] = USER_AGENT
+        return session
+
+    def download(self, url: str, headers: dict = None) -> requests.Response:
+        response = self.session.get(url, timeout=self.timeout, headers=headers)
+        if response.status_code != 304:
+            response.raise_for_status()
+        return response
+
+    def extract(self, html: str, url: str) -> str:
+        """
+        Main text of an article page, parsed with newspaper3k. Pages newspaper3k finds no text in
+        go through the generic main-content extraction instead.
+        """
+        # newspaper3k is slow to import; load it only when articles are scraped
+        from newspaper import Article
+        article = Article(url)
+        article.download(input_html=html)
+        article.parse()
+        return collapse_whitespace(article.text) or extract_text(html)
+
+    def scrape(self, url: str) -> str:
+        """
+        Download and extract one article. A cached text is returned without a request while it is
+        fresh; a stale one is revalidated with a conditional request.
+
+        Returns:
+            str: The article text, or an error message if it could not be scraped.
+        """
+        cache = self.cache or get_web_cache()
+        entry = cache.get_article(url) if cache is not None else None
+        if entry is not None and entry['fresh']:
+            return entry['text']
+        try:
+            response = self.download(url, headers=conditional_headers(entry))
+            if entry is not None and response.status_code == 304:
+                cache.revalidate_article(url)
+                return entry['text']
+            text = self.extract(response.text, url)
+            if cache is not None:
+                cache.set_article(url, text, response.headers.get('ETag'), response.headers.get('Last-Modified'))
+            return text
+        except requests.exceptions.RequestException as e:
+            return f"Error: Failed to scrape the article. Details: {e}"
+        except Exception as e:
+            return f"Error: An unexpected error occurred while scraping the article. Details: {e}"
+
+    def scrape_many(self, urls, deadline: float = None) -> list:
+        """
+        Scrape urls concurrently.
+
+        Args:
+            urls (list): Article URLs.
+            deadline (float, optional): Seconds to wait for the whole batch. Defaults to timeout + grace.
+
+        Returns:
+            list: Text or error message for each URL, in order. Articles not finished by the
+                deadline get a timeout message instead of holding up the others.
+        """
+        urls = list(urls)
+        if not urls:
+            return []
+        deadline = self.timeout + self.grace if deadline is None else deadline
+        futures = [self._executor.submit(self.scrape, url) for url in urls]
+        done, pending = wait(futures, timeout=deadline)
+        for future in pending:
+            future.cancel()
+        if pending:
+            self.logger.warning(f"{len(pending)} of {len(urls)} articles not scraped within {deadline:.1f}s")
+        return [future.result() if future in done
+                else f"Error: Timed out scraping the article after {deadline:.1f}s."
+                for future in futures]
+
+    def close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.session.close()
+
+
+_scraper = None
+_scraper_lock = threading.Lock()
+
+
+def get_article_scraper() -> ArticleScraper:
+    """
+    The process-wide scraper shared by the news tools.
+    """
+    global _scraper
+    with _scraper_lock:
+        if _scraper is None:
+            _scraper = ArticleScraper()
+    return _scraper
+
+
+def scrape_articles(urls, deadline: float = None) -> list:
+    """
+    Texts of the articles at urls, scraped concurrently by the shared scraper.
+    """
+    return get_article_scraper().scrape_many(urls, deadline=deadline)
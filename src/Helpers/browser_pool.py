@@ -0,0 +1,210 @@
+import atexit
+import logging
+import os
+import platform
+import queue
+import re
+import threading
+import time
+from contextlib import contextmanager
+import requests
+from src.Helpers.article_scraper import get_article_scraper
+
+DEFAULT_POOL_SIZE = 2
+# Chrome's memory grows with every page; a driver is replaced after this many
+DEFAULT_MAX_PAGES = 50
+DEFAULT_PAGE_TIMEOUT = 20.0
+DEFAULT_FETCH_TIMEOUT = 10.0
+# A page whose static HTML has less visible text than this is rendered in the browser
+MIN_STATIC_TEXT = 500
+
+CHROME_ARGUMENTS = (
+    "--headless",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--ignore-certificate-errors",
+    "--disable-gpu",
+    "--disable-features=NetworkService",
+    "--disable-software-rasterizer",
+    "--log-level=3",
+)
+
+_SCRIPT_OR_STYLE = re.compile(r'<(script|style|noscript)\b.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+_TAG = re.compile(r'<[^>]+>')
+_JS_REQUIRED = re.compile(r'(enable|requires?)\s+javascript', re.IGNORECASE)
+
+
+def chrome_driver():
+    """
+    New headless Chrome driver using the chromedriver binary in ./chromedriver.
+    """
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+
+    chrome_options = Options()
+    for argument in CHROME_ARGUMENTS:
+        chrome_options.add_argument(argument)
+    if platform.system() == "Windows":
+        service = Service('chromedriver/chromedriver.exe')
+    else:
+        service = Service('chromedriver/chromedriver')
+    return webdriver.Chrome(service=service, options=chrome_options)
+
+
+def needs_javascript(html: str) -> bool:
+    """
+    True if a page's static HTML holds too little text to be the rendered page.
+    """
+    text = _TAG.sub(' ', _SCRIPT_OR_STYLE.sub(' ', html))
+    visible = len(' '.join(text.split()))
+    return visible < MIN_STATIC_TEXT or (visible < 4 * MIN_STATIC_TEXT and bool(_JS_REQUIRED.search(html)))
+
+
+class BrowserPool:
+    def __init__(self, size: int = DEFAULT_POOL_SIZE, max_pages: int = DEFAULT_MAX_PAGES,
+                 page_timeout: float = DEFAULT_PAGE_TIMEOUT, driver_factory=chrome_driver):
+        """
+        Initializes the BrowserPool class.
+
+        Keeps up to size browser drivers warm and lends them out to render pages, instead of
+        starting and quitting Chrome for every page.
+
+        Args:
+            size (int): Drivers open at the same time; further callers wait for a free one.
+            max_pages (int): Pages a driver renders before it is quit and replaced.
+            page_timeout (float): Seconds a page may take to load and reach document.readyState 'complete'.
+            driver_factory (callable): Creates a new driver.
+        """
+        self.size = size
+        self.max_pages = max_pages
+        self.page_timeout = page_timeout
+        self.driver_factory = driver_factory
+        self.created = 0
+        self.recycled = 0
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+
+    def _healthy(self, driver) -> bool:
+        try:
+            driver.execute_script("return document.readyState")
+            return True
+        except Exception as e:
+            self.logger.info(f"Replacing unresponsive browser: {e}")
+            return False
+
+    def _quit(self, driver):
+        try:
+            driver.quit()
+        except Exception as e:
+            self.logger.debug(f"Error quitting browser: {e}")
+
+    @contextmanager
+    def driver(self):
+        """
+        Borrow a healthy driver. It goes back to the pool afterwards, or is quit once it has
+        rendered max_pages pages or failed.
+        """
+        self._slots.acquire()
+        driver, pages = None, 0
+        try:
+            try:
+                driver, pages = self._idle.get_nowait()
+                if not self._healthy(driver):
+                    self._quit(driver)
+                    driver = None
+            except queue.Empty:
+                pass
+            if driver is None:
+                driver, pages = self.driver_factory(), 0
+                driver.set_page_load_timeout(self.page_timeout)
+                self.created += 1
+            try:
+                yield driver
+            except Exception:
+                self._quit(driver)
+                driver = None
+                raise
+            pages += 1
+            if pages >= self.max_pages:
+                self._quit(driver)
+                self.recycled += 1
+            else:
+                self._idle.put((driver, pages))
+        finally:
+            self._slots.release()
+
+    def _wait_until_ready(self, driver):
+        deadline = time.monotonic() + self.page_timeout
+        while driver.execute_script("return document.readyState") != 'complete':
+            if time.monotonic() > deadline:
+                self.logger.warning(f"Page not ready after {self.page_timeout:.0f}s, using it as it is")
+                return
+            time.sleep(0.05)
+
+    def render(self, url: str) -> str:
+        """
+        HTML of url after the browser has loaded it and run its scripts.
+        """
+        with self.driver() as driver:
+            driver.get(url)
+            self._wait_until_ready(driver)
+            return driver.page_source
+
+    def close(self):
+        """
+        Quit all idle drivers.
+        """
+        while True:
+            try:
+                driver, _ = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._quit(driver)
+
+    def stats(self) -> dict:
+        return {'created': self.created, 'recycled': self.recycled, 'idle': self._idle.qsize()}
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_browser_pool() -> BrowserPool:
+    """
+    The process-wide pool, sized from BROWSER_POOL_SIZE and BROWSER_MAX_PAGES. Its browsers are
+    quit when the process exits.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = BrowserPool(size=int(os.getenv("BROWSER_POOL_SIZE", DEFAULT_POOL_SIZE)),
+                                max_pages=int(os.getenv("BROWSER_MAX_PAGES", DEFAULT_MAX_PAGES)))
+            atexit.register(_pool.close)
+    return _pool
+
+
+def fetch_page(url: str, pool: BrowserPool = None, session: requests.Session = None) -> str:
+    """
+    HTML of a web page. Pages whose static HTML already holds their content are fetched with a
+    plain HTTP request; others, and pages the request fails for, are rendered in a pooled browser.
+
+    Args:
+        url (str): Page URL.
+        pool (BrowserPool, optional): Pool to render with instead of the shared one.
+        session (requests.Session, optional): Session for the plain request. The article scraper's if None.
+
+    Returns:
+        str: The page HTML.
+    """
+    session = session or get_article_scraper().session
+    try:
+        response = session.get(url, timeout=DEFAULT_FETCH_TIMEOUT)
+        response.raise_for_status()
+        # Only HTML can depend on scripts; other content is returned as it is
+        if 'html' not in response.headers.get('Content-Type', 'text/html') or not needs_javascript(response.text):
+            return response.text
+    except requests.exceptions.RequestException as e:
+        logging.getLogger(__name__).info(f"Plain fetch of {url} failed, rendering it instead: {e}")
+    return (pool or get_browser_pool()).render(url)
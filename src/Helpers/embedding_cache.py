@@ -0,0 +1,189 @@
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import threading
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+DEFAULT_CACHE_DIR = "./embedding_cache"
+# OpenAI accepts up to 2048 inputs per embedding request
+DEFAULT_BATCH_SIZE = 1000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS models (
+    model TEXT PRIMARY KEY,
+    dim INTEGER NOT NULL,
+    rows INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS embeddings (
+    model TEXT NOT NULL,
+    text_hash TEXT NOT NULL,
+    row INTEGER NOT NULL,
+    PRIMARY KEY (model, text_hash)
+);
+"""
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def model_name(embeddings) -> str:
+    """
+    Name identifying the vectors an embeddings client produces, e.g. 'OpenAIEmbeddings:text-embedding-ada-002'.
+    """
+    model = getattr(embeddings, 'model', None) or getattr(embeddings, 'model_name', None)
+    return f"{type(embeddings).__name__}:{model}" if model else type(embeddings).__name__
+
+
+class EmbeddingCache:
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR):
+        """
+        Initializes the EmbeddingCache class.
+
+        Keeps embedding vectors keyed by (model, text hash). The vectors of a model are appended
+        as float32 rows to one array file, and a SQLite index maps each key to its row, so
+        boilerplate that recurs across filings and companies is embedded once.
+
+        Args:
+            cache_dir (str): Directory of the index database and the per-model vector files.
+        """
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+        self.conn = sqlite3.connect(os.path.join(cache_dir, 'index.db'), check_same_thread=False)
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def _vector_path(self, model: str) -> str:
+        return os.path.join(self.cache_dir, re.sub(r'[^A-Za-z0-9_.-]+', '_', model) + '.f32')
+
+    def _rows(self, model: str, hashes) -> dict:
+        rows = {}
+        unique = list(dict.fromkeys(hashes))
+        # SQLite limits the number of bound parameters per statement
+        for start in range(0, len(unique), 500):
+            part = unique[start:start + 500]
+            rows.update(self.conn.execute(
+                f"SELECT text_hash, row FROM embeddings WHERE model = ? AND text_hash IN "
+                f"({','.join('?' * len(part))})", [model] + part
+            ).fetchall())
+        return rows
+
+    def get_many(self, model: str, hashes: list) -> dict:
+        """
+        Cached vectors of the given text hashes, as {hash: list of floats}. Missing hashes are left out.
+        """
+        found = {}
+        with self._lock:
+            meta = self.conn.execute("SELECT dim FROM models WHERE model = ?", (model,)).fetchone()
+            if meta is not None:
+                dim = meta[0]
+                rows = self._rows(model, hashes)
+                if rows:
+                    vectors = np.memmap(self._vector_path(model), dtype=np.float32, mode='r').reshape(-1, dim)
+                    found = {key: vectors[row].tolist() for key, row in rows.items()}
+            self.hits += sum(1 for key in hashes if key in found)
+            self.misses += sum(1 for key in hashes if key not in found)
+        return found
+
+    def set_many(self, model: str, items: dict):
+        """
+        Store vectors given as {text hash: vector}. Hashes already stored are skipped.
+        """
+        if not items:
+            return
+        with self._lock:
+            existing = self._rows(model, items)
+            new = [(key, vector) for key, vector in items.items() if key not in existing]
+            if not new:
+                return
+            array = np.asarray([vector for _, vector in new], dtype=np.float32)
+            meta = self.conn.execute("SELECT dim, rows FROM models WHERE model = ?", (model,)).fetchone()
+            dim, first_row = (array.shape[1], 0) if meta is None else meta
+            if array.shape[1] != dim:
+                raise ValueError(f"Embeddings of {model} have {dim} dimensions, got {array.shape[1]}")
+            path = self._vector_path(model)
+            # The file may hold rows of an append the index never recorded; those are overwritten
+            with open(path, 'r+b' if os.path.exists(path) else 'wb') as f:
+                f.seek(first_row * dim * 4)
+                f.write(array.tobytes())
+                f.truncate()
+            with self.conn:
+                self.conn.execute("INSERT OR REPLACE INTO models (model, dim, rows) VALUES (?, ?, ?)",
+                                  (model, dim, first_row + len(new)))
+                self.conn.executemany("INSERT INTO embeddings (model, text_hash, row) VALUES (?, ?, ?)",
+                                      [(model, key, first_row + i) for i, (key, _) in enumerate(new)])
+
+    def stats(self) -> dict:
+        with self._lock:
+            entries = self.conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+        return {'hits': self.hits, 'misses': self.misses, 'entries': entries}
+
+
+class CachedEmbeddings(Embeddings):
+    def __init__(self, embeddings, cache: EmbeddingCache = None, batch_size: int = DEFAULT_BATCH_SIZE):
+        """
+        Initializes the CachedEmbeddings class.
+
+        LangChain embeddings that look texts up in an EmbeddingCache first and send the texts not
+        found, without duplicates, to the wrapped client in requests of batch_size texts.
+
+        Args:
+            embeddings: The LangChain embeddings client to wrap.
+            cache (EmbeddingCache, optional): The process-wide cache if None.
+            batch_size (int): Texts per embedding request.
+        """
+        self.embeddings = embeddings
+        self.cache = cache or get_embedding_cache()
+        self.batch_size = batch_size
+        self.model = model_name(embeddings)
+        self.requests = 0
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def embed_documents(self, texts: list) -> list:
+        hashes = [text_hash(text) for text in texts]
+        vectors = self.cache.get_many(self.model, hashes)
+        missing = list(dict.fromkeys((key, text) for key, text in zip(hashes, texts) if key not in vectors))
+        for start in range(0, len(missing), self.batch_size):
+            batch = missing[start:start + self.batch_size]
+            embedded = self.embeddings.embed_documents([text for _, text in batch])
+            self.requests += 1
+            new = {key: vector for (key, _), vector in zip(batch, embedded)}
+            self.cache.set_many(self.model, new)
+            vectors.update(new)
+        if missing:
+            self.logger.info(f"Embedded {len(missing)} of {len(texts)} texts in {-(-len(missing) // self.batch_size)} requests")
+        return [list(vectors[key]) for key in hashes]
+
+    def embed_query(self, text: str) -> list:
+        # Some models embed queries differently from documents, so they are kept apart
+        model, key = self.model + ':query', text_hash(text)
+        vector = self.cache.get_many(model, [key]).get(key)
+        if vector is None:
+            vector = self.embeddings.embed_query(text)
+            self.requests += 1
+            self.cache.set_many(model, {key: vector})
+        return list(vector)
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """
+    The process-wide cache, kept in EMBEDDING_CACHE_DIR (./embedding_cache by default).
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = EmbeddingCache(os.getenv("EMBEDDING_CACHE_DIR", DEFAULT_CACHE_DIR))
+    return _cache
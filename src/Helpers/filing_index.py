@@ -0,0 +1,272 @@
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+import numpy as np
+from src.Helpers.lexical_index import BM25Index
+
+# langchain, FAISS and the embeddings client are imported on first use
+
+DEFAULT_INDEX_DIR = "./sec_index"
+CHUNK_SIZE = 1000
+CHUNK_OVERLAP = 150
+DEFAULT_TOP_K = 4
+# embedding: vector search over all chunks; lexical: local BM25 only, no embedding calls;
+# hybrid: BM25 picks candidates and embeddings rerank only those
+RETRIEVAL_MODES = ('embedding', 'lexical', 'hybrid')
+DEFAULT_RETRIEVAL_MODE = 'embedding'
+DEFAULT_RERANK_CANDIDATES = 20
+NO_MATCH = "No passage of the filing matches the question, try other keywords."
+
+# .../Archives/edgar/data/<CIK>/<accession without dashes>/<document>
+_ARCHIVE_ACCESSION = re.compile(r'/data/\d+/(\d{10})(\d{2})(\d{6})(?:/|$)')
+_ACCESSION = re.compile(r'(?<!\d)(\d{10}-\d{2}-\d{6})(?!\d)')
+
+
+def filing_key(url: str) -> str:
+    """
+    Accession number of the filing a URL points into (e.g. '0000320193-23-000106'), or a hash
+    of the URL when it holds none.
+    """
+    match = _ARCHIVE_ACCESSION.search(url)
+    if match:
+        return '-'.join(match.groups())
+    match = _ACCESSION.search(url)
+    if match:
+        return match.group(1)
+    return 'url-' + hashlib.sha256(url.encode('utf-8')).hexdigest()[:20]
+
+
+class FilingIndexStore:
+    def __init__(self, index_dir: str = DEFAULT_INDEX_DIR, embeddings=None, vectorstore_cls=None,
+                 chunk_size: int = CHUNK_SIZE, chunk_overlap: int = CHUNK_OVERLAP,
+                 mode: str = DEFAULT_RETRIEVAL_MODE, rerank_candidates: int = DEFAULT_RERANK_CANDIDATES):
+        """
+        Initializes the FilingIndexStore class.
+
+        Keeps the chunks, a BM25 index and a vector index of every SEC filing on disk, so a filing
+        is downloaded, chunked and embedded once. Later questions about it only embed the question,
+        or nothing at all in lexical mode.
+
+        Args:
+            index_dir (str): Directory holding one sub-directory per filing accession.
+            embeddings (optional): LangChain embeddings. OpenAIEmbeddings behind the shared
+                embedding cache if None.
+            vectorstore_cls (optional): Vector store class with from_documents, save_local,
+                load_local and similarity_search. FAISS if None.
+            chunk_size (int): Characters per chunk.
+            chunk_overlap (int): Characters shared by consecutive chunks.
+            mode (str): Default retrieval mode, one of RETRIEVAL_MODES.
+            rerank_candidates (int): BM25 candidates reranked by embeddings in hybrid mode.
+        """
+        if mode not in RETRIEVAL_MODES:
+            raise ValueError(f"Unknown retrieval mode '{mode}', expected one of {RETRIEVAL_MODES}")
+        self.index_dir = index_dir
+        self._embeddings = embeddings
+        self._vectorstore_cls = vectorstore_cls
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self.mode = mode
+        self.rerank_candidates = rerank_candidates
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._indexes = {}
+        self._chunks = {}
+        self._lexical = {}
+        self._locks = {}
+        self._lock = threading.Lock()
+
+    @property
+    def embeddings(self):
+        if self._embeddings is None:
+            from langchain_community.embeddings import OpenAIEmbeddings
+            from src.Helpers.embedding_cache import CachedEmbeddings
+            self._embeddings = CachedEmbeddings(OpenAIEmbeddings())
+        return self._embeddings
+
+    @property
+    def vectorstore_cls(self):
+        if self._vectorstore_cls is None:
+            from langchain_community.vectorstores import FAISS
+            self._vectorstore_cls = FAISS
+        return self._vectorstore_cls
+
+    def _chunk_settings(self) -> dict:
+        return {'chunk_size': self.chunk_size, 'chunk_overlap': self.chunk_overlap}
+
+    def _settings(self) -> dict:
+        return dict(self._chunk_settings(), embeddings=type(self.embeddings).__name__,
+                    model=getattr(self.embeddings, 'model', None))
+
+    def _key_lock(self, key: str) -> threading.Lock:
+        with self._lock:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def _split(self, content: str) -> list:
+        # langchain.text_splitter re-exports these splitters from langchain_text_splitters
+        from langchain_text_splitters import CharacterTextSplitter
+        text_splitter = CharacterTextSplitter(
+            separator="\n",
+            chunk_size=self.chunk_size,
+            chunk_overlap=self.chunk_overlap,
+            length_function=len,
+            is_separator_regex=False,
+        )
+        return text_splitter.split_text(content)
+
+    def _load_chunks(self, key: str, url: str, load_text) -> list:
+        # Called with the key's lock held
+        chunks = self._chunks.get(key)
+        if chunks is not None:
+            return chunks
+        path = os.path.join(self.index_dir, key, 'chunks.json')
+        if os.path.exists(path):
+            with open(path) as f:
+                data = json.load(f)
+            if data.get('settings') == self._chunk_settings():
+                chunks = data['chunks']
+        if chunks is None:
+            chunks = self._split(load_text(url))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w') as f:
+                json.dump({'url': url, 'settings': self._chunk_settings(), 'chunks': chunks}, f)
+            # Indexes built from the previous chunks are stale
+            self._lexical.pop(key, None)
+            self._indexes.pop(key, None)
+            stale = os.path.join(self.index_dir, key, 'bm25.json')
+            if os.path.exists(stale):
+                os.remove(stale)
+        self._chunks[key] = chunks
+        return chunks
+
+    def chunks(self, url: str, load_text) -> list:
+        """
+        Text chunks of the filing at url, split once and kept on disk.
+        """
+        key = filing_key(url)
+        with self._key_lock(key):
+            return self._load_chunks(key, url, load_text)
+
+    def lexical_index(self, url: str, load_text) -> BM25Index:
+        """
+        BM25 index of the filing's chunks: from memory, from disk, or built and saved.
+        """
+        key = filing_key(url)
+        with self._key_lock(key):
+            chunks = self._load_chunks(key, url, load_text)
+            index = self._lexical.get(key)
+            if index is not None:
+                return index
+            path = os.path.join(self.index_dir, key, 'bm25.json')
+            if os.path.exists(path):
+                index = BM25Index.load(path)
+            else:
+                index = BM25Index.build(chunks)
+                index.save(path)
+            self._lexical[key] = index
+        return index
+
+    def _load(self, path: str):
+        meta_path = os.path.join(path, 'meta.json')
+        if not os.path.exists(meta_path):
+            return None
+        with open(meta_path) as f:
+            meta = json.load(f)
+        if meta.get('settings') != self._settings():
+            self.logger.info(f"Index at {path} was built with other settings, rebuilding it")
+            return None
+        return self.vectorstore_cls.load_local(path, self.embeddings, allow_dangerous_deserialization=True)
+
+    def index(self, url: str, load_text):
+        """
+        The vector index of the filing at url: from memory, from disk, or built and saved.
+
+        Args:
+            url (str): Filing URL.
+            load_text (callable): Returns the filing text for url. Only called when the filing has no
+                stored chunks.
+
+        Returns:
+            The vector store.
+        """
+        key = filing_key(url)
+        with self._key_lock(key):
+            chunks = self._load_chunks(key, url, load_text)
+            index = self._indexes.get(key)
+            if index is not None:
+                return index
+            path = os.path.join(self.index_dir, key)
+            index = self._load(path)
+            if index is None:
+                start = time.perf_counter()
+                index = self.vectorstore_cls.from_texts(chunks, self.embeddings)
+                index.save_local(path)
+                with open(os.path.join(path, 'meta.json'), 'w') as f:
+                    json.dump({'url': url, 'chunks': len(chunks), 'settings': self._settings(),
+                               'created_at': time.time()}, f)
+                self.logger.info(f"Indexed filing {key}: {len(chunks)} chunks in {time.perf_counter() - start:.1f}s")
+            self._indexes[key] = index
+        return index
+
+    def _rerank(self, ask: str, candidates: list, k: int) -> list:
+        # Candidate vectors come from the embedding cache after the first question
+        vectors = np.asarray(self.embeddings.embed_documents(candidates), dtype=np.float32)
+        query = np.asarray(self.embeddings.embed_query(ask), dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1) * (np.linalg.norm(query) or 1.0)
+        similarity = vectors @ query / np.where(norms == 0, 1.0, norms)
+        return [candidates[i] for i in np.argsort(-similarity, kind='stable')[:k]]
+
+    def retrieve(self, url: str, ask: str, load_text, k: int = DEFAULT_TOP_K, mode: str = None) -> list:
+        """
+        The k chunks of the filing at url most relevant to ask, best first.
+
+        Args:
+            url (str): Filing URL.
+            ask (str): The question.
+            load_text (callable): Returns the filing text for url.
+            k (int): Chunks to return.
+            mode (str, optional): One of RETRIEVAL_MODES. The store's mode if None.
+
+        Returns:
+            list: The chunk texts. Empty in lexical mode when no chunk shares a term with ask.
+        """
+        mode = mode or self.mode
+        if mode not in RETRIEVAL_MODES:
+            raise ValueError(f"Unknown retrieval mode '{mode}', expected one of {RETRIEVAL_MODES}")
+        if mode == 'embedding':
+            return [doc.page_content for doc in self.index(url, load_text).similarity_search(ask, k=k)]
+
+        chunks = self.chunks(url, load_text)
+        hits = self.lexical_index(url, load_text).search(ask, k=k if mode == 'lexical' else max(k, self.rerank_candidates))
+        if mode == 'lexical':
+            return [chunks[doc_id] for doc_id, _ in hits]
+        if not hits:
+            # Nothing to rerank; the question shares no term with the filing, so all chunks are searched
+            return self.retrieve(url, ask, load_text, k=k, mode='embedding')
+        return self._rerank(ask, [chunks[doc_id] for doc_id, _ in hits], k)
+
+    def search(self, url: str, ask: str, load_text, k: int = DEFAULT_TOP_K, mode: str = None) -> str:
+        """
+        The k chunks of the filing at url most relevant to ask, separated by blank lines.
+        """
+        answers = self.retrieve(url, ask, load_text, k=k, mode=mode)
+        return "\n\n".join(answers) if answers else NO_MATCH
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_filing_index_store() -> FilingIndexStore:
+    """
+    The process-wide store, kept in SEC_INDEX_DIR (./sec_index by default) and answering in
+    SEC_RETRIEVAL_MODE (embedding by default; lexical works offline).
+    """
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = FilingIndexStore(index_dir=os.getenv("SEC_INDEX_DIR", DEFAULT_INDEX_DIR),
+                                      mode=os.getenv("SEC_RETRIEVAL_MODE", DEFAULT_RETRIEVAL_MODE))
+    return _store
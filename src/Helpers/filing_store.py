@@ -0,0 +1,224 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from src.Helpers.filing_index import filing_key
+from src.Helpers.text_extraction import extract_text
+
+DEFAULT_STORE_PATH = "./filing_store.db"
+# How long a ticker's filing list counts as current before the source is asked for newer filings
+DEFAULT_REFRESH_SECONDS = 6 * 3600
+COMPRESSION_LEVEL = 6
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS filings (
+    accession TEXT NOT NULL,
+    source TEXT NOT NULL,
+    ticker TEXT NOT NULL,
+    form_type TEXT NOT NULL,
+    filed_at TEXT NOT NULL,
+    url TEXT NOT NULL,
+    metadata TEXT NOT NULL,
+    PRIMARY KEY (source, accession)
+);
+CREATE INDEX IF NOT EXISTS idx_filings_latest ON filings (source, ticker, form_type, filed_at);
+CREATE TABLE IF NOT EXISTS checks (
+    source TEXT NOT NULL,
+    ticker TEXT NOT NULL,
+    form_type TEXT NOT NULL,
+    checked_at REAL NOT NULL,
+    PRIMARY KEY (source, ticker, form_type)
+);
+CREATE TABLE IF NOT EXISTS documents (
+    accession TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    html BLOB,
+    text BLOB,
+    fetched_at REAL NOT NULL
+);
+"""
+
+
+def _compress(text: str) -> bytes:
+    return zlib.compress(text.encode('utf-8'), COMPRESSION_LEVEL)
+
+
+def _decompress(data: bytes) -> str:
+    return zlib.decompress(data).decode('utf-8')
+
+
+class FilingStore:
+    def __init__(self, db_path: str = DEFAULT_STORE_PATH, refresh_seconds: float = DEFAULT_REFRESH_SECONDS):
+        """
+        Initializes the FilingStore class.
+
+        Keeps SEC filing metadata per ticker and form type, and the compressed HTML and extracted
+        text of each filing document per accession number. Filing lists are updated incrementally:
+        the source is only asked for filings newer than the latest stored one, and at most once per
+        refresh_seconds. Documents are downloaded once.
+
+        Args:
+            db_path (str): Path of the SQLite database file. Use ':memory:' for a throwaway store.
+            refresh_seconds (float): Seconds after a check before the source is checked again.
+        """
+        self.db_path = db_path
+        self.refresh_seconds = refresh_seconds
+        self.downloads = 0
+        self.source_requests = 0
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._lock = threading.Lock()
+        self._download_locks = {}
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    @staticmethod
+    def _row(row) -> dict:
+        accession, source, ticker, form_type, filed_at, url, metadata = row
+        return {'accession': accession, 'source': source, 'ticker': ticker, 'form_type': form_type,
+                'filed_at': filed_at, 'url': url, 'metadata': json.loads(metadata)}
+
+    def filings(self, ticker: str, form_type: str = '', source: str = 'sec-api', limit: int = None) -> list:
+        """
+        Stored filings of ticker, newest first, as dicts with accession, filed_at, url and the source's metadata.
+        """
+        query = ("SELECT accession, source, ticker, form_type, filed_at, url, metadata FROM filings "
+                 "WHERE source = ? AND ticker = ? AND form_type = ? ORDER BY filed_at DESC, accession DESC")
+        params = [source, ticker.upper(), form_type]
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(int(limit))
+        with self._lock:
+            return [self._row(row) for row in self.conn.execute(query, params).fetchall()]
+
+    def latest(self, ticker: str, form_type: str = '', source: str = 'sec-api'):
+        """
+        The newest stored filing of ticker, or None.
+        """
+        filings = self.filings(ticker, form_type, source, limit=1)
+        return filings[0] if filings else None
+
+    def add_filings(self, ticker: str, form_type: str, filings: list, source: str = 'sec-api') -> list:
+        """
+        Store filings given as dicts with 'filed_at', 'url', 'metadata' and optionally 'accession'
+        (taken from the URL otherwise). Filings already stored are skipped.
+
+        Returns:
+            list: The filings that were new.
+        """
+        new = []
+        with self._lock, self.conn:
+            for filing in filings:
+                accession = filing.get('accession') or filing_key(filing['url'])
+                cursor = self.conn.execute(
+                    "INSERT OR IGNORE INTO filings (accession, source, ticker, form_type, filed_at, url, metadata) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (accession, source, ticker.upper(), form_type, str(filing['filed_at']), filing['url'],
+                     json.dumps(filing.get('metadata', {}), default=str)),
+                )
+                if cursor.rowcount:
+                    new.append(dict(filing, accession=accession))
+        return new
+
+    def _checked_at(self, source: str, ticker: str, form_type: str):
+        with self._lock:
+            row = self.conn.execute("SELECT checked_at FROM checks WHERE source = ? AND ticker = ? AND form_type = ?",
+                                    (source, ticker.upper(), form_type)).fetchone()
+        return row[0] if row else None
+
+    def update(self, ticker: str, form_type: str, fetch_since, source: str = 'sec-api', force: bool = False) -> list:
+        """
+        Bring the stored filings of ticker up to date.
+
+        Args:
+            ticker (str): Stock ticker.
+            form_type (str): Form type such as '10-Q', or '' for all forms.
+            fetch_since (callable): Called with the filing time of the latest stored filing, or None
+                when none is stored; returns the source's filings from that time on, in the format
+                of add_filings.
+            source (str): Name of the source, so listings from different sources are kept apart.
+            force (bool): Ask the source even if it was checked less than refresh_seconds ago.
+
+        Returns:
+            list: The filings that were new.
+        """
+        checked_at = self._checked_at(source, ticker, form_type)
+        if not force and checked_at is not None and time.time() - checked_at < self.refresh_seconds:
+            return []
+        latest = self.latest(ticker, form_type, source)
+        self.source_requests += 1
+        new = self.add_filings(ticker, form_type, fetch_since(latest['filed_at'] if latest else None) or [], source)
+        with self._lock, self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO checks (source, ticker, form_type, checked_at) VALUES (?, ?, ?, ?)",
+                              (source, ticker.upper(), form_type, time.time()))
+        if new:
+            self.logger.info(f"Stored {len(new)} new {form_type or 'SEC'} filings of {ticker} from {source}")
+        return new
+
+    def _download_lock(self, accession: str) -> threading.Lock:
+        with self._lock:
+            return self._download_locks.setdefault(accession, threading.Lock())
+
+    def _document(self, accession: str, column: str):
+        with self._lock:
+            row = self.conn.execute(f"SELECT {column} FROM documents WHERE accession = ?", (accession,)).fetchone()
+        return _decompress(row[0]) if row and row[0] is not None else None
+
+    def html(self, url: str, download) -> str:
+        """
+        HTML of the filing document at url, downloaded with download(url) only the first time.
+        """
+        accession = filing_key(url)
+        with self._download_lock(accession):
+            html = self._document(accession, 'html')
+            if html is None:
+                html = download(url)
+                self.downloads += 1
+                with self._lock, self.conn:
+                    self.conn.execute(
+                        "INSERT INTO documents (accession, url, html, fetched_at) VALUES (?, ?, ?, ?) "
+                        "ON CONFLICT(accession) DO UPDATE SET html = excluded.html, fetched_at = excluded.fetched_at",
+                        (accession, url, _compress(html), time.time()),
+                    )
+        return html
+
+    def text(self, url: str, download) -> str:
+        """
+        Text of the filing document at url, extracted from its HTML once and kept with it.
+        """
+        accession = filing_key(url)
+        text = self._document(accession, 'text')
+        if text is None:
+            text = extract_text(self.html(url, download), main_content=False, dedupe=False)
+            with self._lock, self.conn:
+                self.conn.execute("UPDATE documents SET text = ? WHERE accession = ?", (_compress(text), accession))
+        return text
+
+    def stats(self) -> dict:
+        with self._lock:
+            filings = self.conn.execute("SELECT COUNT(*) FROM filings").fetchone()[0]
+            documents, stored_bytes = self.conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(LENGTH(html)), 0) + COALESCE(SUM(LENGTH(text)), 0) FROM documents"
+            ).fetchone()
+        return {'filings': filings, 'documents': documents, 'stored_bytes': stored_bytes,
+                'downloads': self.downloads, 'source_requests': self.source_requests}
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_filing_store() -> FilingStore:
+    """
+    The process-wide store, kept in FILING_STORE_PATH (./filing_store.db by default).
+    """
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = FilingStore(os.getenv("FILING_STORE_PATH", DEFAULT_STORE_PATH))
+    return _store
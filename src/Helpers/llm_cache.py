@@ -0,0 +1,215 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from crewai import LLM
+from src.Helpers.sqlite_lru import SQLiteLRUCache
+
+DEFAULT_CACHE_PATH = "./llm_cache.db"
+DEFAULT_TTL_SECONDS = 30 * 24 * 3600
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Generation settings besides model and temperature that change the response
+KEYED_PARAMS = ('max_tokens', 'max_completion_tokens', 'top_p', 'n', 'stop', 'presence_penalty',
+                'frequency_penalty', 'logit_bias', 'response_format', 'seed', 'logprobs', 'top_logprobs')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    response TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses (last_access);
+"""
+
+
+def make_key(model: str, temperature, messages: list, tools=None, **params) -> str:
+    """
+    Content hash of everything that determines an LLM response.
+
+    Args:
+        model (str): Model name, e.g. 'gpt-4o'.
+        temperature (float): Sampling temperature.
+        messages (list): Chat messages as [{'role': ..., 'content': ...}].
+        tools (list, optional): Tool / function schemas offered to the model.
+        **params: Other generation settings (max_tokens, stop, ...). None values are ignored.
+
+    Returns:
+        str: Hex digest used as the cache key.
+    """
+    payload = {
+        'model': model,
+        'temperature': temperature,
+        'messages': messages,
+        'tools': tools,
+        'params': {name: value for name, value in params.items() if value is not None},
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+class LLMResponseCache(SQLiteLRUCache):
+    TABLE = 'responses'
+    SCHEMA = SCHEMA
+    ENTRY_NAME = 'cached LLM responses'
+
+    def __init__(self, db_path: str = DEFAULT_CACHE_PATH, ttl_seconds: float = DEFAULT_TTL_SECONDS,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initializes the LLMResponseCache class.
+
+        Args:
+            db_path (str): Path of the SQLite database file. Use ':memory:' for a throwaway cache.
+            ttl_seconds (float): Entries older than this are treated as misses. None keeps them forever.
+            max_bytes (int): Size bound of the stored responses. The least recently used entries
+                are evicted once it is exceeded.
+        """
+        self.ttl_seconds = ttl_seconds
+        super().__init__(db_path, max_bytes)
+
+    def get(self, key: str):
+        """
+        Return the cached response for key, or None on a miss or an expired entry.
+        """
+        now = time.time()
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT response, created_at, size FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and self.ttl_seconds is not None and now - row[1] > self.ttl_seconds:
+                self._delete(key, row[2])
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self._touch(key, now)
+            self.hits += 1
+        return row[0]
+
+    def set(self, key: str, response: str, model: str = ''):
+        """
+        Store a response and evict least recently used entries beyond max_bytes.
+        """
+        self._store(key, len(response.encode('utf-8')), model=model, response=response)
+
+    def stats(self) -> dict:
+        with self._lock:
+            entries = self.conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        return {'entries': entries, 'bytes': self._total_bytes, 'hits': self.hits, 'misses': self.misses}
+
+
+_shared_cache = None
+_shared_cache_lock = threading.Lock()
+_rate_limiter = None
+_concurrency = None
+
+
+def set_rate_limiter(limiter):
+    """
+    Apply a RateLimiter to every API call made by a CachedLLM in this process (cache hits are
+    not limited). Pass None to remove it.
+
+    Returns:
+        The limiter that was in place before, so callers can restore it.
+    """
+    global _rate_limiter
+    previous, _rate_limiter = _rate_limiter, limiter
+    return previous
+
+
+def set_concurrency_limit(max_concurrent: int = None):
+    """
+    Limit the number of API calls in flight across every CachedLLM in this process.
+    Pass None to remove the limit.
+    """
+    global _concurrency
+    _concurrency = threading.BoundedSemaphore(max_concurrent) if max_concurrent else None
+
+
+def get_response_cache():
+    """
+    The process-wide cache shared by all LLMs, configured from the environment:
+    LLM_CACHE_PATH, LLM_CACHE_TTL_SECONDS, LLM_CACHE_MAX_MB. Returns None when LLM_CACHE_DISABLED is set.
+    """
+    global _shared_cache
+    if os.getenv("LLM_CACHE_DISABLED", "").lower() in ("1", "true", "yes"):
+        return None
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = LLMResponseCache(
+                db_path=os.getenv("LLM_CACHE_PATH", DEFAULT_CACHE_PATH),
+                ttl_seconds=float(os.getenv("LLM_CACHE_TTL_SECONDS", DEFAULT_TTL_SECONDS)),
+                max_bytes=int(float(os.getenv("LLM_CACHE_MAX_MB", DEFAULT_MAX_BYTES / 1024 ** 2)) * 1024 ** 2),
+            )
+    return _shared_cache
+
+
+class CachedLLM(LLM):
+    """
+    crewai LLM that serves repeated deterministic (temperature 0) calls from an LLMResponseCache.
+    Cache hits never reach the API, so they cost no tokens.
+    """
+
+    def __init__(self, model: str, response_cache: LLMResponseCache = None, **kwargs):
+        super().__init__(model=model, **kwargs)
+        self.response_cache = response_cache
+
+    def cache_key(self, messages) -> str:
+        params = {name: getattr(self, name, None) for name in KEYED_PARAMS}
+        return make_key(self.model, self.temperature, messages, tools=self.kwargs.get('tools'), **params)
+
+    def _complete(self, messages, callbacks):
+        return super().call(messages, callbacks)
+
+    def _call_api(self, messages, callbacks):
+        if _rate_limiter is not None:
+            _rate_limiter.acquire()
+        semaphore = _concurrency
+        if semaphore is None:
+            return self._complete(messages, callbacks)
+        with semaphore:
+            return self._complete(messages, callbacks)
+
+    def call(self, messages, callbacks=[]) -> str:
+        cache = self.response_cache or get_response_cache()
+        if cache is None or self.temperature != 0:
+            return self._call_api(messages, callbacks)
+
+        key = self.cache_key(messages)
+        response = cache.get(key)
+        if response is not None:
+            return response
+        response = self._call_api(messages, callbacks)
+        if response is not None:
+            cache.set(key, response, model=self.model)
+        return response
+
+
+def cached_llm(llm, response_cache: LLMResponseCache = None) -> CachedLLM:
+    """
+    Convert a LangChain chat model (e.g. ChatOpenAI) into a CachedLLM with the same settings.
+    crewai agents would otherwise convert it into an uncached LLM themselves.
+
+    Without a dedicated response_cache the shared LLM for these settings is taken from the
+    LLM registry (a StubLLM when LLM_BACKEND=stub, see src/Helpers/stub_llm.py).
+    New code should call src.Helpers.llm_registry.get_llm() directly.
+    """
+    params = {
+        'max_tokens': getattr(llm, 'max_tokens', None),
+        'timeout': getattr(llm, 'request_timeout', None),
+        'base_url': getattr(llm, 'openai_api_base', None),
+    }
+    api_key = getattr(llm, 'openai_api_key', None)
+    if api_key is not None:
+        params['api_key'] = api_key.get_secret_value() if hasattr(api_key, 'get_secret_value') else api_key
+    params = {name: value for name, value in params.items() if value is not None}
+    model = getattr(llm, 'model_name', None) or getattr(llm, 'model', None)
+    temperature = getattr(llm, 'temperature', None)
+    if response_cache is None:
+        from src.Helpers.llm_registry import get_llm
+        return get_llm(model=model, temperature=temperature, **params)
+    return CachedLLM(model=model, temperature=temperature, response_cache=response_cache, **params)
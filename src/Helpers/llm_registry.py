@@ -0,0 +1,150 @@
+import logging
+import os
+import threading
+import httpx
+from src.Helpers.rate_limiter import RateLimiter
+
+# crewai and litellm take seconds to import; they are loaded with the first client
+
+DEFAULT_MODEL = "gpt-4o"
+DEFAULT_MAX_CONNECTIONS = 20
+DEFAULT_MAX_KEEPALIVE = 10
+DEFAULT_KEEPALIVE_EXPIRY = 60.0
+DEFAULT_TIMEOUT = 600.0
+
+
+class LLMRegistry:
+    def __init__(self, max_connections: int = DEFAULT_MAX_CONNECTIONS, max_keepalive: int = DEFAULT_MAX_KEEPALIVE,
+                 keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY, max_concurrent_requests: int = None,
+                 requests_per_minute: float = None):
+        """
+        Initializes the LLMRegistry class.
+
+        Hands out one shared LLM per (model, settings) configuration, created on first use.
+        All OpenAI calls made through litellm go over a single keep-alive HTTP connection pool
+        instead of one pool per client.
+
+        Args:
+            max_connections (int): Upper bound on open connections to the API.
+            max_keepalive (int): Idle connections kept open for reuse.
+            keepalive_expiry (float): Seconds an idle connection is kept.
+            max_concurrent_requests (int, optional): Limit on API calls in flight across all LLMs.
+            requests_per_minute (float, optional): Global rate limit on API calls across all LLMs.
+        """
+        self.max_connections = max_connections
+        self.max_keepalive = max_keepalive
+        self.keepalive_expiry = keepalive_expiry
+        self.max_concurrent_requests = max_concurrent_requests
+        self.requests_per_minute = requests_per_minute
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._clients = {}
+        self._http_client = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls):
+        """
+        Registry configured from LLM_MAX_CONNECTIONS, LLM_MAX_KEEPALIVE, LLM_MAX_CONCURRENT_REQUESTS
+        and LLM_REQUESTS_PER_MINUTE.
+        """
+        concurrent = os.getenv("LLM_MAX_CONCURRENT_REQUESTS")
+        rpm = os.getenv("LLM_REQUESTS_PER_MINUTE")
+        return cls(
+            max_connections=int(os.getenv("LLM_MAX_CONNECTIONS", DEFAULT_MAX_CONNECTIONS)),
+            max_keepalive=int(os.getenv("LLM_MAX_KEEPALIVE", DEFAULT_MAX_KEEPALIVE)),
+            max_concurrent_requests=int(concurrent) if concurrent else None,
+            requests_per_minute=float(rpm) if rpm else None,
+        )
+
+    def _start(self):
+        """
+        Install the shared connection pool and the global limits. Called once, on the first client.
+        """
+        import litellm
+        from src.Helpers.llm_cache import set_concurrency_limit, set_rate_limiter
+        self._http_client = httpx.Client(
+            limits=httpx.Limits(max_connections=self.max_connections,
+                                max_keepalive_connections=self.max_keepalive,
+                                keepalive_expiry=self.keepalive_expiry),
+            timeout=DEFAULT_TIMEOUT,
+        )
+        litellm.client_session = self._http_client
+        if self.max_concurrent_requests:
+            set_concurrency_limit(self.max_concurrent_requests)
+        if self.requests_per_minute:
+            set_rate_limiter(RateLimiter(self.requests_per_minute, burst=self.max_concurrent_requests or 1))
+
+    def get(self, model: str = DEFAULT_MODEL, temperature: float = 0.0, **params):
+        """
+        The shared LLM for a configuration, created on first request.
+
+        Args:
+            model (str): Model name, e.g. 'gpt-4o'.
+            temperature (float): Sampling temperature.
+            **params: Other crewai.LLM settings (max_tokens, timeout, base_url, api_key, ...).
+                None values are ignored.
+
+        Returns:
+            CachedLLM: The same instance for every call with the same configuration. A StubLLM
+                when LLM_BACKEND=stub is set.
+        """
+        params = {name: value for name, value in params.items() if value is not None}
+        backend = os.getenv("LLM_BACKEND", "openai").lower()
+        key = (backend, model, temperature, tuple(sorted(params.items())))
+        with self._lock:
+            llm = self._clients.get(key)
+            if llm is None:
+                if self._http_client is None:
+                    self._start()
+                llm = self._create(backend, model, temperature, params)
+                self._clients[key] = llm
+                self.logger.debug(f"Created {backend} LLM for {model} (temperature={temperature})")
+        return llm
+
+    def _create(self, backend: str, model: str, temperature: float, params: dict):
+        from src.Helpers.llm_cache import CachedLLM
+        if backend == "stub":
+            from src.Helpers.stub_llm import stub_llm_from_env
+            return stub_llm_from_env(model=model, temperature=temperature, max_tokens=params.get('max_tokens'))
+        return CachedLLM(model=model, temperature=temperature, **params)
+
+    def stats(self) -> dict:
+        with self._lock:
+            models = [f"{backend}:{model}" for backend, model, _, _ in self._clients]
+        return {'clients': len(models), 'models': sorted(set(models))}
+
+    def close(self):
+        """
+        Drop all clients and close the shared connection pool.
+        """
+        with self._lock:
+            self._clients.clear()
+            if self._http_client is not None:
+                import litellm
+                if litellm.client_session is self._http_client:
+                    litellm.client_session = None
+                self._http_client.close()
+                self._http_client = None
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_registry() -> LLMRegistry:
+    """
+    The process-wide registry, configured from the environment on first use.
+    """
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = LLMRegistry.from_env()
+    return _registry
+
+
+def get_llm(model: str = DEFAULT_MODEL, temperature: float = 0.0, **params):
+    """
+    Shared LLM for a configuration from the process-wide registry. Use this instead of creating
+    ChatOpenAI clients at import time.
+    """
+    return get_registry().get(model=model, temperature=temperature, **params)
@@ -0,0 +1,143 @@
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+DEFAULT_MAX_WORKERS = 8
+# News and prices go stale; a prefetched result is only served for this long
+DEFAULT_TTL = 15 * 60
+
+
+class Prefetcher:
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS, ttl: float = DEFAULT_TTL):
+        """
+        Initializes the Prefetcher class.
+
+        Starts data fetches and tool queries in the background as soon as a crew knows its inputs,
+        so the agents' tool calls find the results ready instead of waiting on the network.
+        Results are keyed; a key that was never prefetched is loaded on the caller's thread.
+
+        Args:
+            max_workers (int): Fetches run at the same time.
+            ttl (float): Seconds a result is served after its fetch was started. None keeps it forever.
+        """
+        self.max_workers = max_workers
+        self.ttl = ttl
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.hits = 0
+        self.misses = 0
+        self._executor = None
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def _fresh(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        started, future = entry
+        if self.ttl is not None and time.monotonic() - started > self.ttl:
+            del self._entries[key]
+            return None
+        return future
+
+    def prefetch(self, key, fn, *args, **kwargs) -> Future:
+        """
+        Start fn(*args, **kwargs) in the background under key, unless a fresh fetch for key exists.
+
+        Args:
+            key (hashable): Identifies the result, e.g. ('search_news', query, top_n).
+            fn (callable): The fetch.
+
+        Returns:
+            Future: The fetch for key.
+        """
+        with self._lock:
+            future = self._fresh(key)
+            if future is None:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='prefetch')
+                future = self._executor.submit(fn, *args, **kwargs)
+                self._entries[key] = (time.monotonic(), future)
+                self.logger.debug(f"Prefetching {key}")
+        return future
+
+    def get(self, key, fn=None, *args, timeout: float = None, **kwargs):
+        """
+        The result for key: waits for its prefetch if one is running, otherwise calls
+        fn(*args, **kwargs) now and keeps the result. A failed prefetch is retried with fn.
+
+        Args:
+            key (hashable): Identifies the result.
+            fn (callable, optional): Loads the result when it was not prefetched.
+            timeout (float, optional): Seconds to wait for a running prefetch.
+
+        Returns:
+            The result of the fetch.
+
+        Raises:
+            KeyError: If key was not prefetched and no fn is given.
+        """
+        with self._lock:
+            future = self._fresh(key)
+        if future is not None:
+            try:
+                result = future.result(timeout=timeout)
+                with self._lock:
+                    self.hits += 1
+                return result
+            except Exception as e:
+                if fn is None:
+                    raise
+                self.logger.warning(f"Prefetch of {key} failed, fetching again: {e}")
+        if fn is None:
+            raise KeyError(f"{key!r} was not prefetched")
+
+        with self._lock:
+            self.misses += 1
+        result = fn(*args, **kwargs)
+        done = Future()
+        done.set_result(result)
+        with self._lock:
+            self._entries[key] = (time.monotonic(), done)
+        return result
+
+    def stats(self) -> dict:
+        with self._lock:
+            pending = sum(1 for _, future in self._entries.values() if not future.done())
+            return {'hits': self.hits, 'misses': self.misses, 'entries': len(self._entries), 'pending': pending}
+
+    def discard(self, key):
+        """
+        Forget the result for key, e.g. an error response that should not be served again.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def shutdown(self, wait: bool = True):
+        """
+        Drop all results and stop the worker threads.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+            self._entries.clear()
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
+_prefetcher = None
+_prefetcher_lock = threading.Lock()
+
+
+def get_prefetcher() -> Prefetcher:
+    """
+    The process-wide prefetcher that crews fill and tools read from.
+    """
+    global _prefetcher
+    with _prefetcher_lock:
+        if _prefetcher is None:
+            _prefetcher = Prefetcher()
+    return _prefetcher
@@ -7,13 +7,13 @@ from rich.console import Console
 from rich.table import Table
 from rich.markdown import Markdown
 import json
+from src.Helpers.token_budget import model_pricing
 
-def display_crew_output(crew_output):
+def display_crew_output(crew_output, model="gpt-4o"):
     console = Console()
 
-    # GPT-4o pricing
-    INPUT_TOKEN_COST = 2.5/1e6   # Cost per input token in USD
-    OUTPUT_TOKEN_COST = 10.0/1e6 # Cost per output token in USD
+    # Pricing of the model the crew ran on
+    INPUT_TOKEN_COST, OUTPUT_TOKEN_COST = model_pricing(model)
 
     # Raw Output
     console.print(f"[bold yellow]Raw Output:[/bold yellow] {crew_output.raw}\n")
@@ -0,0 +1,206 @@
+import json
+import logging
+import math
+from functools import lru_cache
+import numpy as np
+import pandas as pd
+import tiktoken
+
+DEFAULT_MODEL = "gpt-4o"
+
+# Per-task budgets for data embedded in task descriptions
+INDICATOR_TOKEN_BUDGET = 800
+FILINGS_TOKEN_BUDGET = 1500
+TRANSCRIPT_TOKEN_BUDGET = 3000
+
+TRUNCATION_MARKER = "\n[... truncated to fit the token budget ...]"
+
+# Used when the tokenizer files cannot be downloaded (offline runs)
+CHARS_PER_TOKEN = 4
+
+
+@lru_cache(maxsize=None)
+def _encoding(model: str):
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logging.getLogger(__name__).warning(
+            f"tiktoken encoding for {model} unavailable ({e}); estimating {CHARS_PER_TOKEN} characters per token")
+        return None
+
+
+def count_tokens(text: str, model: str = DEFAULT_MODEL) -> int:
+    """
+    Count the tokens of text for the given model.
+    """
+    encoding = _encoding(model)
+    if encoding is None:
+        return math.ceil(len(text) / CHARS_PER_TOKEN)
+    return len(encoding.encode(text))
+
+
+def truncate_to_tokens(text: str, max_tokens: int, model: str = DEFAULT_MODEL) -> str:
+    """
+    Cut text down to max_tokens, marking where it was truncated.
+    """
+    if count_tokens(text, model) <= max_tokens:
+        return text
+    keep = max(max_tokens - count_tokens(TRUNCATION_MARKER, model), 0)
+    encoding = _encoding(model)
+    if encoding is None:
+        return text[:keep * CHARS_PER_TOKEN] + TRUNCATION_MARKER
+    return encoding.decode(encoding.encode(text)[:keep]) + TRUNCATION_MARKER
+
+
+def truncate_middle(text: str, max_tokens: int, model: str = DEFAULT_MODEL, tail_share: float = 0.3) -> str:
+    """
+    Cut text down to max_tokens by removing its middle. Task descriptions embed data between
+    the instructions at the start and the answer requirements at the end, so both ends are kept.
+    """
+    if count_tokens(text, model) <= max_tokens:
+        return text
+    keep = max(max_tokens - count_tokens(TRUNCATION_MARKER + "\n", model) - 1, 0)
+    tail = int(keep * tail_share)
+    head = keep - tail
+    encoding = _encoding(model)
+    if encoding is None:
+        head_text = text[:head * CHARS_PER_TOKEN]
+        tail_text = text[len(text) - tail * CHARS_PER_TOKEN:] if tail else ''
+    else:
+        tokens = encoding.encode(text)
+        head_text = encoding.decode(tokens[:head])
+        tail_text = encoding.decode(tokens[len(tokens) - tail:]) if tail else ''
+    return head_text + TRUNCATION_MARKER + "\n" + tail_text
+
+
+def _find_column(df: pd.DataFrame, candidates):
+    for name in candidates:
+        if name in df.columns:
+            return name
+    return None
+
+
+def _label(index_value) -> str:
+    if isinstance(index_value, pd.Timestamp):
+        return index_value.strftime('%Y-%m-%d')
+    return str(index_value)
+
+
+def summarize_macd(macd_data: pd.DataFrame, recent: int = 10, max_events: int = 8) -> str:
+    """
+    Compress a MACD history into the features an analyst looks at: recent values,
+    crossover events and regime statistics.
+
+    Args:
+        macd_data (pd.DataFrame): Output of either MACD indicator ('MACD'/'Signal_Line' or
+            'MACD Line'/'Signal Line'/'MACD Histogram' columns).
+        recent (int): Number of most recent bars listed in full.
+        max_events (int): Number of most recent crossovers listed.
+
+    Returns:
+        str: A compact plain-text report.
+    """
+    macd_col = _find_column(macd_data, ['MACD', 'MACD Line'])
+    signal_col = _find_column(macd_data, ['Signal_Line', 'Signal Line'])
+    if macd_col is None or signal_col is None:
+        raise ValueError("MACD data must contain MACD and Signal Line columns.")
+
+    data = macd_data[[macd_col, signal_col]].dropna()
+    if data.empty:
+        return "No MACD data available."
+    macd = data[macd_col].to_numpy(dtype=np.float64)
+    signal = data[signal_col].to_numpy(dtype=np.float64)
+    histogram = macd - signal
+    labels = data.index
+
+    above = histogram > 0
+    crosses = np.flatnonzero(above[1:] != above[:-1]) + 1
+    zero_crosses = np.flatnonzero((macd[1:] > 0) != (macd[:-1] > 0)) + 1
+    regime_start = crosses[-1] if len(crosses) else 0
+
+    lines = [
+        f"Bars analysed: {len(data)} ({_label(labels[0])} to {_label(labels[-1])})",
+        f"Current regime: MACD {'above' if above[-1] else 'below'} Signal Line for "
+        f"{len(data) - regime_start} bars; MACD {'above' if macd[-1] > 0 else 'below'} zero",
+        f"MACD min/mean/max: {macd.min():.4f} / {macd.mean():.4f} / {macd.max():.4f}",
+        f"Share of bars with MACD above Signal Line: {above.mean() * 100:.1f}%; above zero: {(macd > 0).mean() * 100:.1f}%",
+        f"Histogram latest/mean: {histogram[-1]:.4f} / {histogram.mean():.4f}; "
+        f"5-bar histogram change: {histogram[-1] - histogram[max(len(histogram) - 6, 0)]:.4f}",
+        f"Crossovers: {len(crosses)} total; zero-line crosses: {len(zero_crosses)}",
+    ]
+    if len(zero_crosses):
+        last_zero = zero_crosses[-1]
+        lines.append(f"Last zero-line cross: {_label(labels[last_zero])} "
+                     f"({'upward' if macd[last_zero] > 0 else 'downward'})")
+
+    if len(crosses):
+        lines.append(f"Last {min(max_events, len(crosses))} crossovers:")
+        for i in crosses[-max_events:]:
+            kind = 'bullish' if above[i] else 'bearish'
+            lines.append(f"  {_label(labels[i])} {kind} (MACD {macd[i]:.4f}, Signal {signal[i]:.4f})")
+
+    lines.append(f"Last {min(recent, len(data))} bars (MACD, Signal, Histogram):")
+    for i in range(max(len(data) - recent, 0), len(data)):
+        lines.append(f"  {_label(labels[i])} {macd[i]:.4f} {signal[i]:.4f} {histogram[i]:.4f}")
+    return "\n".join(lines)
+
+
+def _prune(value, max_items: int, max_chars: int):
+    """
+    Drop empty fields, keep the first max_items of every list or mapping and cut long strings.
+    Mappings are limited too because DataFrame.to_json() nests rows in dicts keyed by index.
+    """
+    if isinstance(value, dict):
+        pruned = {}
+        kept = [(key, item) for key, item in value.items()
+                if not (item is None or item == '' or item == [] or item == {})]
+        for key, item in kept[:max_items]:
+            pruned[key] = _prune(item, max_items, max_chars)
+        if len(kept) > max_items:
+            pruned['...'] = f"{len(kept) - max_items} more"
+        return pruned
+    if isinstance(value, list):
+        items = [_prune(item, max_items, max_chars) for item in value[:max_items]]
+        if len(value) > max_items:
+            items.append(f"... {len(value) - max_items} more")
+        return items
+    if isinstance(value, str) and len(value) > max_chars:
+        return value[:max_chars] + '...'
+    return value
+
+
+def compact_json(data, max_tokens: int = FILINGS_TOKEN_BUDGET, model: str = DEFAULT_MODEL) -> str:
+    """
+    Serialize JSON-like data (a dict, a list or a JSON string) compactly within a token budget.
+    Lists and long strings are shortened step by step so the structure survives; text that
+    is not JSON is truncated.
+
+    Args:
+        data: The payload to embed in a prompt.
+        max_tokens (int): Token budget for the serialized result.
+        model (str): Model whose tokenizer is used for counting.
+
+    Returns:
+        str: Compact JSON (or plain text) of at most max_tokens tokens.
+    """
+    if data is None:
+        return "No data available."
+    if isinstance(data, str):
+        try:
+            data = json.loads(data)
+        except ValueError:
+            return truncate_to_tokens(data, max_tokens, model)
+
+    max_items, max_chars = 50, 2000
+    while True:
+        text = json.dumps(_prune(data, max_items, max_chars), separators=(',', ':'),
+                          ensure_ascii=False, default=str)
+        if count_tokens(text, model) <= max_tokens:
+            return text
+        if max_items == 1 and max_chars <= 80:
+            return truncate_to_tokens(text, max_tokens, model)
+        max_items = max(max_items // 2, 1)
+        max_chars = max(max_chars // 2, 80)
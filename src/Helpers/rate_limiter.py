@@ -0,0 +1,35 @@
+import threading
+import time
+
+
+class RateLimiter:
+    def __init__(self, requests_per_minute: float, burst: int = 1):
+        """
+        Initializes the RateLimiter class, a thread-safe token bucket.
+
+        Args:
+            requests_per_minute (float): Sustained number of requests allowed per minute.
+            burst (int): Requests that may be made back to back before the rate applies.
+        """
+        if requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be positive.")
+        self.interval = 60.0 / requests_per_minute
+        self.capacity = max(burst, 1)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Block until a request may be made.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) / self.interval)
+                self.updated = now
+                if self.tokens >= 1.0:
+                    self.tokens -= 1.0
+                    return
+                wait = (1.0 - self.tokens) * self.interval
+            time.sleep(wait)
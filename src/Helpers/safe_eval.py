@@ -0,0 +1,269 @@
+import ast
+import math
+import operator
+from functools import lru_cache
+import numpy as np
+
+MAX_SOURCE_LENGTH = 10_000
+MAX_EXPONENT = 1_000
+PARSE_CACHE_SIZE = 512
+
+BINARY_OPERATORS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+}
+UNARY_OPERATORS = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+CONSTANTS = {'pi': math.pi, 'e': math.e}
+
+
+def _values(args) -> np.ndarray:
+    # f([1, 2, 3]) and f(1, 2, 3) are the same
+    if len(args) == 1 and isinstance(args[0], np.ndarray):
+        return args[0]
+    if any(isinstance(arg, np.ndarray) for arg in args):
+        raise ValueError("Pass either one list or several numbers")
+    return np.array(args, dtype=float)
+
+
+def _at_least(values: np.ndarray, n: int, name: str) -> np.ndarray:
+    if len(values) < n:
+        raise ValueError(f"{name} needs at least {n} value{'s' if n > 1 else ''}")
+    return values
+
+
+def pct_change(*args):
+    """
+    pct_change(old, new): percent change from old to new, element-wise for lists.
+    pct_change(values): percent change between consecutive values.
+    """
+    if len(args) == 1:
+        values = _at_least(_values(args), 2, 'pct_change')
+        return (values[1:] - values[:-1]) / values[:-1] * 100
+    if len(args) != 2:
+        raise ValueError("pct_change takes (old, new) or (values)")
+    old, new = args
+    return (new - old) / old * 100
+
+
+def cagr(begin, end, years):
+    """
+    Compound annual growth rate in percent of a value going from begin to end in years.
+    """
+    if np.any(np.asarray(years) <= 0):
+        raise ValueError("cagr needs a positive number of years")
+    if np.any(np.asarray(begin) <= 0) or np.any(np.asarray(end) <= 0):
+        raise ValueError("cagr needs positive begin and end values")
+    return (np.power(np.asarray(end / begin, dtype=float), 1 / years) - 1) * 100
+
+
+def _round(value, digits=0):
+    return np.round(value, int(digits)) if isinstance(value, np.ndarray) else round(value, int(digits))
+
+
+def _log(value, base=None):
+    return np.log(value) if base is None else np.log(value) / np.log(base)
+
+
+FUNCTIONS = {
+    'abs': np.abs,
+    'round': _round,
+    'sqrt': np.sqrt,
+    'exp': np.exp,
+    'log': _log,
+    'log10': np.log10,
+    'sum': lambda *args: _values(args).sum(),
+    'min': lambda *args: _at_least(_values(args), 1, 'min').min(),
+    'max': lambda *args: _at_least(_values(args), 1, 'max').max(),
+    'len': lambda *args: len(_values(args)),
+    'mean': lambda *args: _at_least(_values(args), 1, 'mean').mean(),
+    'median': lambda *args: np.median(_at_least(_values(args), 1, 'median')),
+    # Sample statistics, as in the statistics module; pstdev is the population standard deviation
+    'stdev': lambda *args: _at_least(_values(args), 2, 'stdev').std(ddof=1),
+    'variance': lambda *args: _at_least(_values(args), 2, 'variance').var(ddof=1),
+    'pstdev': lambda *args: _at_least(_values(args), 1, 'pstdev').std(),
+    'cumsum': lambda *args: _values(args).cumsum(),
+    'pct_change': pct_change,
+    'cagr': cagr,
+}
+
+
+def _power(base, exponent):
+    if np.any(np.abs(exponent) > MAX_EXPONENT):
+        raise ValueError(f"Exponents above {MAX_EXPONENT} are not allowed")
+    # In floats, so results overflow instead of growing into huge integers, and negative bases
+    # with fractional exponents are errors instead of complex numbers
+    if isinstance(base, np.ndarray) or isinstance(exponent, np.ndarray):
+        return np.power(np.asarray(base, dtype=float), exponent)
+    return math.pow(base, exponent)
+
+
+def _compile(node):
+    """
+    Closure computing node from a dict of variables. Anything but numbers, lists, arithmetic,
+    variables and the functions in FUNCTIONS is rejected.
+    """
+    if isinstance(node, ast.Constant):
+        if isinstance(node.value, bool) or not isinstance(node.value, (int, float)):
+            raise ValueError(f"Only numbers are allowed, got {node.value!r}")
+        value = node.value
+        return lambda env: value
+
+    if isinstance(node, ast.Name):
+        name = node.id
+
+        def variable(env):
+            if name in env:
+                return env[name]
+            if name in CONSTANTS:
+                return CONSTANTS[name]
+            raise ValueError(f"Unknown name '{name}'")
+        return variable
+
+    if isinstance(node, (ast.List, ast.Tuple)):
+        elements = [_compile(element) for element in node.elts]
+
+        def vector(env):
+            values = [element(env) for element in elements]
+            if any(isinstance(value, np.ndarray) for value in values):
+                raise ValueError("Nested lists are not supported")
+            return np.array(values, dtype=float)
+        return vector
+
+    if isinstance(node, ast.BinOp) and type(node.op) in BINARY_OPERATORS:
+        op = _power if isinstance(node.op, ast.Pow) else BINARY_OPERATORS[type(node.op)]
+        left, right = _compile(node.left), _compile(node.right)
+        return lambda env: op(left(env), right(env))
+
+    if isinstance(node, ast.UnaryOp) and type(node.op) in UNARY_OPERATORS:
+        op, operand = UNARY_OPERATORS[type(node.op)], _compile(node.operand)
+        return lambda env: op(operand(env))
+
+    if isinstance(node, ast.Call):
+        if not isinstance(node.func, ast.Name) or node.func.id not in FUNCTIONS:
+            name = node.func.id if isinstance(node.func, ast.Name) else ast.unparse(node.func)
+            raise ValueError(f"Unknown function '{name}', available: {', '.join(sorted(FUNCTIONS))}")
+        if node.keywords or any(isinstance(arg, ast.Starred) for arg in node.args):
+            raise ValueError(f"{node.func.id} only takes positional arguments")
+        function, args = FUNCTIONS[node.func.id], [_compile(arg) for arg in node.args]
+        return lambda env: function(*[arg(env) for arg in args])
+
+    raise ValueError(f"Unsupported syntax: {ast.unparse(node) if isinstance(node, ast.AST) else node}")
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def compile_program(source: str) -> tuple:
+    """
+    Compiled statements of source as (label, target variable or None, closure). Statements are
+    separated by newlines or semicolons and are either expressions or 'name = expression'.
+    Repeated sources are served from the cache without parsing.
+    """
+    if len(source) > MAX_SOURCE_LENGTH:
+        raise ValueError(f"Expressions are limited to {MAX_SOURCE_LENGTH} characters")
+    source = source.strip()
+    try:
+        tree = ast.parse(source, mode='exec')
+    except (SyntaxError, RecursionError, MemoryError) as e:
+        raise ValueError(f"Invalid expression: {e}")
+    statements = []
+    # Compiling recurses once per nesting level, as does unparsing in error messages
+    try:
+        for statement in tree.body:
+            if isinstance(statement, ast.Expr):
+                # The source text as label; unparsing a long flat sum would recurse once per term
+                label = ast.get_source_segment(source, statement.value)
+                statements.append((label, None, _compile(statement.value)))
+            elif (isinstance(statement, ast.Assign) and len(statement.targets) == 1
+                  and isinstance(statement.targets[0], ast.Name)):
+                target = statement.targets[0].id
+                if target in FUNCTIONS or target in CONSTANTS:
+                    raise ValueError(f"'{target}' is reserved")
+                statements.append((target, target, _compile(statement.value)))
+            else:
+                raise ValueError(f"Unsupported statement: {ast.get_source_segment(source, statement)}")
+    except RecursionError:
+        raise ValueError("Expression is nested too deeply")
+    if not statements:
+        raise ValueError("Nothing to calculate")
+    return tuple(statements)
+
+
+def _plain(value):
+    # numpy results back to Python numbers and lists
+    if isinstance(value, np.ndarray):
+        return [_plain(item) for item in value.tolist()]
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and value.is_integer() and abs(value) < 1e15:
+        return int(value)
+    return value
+
+
+def _finite(value) -> bool:
+    # Integers too large for a float count as too large
+    try:
+        return bool(np.all(np.isfinite(np.asarray(value, dtype=float))))
+    except (TypeError, OverflowError, ValueError):
+        return False
+
+
+def evaluate_all(source: str, variables: dict = None) -> dict:
+    """
+    Evaluate every statement of source in order; later statements can use earlier results.
+
+    Lists are evaluated element-wise: [100, 120] * 1.1 and [1, 2] + [3, 4] work like numpy arrays.
+
+    Args:
+        source (str): Statements separated by newlines or semicolons, e.g.
+            'revenue = [100, 120, 150]; pct_change(revenue); cagr(100, 150, 2)'.
+        variables (dict, optional): Numbers or lists available by name.
+
+    Returns:
+        dict: Label (the variable name or the expression text) -> result, in statement order.
+
+    Raises:
+        ValueError: On syntax outside the allowed subset, unknown names, division by zero or
+            other invalid arithmetic.
+    """
+    env = {name: np.array(value, dtype=float) if isinstance(value, (list, tuple)) else value
+           for name, value in (variables or {}).items()}
+    results = {}
+    for label, target, function in compile_program(source):
+        try:
+            with np.errstate(divide='raise', invalid='raise', over='raise'):
+                value = function(env)
+        except ValueError:
+            raise
+        except (ZeroDivisionError, FloatingPointError, OverflowError, TypeError, RecursionError) as e:
+            raise ValueError(f"Cannot calculate {label}: {e}")
+        if not _finite(value):
+            raise ValueError(f"Cannot calculate {label}: the result is too large or undefined")
+        if target is not None:
+            env[target] = value
+        results[label] = _plain(value)
+    return results
+
+
+def format_number(value, digits: int = 10) -> str:
+    """
+    value with at most digits significant digits, e.g. 110.00000000000001 -> '110'. Lists are formatted element-wise.
+    """
+    if isinstance(value, list):
+        return '[' + ', '.join(format_number(item, digits) for item in value) + ']'
+    if isinstance(value, float):
+        return f"{value:.{digits}g}"
+    return str(value)
+
+
+def evaluate(expression: str, variables: dict = None):
+    """
+    Result of the last statement of expression. See evaluate_all.
+    """
+    return list(evaluate_all(expression, variables).values())[-1]
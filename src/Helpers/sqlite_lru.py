@@ -0,0 +1,92 @@
+import logging
+import sqlite3
+import threading
+import time
+
+
+class SQLiteLRUCache:
+    """
+    Base of the on-disk caches that keep one SQLite table bounded in size.
+
+    Subclasses set TABLE and SCHEMA. The table has a 'key' primary key and 'size', 'created_at'
+    and 'last_access' columns besides its own. Once the stored sizes add up to more than
+    max_bytes, the least recently accessed rows are evicted.
+    """
+
+    # Class constants, never user input; they are formatted into the SQL below
+    TABLE = None
+    SCHEMA = None
+    ENTRY_NAME = 'entries'
+
+    def __init__(self, db_path: str, max_bytes: int = None):
+        """
+        Initializes the SQLiteLRUCache class.
+
+        Args:
+            db_path (str): Path of the SQLite database file. Use ':memory:' for a throwaway cache.
+            max_bytes (int): Size bound of the stored values. None leaves the cache unbounded.
+        """
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.executescript(self.SCHEMA)
+        self._total_bytes = self.conn.execute(f"SELECT COALESCE(SUM(size), 0) FROM {self.TABLE}").fetchone()[0]
+
+    def close(self):
+        self.conn.close()
+
+    def _touch(self, key: str, now: float = None):
+        # Called with the lock held
+        with self.conn:
+            self.conn.execute(f"UPDATE {self.TABLE} SET last_access = ? WHERE key = ?",
+                              (time.time() if now is None else now, key))
+
+    def _delete(self, key: str, size: int):
+        # Called with the lock held
+        with self.conn:
+            self.conn.execute(f"DELETE FROM {self.TABLE} WHERE key = ?", (key,))
+        self._total_bytes -= size
+
+    def _store(self, key: str, size: int, **columns):
+        """
+        Insert or replace the row of key and evict least recently used rows beyond max_bytes.
+        """
+        now = time.time()
+        names = ['key', *columns, 'size', 'created_at', 'last_access']
+        with self._lock:
+            with self.conn:
+                previous = self.conn.execute(f"SELECT size FROM {self.TABLE} WHERE key = ?", (key,)).fetchone()
+                self.conn.execute(
+                    f"INSERT OR REPLACE INTO {self.TABLE} ({', '.join(names)}) VALUES ({', '.join('?' * len(names))})",
+                    (key, *columns.values(), size, now, now),
+                )
+            self._total_bytes += size - (previous[0] if previous else 0)
+            if self.max_bytes is not None and self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        """
+        Delete least recently used rows until the cache is back under max_bytes.
+        """
+        excess = self._total_bytes - self.max_bytes
+        freed = 0
+        doomed = []
+        for key, size in self.conn.execute(f"SELECT key, size FROM {self.TABLE} ORDER BY last_access"):
+            if freed >= excess:
+                break
+            doomed.append((key,))
+            freed += size
+        with self.conn:
+            self.conn.executemany(f"DELETE FROM {self.TABLE} WHERE key = ?", doomed)
+        self._total_bytes -= freed
+        self.logger.info(f"Evicted {len(doomed)} {self.ENTRY_NAME} ({freed} bytes)")
+
+    def clear(self):
+        with self._lock:
+            with self.conn:
+                self.conn.execute(f"DELETE FROM {self.TABLE}")
+            self._total_bytes = 0
@@ -0,0 +1,90 @@
+import json
+from datetime import datetime
+from typing import List, Literal
+from pydantic import BaseModel, Field, ValidationError
+from src.Helpers.llm_registry import get_llm
+
+# Completion limit for agents that answer with one of the models below. A decision fits in
+# well under 100 tokens; the rest leaves room for the agent's 'Thought:' line.
+STRUCTURED_OUTPUT_MAX_TOKENS = 300
+
+
+class TradeDecision(BaseModel):
+    action: Literal['buy', 'sell', 'hold']
+    confidence: float = Field(ge=0.0, le=1.0, description="0 = no conviction, 1 = certain")
+    rationale: str = Field(max_length=300, description="One or two sentences")
+
+
+class DivergenceSignals(BaseModel):
+    bullish_dates: List[datetime] = Field(description="Dates of confirmed bullish divergences")
+    bearish_dates: List[datetime] = Field(description="Dates of confirmed bearish divergences")
+    action: Literal['buy', 'sell', 'hold']
+    confidence: float = Field(ge=0.0, le=1.0)
+
+
+class CorrelationResult(BaseModel):
+    stock1: str
+    stock2: str
+    correlation: float = Field(ge=-1.0, le=1.0, description="Pearson correlation of the closing prices")
+    suitable_for_pairs_trading: bool
+
+
+class SectorPrediction(BaseModel):
+    sector: str
+    expected_return: float = Field(ge=-1.0, le=1.0, description="Expected return as a decimal, e.g. 0.05 for +5%")
+    confidence: float = Field(ge=0.0, le=1.0)
+
+
+class SectorForecast(BaseModel):
+    predictions: List[SectorPrediction]
+
+
+def structured_llm(model: str = "gpt-4o"):
+    """
+    Shared deterministic LLM with the short completion limit for structured answers.
+    """
+    return get_llm(model, temperature=0.0, max_tokens=STRUCTURED_OUTPUT_MAX_TOKENS)
+
+
+def expected_json(model_class) -> str:
+    """
+    expected_output text for a task answered with model_class. crewai appends the schema itself.
+    """
+    return f"Only a JSON object matching the {model_class.__name__} schema, with no other text."
+
+
+def parse_structured(output, model_class):
+    """
+    Get a validated model_class instance from a crew or task result.
+
+    Uses the pydantic object crewai already validated (task output_pydantic) when there is one,
+    then the JSON dict, then the JSON object embedded in the raw text.
+
+    Args:
+        output: A CrewOutput, a TaskOutput, a dict or a string.
+        model_class (type): The pydantic model expected.
+
+    Returns:
+        The model_class instance.
+
+    Raises:
+        ValueError: If the output holds no valid model_class JSON.
+    """
+    if isinstance(output, model_class):
+        return output
+    if getattr(output, 'pydantic', None) is not None and isinstance(output.pydantic, model_class):
+        return output.pydantic
+    try:
+        if getattr(output, 'json_dict', None):
+            return model_class.model_validate(output.json_dict)
+        if isinstance(output, dict):
+            return model_class.model_validate(output)
+        raw = output if isinstance(output, str) else getattr(output, 'raw', None)
+        if not raw:
+            raise ValueError(f"No output to parse as {model_class.__name__}.")
+        start, end = raw.find('{'), raw.rfind('}')
+        if start < 0 or end < start:
+            raise ValueError(f"No JSON object in output: {raw[:200]!r}")
+        return model_class.model_validate_json(raw[start:end + 1])
+    except (ValidationError, json.JSONDecodeError) as e:
+        raise ValueError(f"Output does not match {model_class.__name__}: {e}") from e
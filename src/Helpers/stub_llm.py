@@ -0,0 +1,148 @@
+import json
+import logging
+import os
+import random
+import re
+import threading
+import time
+from datetime import datetime
+from string import Template
+from litellm.types.utils import Usage
+from src.Helpers.llm_cache import CachedLLM
+from src.Helpers.prompt_compaction import count_tokens
+
+DEFAULT_RESPONSE = (
+    "Thought: I now know the final answer\n"
+    "Final Answer: Stub analysis from $model. No live model was called. Recommendation: HOLD"
+)
+
+
+def _message_text(messages) -> str:
+    if isinstance(messages, str):
+        return messages
+    return "\n".join(str(message.get('content') or '') for message in messages)
+
+
+class StubLLM(CachedLLM):
+    """
+    Local stand-in for an OpenAI model that answers from a script instead of the API.
+    Responses, latency and token counts are deterministic for a given seed, so crews,
+    backtests and alert loops can be load-tested offline.
+    """
+
+    def __init__(self, model: str = 'gpt-4o', responses=None, default_response: str = DEFAULT_RESPONSE,
+                 latency: float = 0.0, latency_per_token: float = 0.0, jitter: float = 0.0,
+                 prompt_tokens: int = None, completion_tokens: int = None, seed: int = 0, **kwargs):
+        """
+        Initializes the StubLLM class.
+
+        Args:
+            model (str): Model name reported to crewai, the token ledger and pricing. Keep the
+                name of the model being stood in for so context windows and costs match.
+            responses (list): Rules as (pattern, template) pairs or {'pattern', 'response'} dicts.
+                The first pattern found (re.search) in the text of all messages picks the template.
+                Templates are string.Template strings: $model, $prompt_tokens and the named groups
+                of the pattern are substituted; other $ text is left alone.
+            default_response (str): Template used when no rule matches. crewai agents stop at
+                the first 'Final Answer:', so one call finishes a task.
+            latency (float): Seconds every call takes.
+            latency_per_token (float): Extra seconds per completion token, to mimic generation speed.
+            jitter (float): Up to this many extra seconds per call, drawn from a generator seeded with seed.
+            prompt_tokens (int, optional): Fixed prompt token count. Counted from the messages if None.
+            completion_tokens (int, optional): Fixed completion token count. Counted from the response if None.
+            seed (int): Seed of the jitter generator.
+            **kwargs: Passed to crewai.LLM (temperature, max_tokens, ...).
+        """
+        super().__init__(model=model, **kwargs)
+        self.rules = []
+        for rule in responses or []:
+            pattern, template = (rule['pattern'], rule['response']) if isinstance(rule, dict) else rule
+            self.rules.append((re.compile(pattern, re.IGNORECASE | re.DOTALL), template))
+        self.default_response = default_response
+        self.latency = latency
+        self.latency_per_token = latency_per_token
+        self.jitter = jitter
+        self.prompt_tokens = prompt_tokens
+        self.completion_tokens = completion_tokens
+        self.calls = 0
+        self.total_latency = 0.0
+        self._random = random.Random(seed)
+        self._stats_lock = threading.Lock()
+
+    @classmethod
+    def from_file(cls, path: str, **kwargs):
+        """
+        Build a stub from a JSON script: {"responses": [{"pattern": ..., "response": ...}], "default": ...}.
+        """
+        with open(path) as f:
+            script = json.load(f)
+        if 'default' in script:
+            kwargs.setdefault('default_response', script['default'])
+        return cls(responses=script.get('responses', []), **kwargs)
+
+    def respond(self, messages) -> tuple:
+        """
+        The scripted response to messages and its (prompt, completion) token counts, without latency.
+        """
+        text = _message_text(messages)
+        prompt_tokens = self.prompt_tokens if self.prompt_tokens is not None else count_tokens(text, self.model)
+        template, groups = self.default_response, {}
+        for pattern, rule_template in self.rules:
+            match = pattern.search(text)
+            if match:
+                template, groups = rule_template, match.groupdict(default='')
+                break
+        response = Template(template).safe_substitute(model=self.model, prompt_tokens=prompt_tokens, **groups)
+        completion_tokens = (self.completion_tokens if self.completion_tokens is not None
+                             else count_tokens(response, self.model))
+        return response, prompt_tokens, completion_tokens
+
+    def _complete(self, messages, callbacks):
+        start_time = datetime.now()
+        response, prompt_tokens, completion_tokens = self.respond(messages)
+        with self._stats_lock:
+            delay = self.latency + self.latency_per_token * completion_tokens
+            if self.jitter:
+                delay += self._random.uniform(0, self.jitter)
+            self.calls += 1
+            self.total_latency += delay
+        if delay > 0:
+            time.sleep(delay)
+
+        # Report usage the way litellm does, so crewai token counts and the TokenBudget ledger work unchanged
+        usage = Usage(prompt_tokens=prompt_tokens, completion_tokens=completion_tokens,
+                      total_tokens=prompt_tokens + completion_tokens)
+        for callback in callbacks or []:
+            if hasattr(callback, 'log_success_event'):
+                callback.log_success_event(kwargs={'model': self.model, 'messages': messages},
+                                           response_obj={'usage': usage},
+                                           start_time=start_time, end_time=datetime.now())
+        return response
+
+    def call(self, messages, callbacks=[]) -> str:
+        # Never served from the response cache: every call should cost its simulated latency
+        return self._call_api(messages, callbacks)
+
+
+def stub_llm_from_env(model: str = 'gpt-4o', **kwargs) -> StubLLM:
+    """
+    StubLLM configured from the environment: LLM_STUB_SCRIPT (JSON script path), LLM_STUB_LATENCY,
+    LLM_STUB_LATENCY_PER_TOKEN, LLM_STUB_JITTER (seconds), LLM_STUB_PROMPT_TOKENS,
+    LLM_STUB_COMPLETION_TOKENS and LLM_STUB_SEED.
+    """
+    settings = {
+        'latency': float(os.getenv('LLM_STUB_LATENCY', 0)),
+        'latency_per_token': float(os.getenv('LLM_STUB_LATENCY_PER_TOKEN', 0)),
+        'jitter': float(os.getenv('LLM_STUB_JITTER', 0)),
+        'seed': int(os.getenv('LLM_STUB_SEED', 0)),
+    }
+    for name in ('prompt_tokens', 'completion_tokens'):
+        value = os.getenv(f'LLM_STUB_{name.upper()}')
+        if value:
+            settings[name] = int(value)
+    settings.update(kwargs)
+    script = os.getenv('LLM_STUB_SCRIPT')
+    if script:
+        logging.getLogger(__name__).info(f"Stub LLM for {model} scripted from {script}")
+        return StubLLM.from_file(script, model=model, **settings)
+    return StubLLM(model=model, **settings)
@@ -0,0 +1,150 @@
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from textwrap import dedent
+from src.Helpers.llm_registry import get_llm
+from src.Helpers.text_extraction import dedupe_text
+
+DEFAULT_CHUNK_SIZE = 8000
+DEFAULT_MAX_WORKERS = 4
+SUMMARY_MAX_TOKENS = 500
+# Chunk summaries kept in memory; the LLM response cache keeps them across runs
+DEFAULT_CACHE_ENTRIES = 1024
+
+MAP_PROMPT = dedent("""
+    Analyze and summarize the content below, make sure to include the most relevant information in the summary, return only the summary nothing else.
+
+    CONTENT
+    ----------
+    {content}
+""")
+
+REDUCE_PROMPT = dedent("""
+    The summaries below cover consecutive parts of the same web page. Merge them into one concise
+    summary of the most relevant information, without repeating points. Return only the summary nothing else.
+
+    SUMMARIES
+    ----------
+    {content}
+""")
+
+
+def chunk_text(text: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> list:
+    """
+    Split text into chunks of at most chunk_size characters, on line boundaries where possible.
+    """
+    chunks, current, length = [], [], 0
+    for line in text.splitlines():
+        while len(line) > chunk_size:
+            if current:
+                chunks.append('\n'.join(current))
+                current, length = [], 0
+            chunks.append(line[:chunk_size])
+            line = line[chunk_size:]
+        if length + len(line) + 1 > chunk_size and current:
+            chunks.append('\n'.join(current))
+            current, length = [], 0
+        current.append(line)
+        length += len(line) + 1
+    if current:
+        chunks.append('\n'.join(current))
+    return chunks
+
+
+class MapReduceSummarizer:
+    def __init__(self, llm=None, chunk_size: int = DEFAULT_CHUNK_SIZE, max_workers: int = DEFAULT_MAX_WORKERS,
+                 rate_limiter=None, cache_entries: int = DEFAULT_CACHE_ENTRIES):
+        """
+        Initializes the MapReduceSummarizer class.
+
+        Summarizes long text by summarizing its chunks concurrently (map) and merging the chunk
+        summaries in one more call (reduce), so a page of many chunks takes about two model round
+        trips instead of one per chunk.
+
+        Args:
+            llm (optional): crewai LLM to call. The shared deterministic GPT-4o client if None.
+            chunk_size (int): Characters per chunk.
+            max_workers (int): Chunk summaries requested at the same time.
+            rate_limiter (RateLimiter, optional): Applied to every summary request, on top of the
+                global limits of CachedLLM.
+            cache_entries (int): Chunk summaries kept in memory, keyed by content hash.
+        """
+        self.llm = llm or get_llm("gpt-4o", temperature=0.0, max_tokens=SUMMARY_MAX_TOKENS)
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers
+        self.rate_limiter = rate_limiter
+        self.cache_entries = cache_entries
+        self.llm_calls = 0
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _ask(self, prompt_template: str, content: str) -> str:
+        key = hashlib.sha256(f"{prompt_template}\0{content}".encode('utf-8')).hexdigest()
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        summary = self.llm.call([{'role': 'user', 'content': prompt_template.format(content=content)}])
+        with self._lock:
+            self.llm_calls += 1
+            self._cache[key] = summary
+            if len(self._cache) > self.cache_entries:
+                self._cache.popitem(last=False)
+        return summary
+
+    def summarize_chunks(self, chunks: list) -> list:
+        """
+        Summaries of chunks, requested concurrently. Identical chunks are summarized once.
+        """
+        if len(chunks) == 1:
+            return [self._ask(MAP_PROMPT, chunks[0])]
+        unique = list(dict.fromkeys(chunks))
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(unique))) as executor:
+            summaries = dict(zip(unique, executor.map(lambda chunk: self._ask(MAP_PROMPT, chunk), unique)))
+        return [summaries[chunk] for chunk in chunks]
+
+    def reduce(self, summaries: list) -> str:
+        """
+        Merge chunk summaries into one. Summaries too long for one request are merged in groups first.
+        """
+        summaries = list(dict.fromkeys(summaries))
+        while len(summaries) > 1:
+            groups = chunk_text('\n\n'.join(summaries), self.chunk_size)
+            if len(groups) == 1:
+                return self._ask(REDUCE_PROMPT, groups[0])
+            if len(groups) >= len(summaries):
+                # Each summary fills a request on its own; merging cannot shrink them further
+                return '\n\n'.join(summaries)
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(groups))) as executor:
+                summaries = list(executor.map(lambda group: self._ask(REDUCE_PROMPT, group), groups))
+        return summaries[0] if summaries else ''
+
+    def summarize(self, text: str) -> str:
+        """
+        Summary of text: boilerplate lines removed, chunks summarized concurrently, summaries merged.
+        """
+        chunks = chunk_text(dedupe_text(text), self.chunk_size)
+        if not chunks:
+            return ''
+        self.logger.info(f"Summarizing {len(text)} characters in {len(chunks)} chunks")
+        return self.reduce(self.summarize_chunks(chunks))
+
+
+_summarizer = None
+_summarizer_lock = threading.Lock()
+
+
+def summarize_text(text: str) -> str:
+    """
+    Summary of text by the process-wide summarizer, whose chunk cache is shared by all tools.
+    """
+    global _summarizer
+    with _summarizer_lock:
+        if _summarizer is None:
+            _summarizer = MapReduceSummarizer()
+    return _summarizer.summarize(text)
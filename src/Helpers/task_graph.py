@@ -0,0 +1,128 @@
+import logging
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from crewai.crews.crew_output import CrewOutput
+from crewai.types.usage_metrics import UsageMetrics
+from crewai.utilities.formatter import aggregate_raw_outputs_from_task_outputs
+from src.Helpers.token_budget import agent_token_usage
+
+
+class TaskGraphExecutor:
+    def __init__(self, agents, tasks, dependencies: dict = None, max_workers: int = 4):
+        """
+        Initializes the TaskGraphExecutor class.
+
+        Runs crewai tasks as a dependency graph instead of a fixed sequence. A task waits only
+        for the tasks it depends on and receives their outputs as context; independent tasks
+        run concurrently. Tasks assigned to the same agent never run at the same time because
+        a crewai agent keeps per-task executor state.
+
+        Args:
+            agents (list): The agents, as for crewai.Crew.
+            tasks (list): The tasks, as for crewai.Crew. The last task's output is the final output.
+            dependencies (dict, optional): Maps a task to the tasks it needs. Tasks not listed
+                use their crewai 'context' and are independent without one.
+            max_workers (int): Maximum number of tasks running at once.
+        """
+        self.agents = list(agents)
+        self.tasks = list(tasks)
+        self.max_workers = max_workers
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.dependencies = {}
+        for task in self.tasks:
+            if task.agent is None:
+                raise ValueError(f"Task '{task.description[:40].strip()}' has no agent.")
+            if dependencies and task in dependencies:
+                needs = list(dependencies[task])
+            else:
+                needs = list(task.context or [])
+            unknown = [dep for dep in needs if dep not in self.tasks]
+            if unknown:
+                raise ValueError(f"Task '{task.description[:40].strip()}' depends on a task that is not in the graph.")
+            self.dependencies[task] = needs
+        self.levels = self._levels()
+
+    def _levels(self) -> dict:
+        """
+        Longest dependency chain leading to every task; raises ValueError on cycles.
+        """
+        levels = {}
+        visiting = set()
+
+        def level(task):
+            if task in levels:
+                return levels[task]
+            if task in visiting:
+                raise ValueError("Task dependencies contain a cycle.")
+            visiting.add(task)
+            levels[task] = 1 + max((level(dep) for dep in self.dependencies[task]), default=0)
+            visiting.discard(task)
+            return levels[task]
+
+        for task in self.tasks:
+            level(task)
+        return levels
+
+    @property
+    def critical_path_length(self) -> int:
+        """
+        Number of tasks on the longest dependency chain.
+        """
+        return max(self.levels.values(), default=0)
+
+    def _run_task(self, task, agent_locks):
+        needs = self.dependencies[task]
+        context = aggregate_raw_outputs_from_task_outputs([dep.output for dep in needs]) if needs else None
+        agent = task.agent
+        with agent_locks[id(agent)]:
+            tools = task.tools or agent.tools or []
+            return task.execute_sync(agent=agent, context=context, tools=tools)
+
+    def kickoff(self, inputs: dict = None) -> CrewOutput:
+        """
+        Run every task once its dependencies have finished.
+
+        Args:
+            inputs (dict, optional): Values interpolated into task and agent templates, as in Crew.kickoff().
+
+        Returns:
+            CrewOutput: Outputs of all tasks in their original order and the summed token usage.
+        """
+        if inputs:
+            for task in self.tasks:
+                task.interpolate_inputs(inputs)
+            for agent in self.agents:
+                agent.interpolate_inputs(inputs)
+
+        agent_locks = {id(task.agent): threading.Lock() for task in self.tasks}
+        remaining = {task: set(self.dependencies[task]) for task in self.tasks}
+        done = set()
+        running = {}
+        self.logger.info(f"Running {len(self.tasks)} tasks, critical path of {self.critical_path_length}")
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            while remaining or running:
+                ready = [task for task, needs in remaining.items() if needs <= done]
+                for task in ready:
+                    del remaining[task]
+                    running[pool.submit(self._run_task, task, agent_locks)] = task
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    task = running.pop(future)
+                    # Re-raises the task's exception; tasks that were not started yet never are
+                    future.result()
+                    done.add(task)
+
+        outputs = [task.output for task in self.tasks]
+        final = outputs[-1]
+        usage = UsageMetrics()
+        all_agents = self.agents + [task.agent for task in self.tasks]
+        for agent in {id(agent): agent for agent in all_agents}.values():
+            usage.add_usage_metrics(agent_token_usage(agent))
+        return CrewOutput(
+            raw=final.raw,
+            pydantic=final.pydantic,
+            json_dict=final.json_dict,
+            tasks_output=outputs,
+            token_usage=usage,
+        )
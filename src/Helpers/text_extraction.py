@@ -0,0 +1,147 @@
+import re
+
+# BeautifulSoup is imported on first use so the tools that list this helper stay cheap to import
+
+# Never content
+NON_CONTENT_TAGS = ('script', 'style', 'noscript', 'template', 'svg', 'canvas', 'iframe', 'head', 'object', 'embed')
+# Page furniture around the main content
+BOILERPLATE_TAGS = ('nav', 'header', 'footer', 'aside', 'form', 'button', 'select', 'dialog')
+BOILERPLATE_ATTRIBUTE = re.compile(
+    r'(^|[\s_-])(nav|navbar|menu|breadcrumbs?|footer|sidebar|cookie|consent|banner|share|social|comments?|'
+    r'advert|ads?|promo|subscribe|newsletter|related|recommended|popup|modal)([\s_-]|$)',
+    re.IGNORECASE,
+)
+# Containers that are never treated as boilerplate, whatever their class names say
+CONTENT_ATTRIBUTE = re.compile(r'article|body|content|entry|main|post|story|text', re.IGNORECASE)
+# Elements that start a new line of text; other tags (b, a, span, ...) stay inline
+LINE_BREAK_TAGS = ('p', 'div', 'section', 'article', 'main', 'li', 'ul', 'ol', 'dl', 'dt', 'dd', 'tr', 'table',
+                   'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'pre', 'blockquote', 'br', 'hr', 'figure', 'figcaption')
+# Elements whose text is scored for the main-content search, as in readability
+TEXT_BLOCKS = ('p', 'pre', 'td', 'blockquote', 'li')
+MIN_BLOCK_LENGTH = 25
+# Siblings of the best container scoring at least this share of it are part of the content too
+SIBLING_SHARE = 0.2
+
+
+def dedupe_text(text: str) -> str:
+    """
+    Text with whitespace collapsed, empty lines dropped and repeated lines (menus, footers,
+    share buttons) kept only once.
+    """
+    seen = set()
+    lines = []
+    for line in text.splitlines():
+        line = ' '.join(line.split())
+        if not line:
+            continue
+        key = line.lower()
+        if key in seen:
+            continue
+        seen.add(key)
+        lines.append(line)
+    return '\n'.join(lines)
+
+
+def collapse_whitespace(text: str) -> str:
+    """
+    Text with runs of spaces collapsed and empty lines dropped.
+    """
+    lines = (' '.join(line.split()) for line in text.splitlines())
+    return '\n'.join(line for line in lines if line)
+
+
+def _is_boilerplate(element) -> bool:
+    if element.name in ('body', 'article', 'main'):
+        return False
+    if element.get('role') == 'navigation':
+        return True
+    attributes = ' '.join([element.get('id') or ''] + list(element.get('class') or []))
+    return bool(BOILERPLATE_ATTRIBUTE.search(attributes)) and not CONTENT_ATTRIBUTE.search(attributes)
+
+
+def _text(node) -> str:
+    # Line breaks between block elements and spaces between table cells; inline markup stays on its line
+    for element in node.find_all(LINE_BREAK_TAGS):
+        element.insert_before('\n')
+        element.insert_after('\n')
+    for element in node.find_all(('td', 'th')):
+        element.insert_after(' ')
+    return node.get_text()
+
+
+def _link_density(element, text_length: int) -> float:
+    if not text_length:
+        return 1.0
+    link_length = sum(len(link.get_text(' ', strip=True)) for link in element.find_all('a'))
+    return min(link_length / text_length, 1.0)
+
+
+def _main_content(root):
+    """
+    The containers holding the page's main text, found by readability-style density scoring:
+    text blocks score by length and commas, their parent and grandparent collect the scores,
+    and link-heavy containers are penalized.
+    """
+    candidates = {}
+    for block in root.find_all(TEXT_BLOCKS):
+        text = block.get_text(' ', strip=True)
+        if len(text) < MIN_BLOCK_LENGTH:
+            continue
+        score = 1 + text.count(',') + min(len(text) // 100, 3)
+        for ancestor, share in ((block.parent, 1.0), (block.parent.parent if block.parent else None, 0.5)):
+            if ancestor is None or ancestor.name is None or ancestor.name == '[document]':
+                continue
+            entry = candidates.setdefault(id(ancestor), [ancestor, 0.0])
+            entry[1] += score * share
+
+    if not candidates:
+        return [root]
+    for entry in candidates.values():
+        element = entry[0]
+        entry[1] *= 1 - _link_density(element, len(element.get_text(' ', strip=True)))
+    best, best_score = max(candidates.values(), key=lambda entry: entry[1])
+    if best.parent is None:
+        return [best]
+
+    scores = {key: score for key, (_, score) in candidates.items()}
+    return [sibling for sibling in best.parent.find_all(recursive=False)
+            if sibling is best or scores.get(id(sibling), 0.0) >= best_score * SIBLING_SHARE]
+
+
+def extract_text(html: str, main_content: bool = True, dedupe: bool = True) -> str:
+    """
+    Readable text of an HTML page, ready for chunking.
+
+    Scripts, styles and other non-content elements are always removed and whitespace is collapsed.
+
+    Args:
+        html (str): The page HTML.
+        main_content (bool): Also drop navigation, headers, footers, sidebars and similar page
+            furniture, and keep only the containers with the densest text. Turn off for
+            documents such as SEC filings where all text matters.
+        dedupe (bool): Keep repeated lines only once. Turn off for tables, where repeated cells
+            are data.
+
+    Returns:
+        str: The text, one block per line.
+    """
+    from bs4 import BeautifulSoup, Comment
+
+    soup = BeautifulSoup(html, 'html.parser')
+    for element in soup.find_all(NON_CONTENT_TAGS):
+        element.decompose()
+    for comment in soup.find_all(string=lambda string: isinstance(string, Comment)):
+        comment.extract()
+
+    root = soup.body or soup
+    nodes = [root]
+    if main_content:
+        for element in root.find_all(BOILERPLATE_TAGS):
+            element.decompose()
+        for element in [element for element in root.find_all(True) if _is_boilerplate(element)]:
+            if not element.decomposed:
+                element.decompose()
+        nodes = _main_content(root)
+
+    text = '\n'.join(_text(node) for node in nodes)
+    return dedupe_text(text) if dedupe else collapse_whitespace(text)
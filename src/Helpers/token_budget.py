@@ -0,0 +1,234 @@
+import json
+import logging
+import os
+import threading
+import uuid
+from datetime import datetime
+import pandas as pd
+from src.Helpers.prompt_compaction import DEFAULT_MODEL, count_tokens, truncate_middle
+
+# USD per token as (input, output)
+MODEL_PRICING = {
+    'gpt-4o': (2.5 / 1e6, 10.0 / 1e6),
+    'gpt-4o-mini': (0.15 / 1e6, 0.6 / 1e6),
+    'gpt-4': (30.0 / 1e6, 60.0 / 1e6),
+    'gpt-4-turbo': (10.0 / 1e6, 30.0 / 1e6),
+    'gpt-3.5-turbo': (0.5 / 1e6, 1.5 / 1e6),
+}
+
+DEFAULT_TASK_TOKENS = 4000
+DEFAULT_CREW_TOKENS = 60000
+
+# Prompt tokens crewai adds around every task (role/goal/backstory, tool and format instructions)
+AGENT_PROMPT_OVERHEAD = 400
+
+
+class TokenBudgetExceeded(ValueError):
+    """Raised when a crew run would exceed, or has exceeded, its token ceiling."""
+
+
+def model_pricing(model: str):
+    """
+    (input, output) USD price per token for a model name such as 'gpt-4o' or 'openai/gpt-4o'.
+    Unknown models are priced like gpt-4o.
+    """
+    name = (model or DEFAULT_MODEL).split('/')[-1]
+    for known in sorted(MODEL_PRICING, key=len, reverse=True):
+        if name.startswith(known):
+            return MODEL_PRICING[known]
+    return MODEL_PRICING[DEFAULT_MODEL]
+
+
+def token_cost(model: str, prompt_tokens: int, completion_tokens: int) -> float:
+    input_cost, output_cost = model_pricing(model)
+    return prompt_tokens * input_cost + completion_tokens * output_cost
+
+
+def _model_name(agent) -> str:
+    llm = getattr(agent, 'llm', None)
+    return getattr(llm, 'model', None) or getattr(llm, 'model_name', None) or DEFAULT_MODEL
+
+
+def agent_token_usage(agent):
+    """
+    Cumulative token usage of a crewai agent as a UsageMetrics.
+
+    crewai only publishes usage per crew run (CrewOutput.token_usage), summed from a counter each
+    agent keeps privately; per-task accounting reads that counter, and only here. An agent without
+    it reports no usage and a warning is logged, so a crewai upgrade degrades the accounting
+    instead of failing the run.
+    """
+    from crewai.types.usage_metrics import UsageMetrics
+    token_process = getattr(agent, '_token_process', None)
+    if token_process is None or not hasattr(token_process, 'get_summary'):
+        logging.getLogger(__name__).warning(
+            f"{type(agent).__name__} exposes no token counter, its usage is not counted")
+        return UsageMetrics()
+    return token_process.get_summary()
+
+
+class TokenLedger:
+    def __init__(self, path: str = "./token_ledger.jsonl"):
+        """
+        Initializes the TokenLedger class.
+
+        Args:
+            path (str): JSON Lines file the usage records are appended to. None keeps them in memory.
+        """
+        self.path = path
+        self.records = []
+        self._lock = threading.Lock()
+
+    def record(self, **entry) -> dict:
+        """
+        Append a usage record (run_id, crew, task, agent, model, token counts, cost, ...).
+        """
+        entry = {'timestamp': datetime.now().isoformat(), **entry}
+        with self._lock:
+            self.records.append(entry)
+            if self.path:
+                with open(self.path, 'a') as f:
+                    f.write(json.dumps(entry, default=str) + "\n")
+        return entry
+
+    def load(self) -> pd.DataFrame:
+        """
+        All records in the ledger file (or in memory when there is no file).
+        """
+        if self.path and os.path.exists(self.path):
+            with open(self.path) as f:
+                return pd.DataFrame([json.loads(line) for line in f if line.strip()])
+        return pd.DataFrame(self.records)
+
+    def summary(self, by=('agent',)) -> pd.DataFrame:
+        """
+        Token counts and cost summed per agent, task, run or model.
+        """
+        records = self.load()
+        if records.empty:
+            return records
+        columns = ['prompt_tokens', 'completion_tokens', 'total_tokens', 'cost_usd']
+        return records.groupby(list(by))[columns].sum().sort_values('cost_usd', ascending=False)
+
+
+class TokenBudget:
+    def __init__(self, per_task_tokens: int = DEFAULT_TASK_TOKENS, per_crew_tokens: int = DEFAULT_CREW_TOKENS,
+                 ledger: TokenLedger = None, crew_name: str = 'crew'):
+        """
+        Initializes the TokenBudget class.
+
+        Args:
+            per_task_tokens (int): Ceiling on the prompt tokens of a single task description.
+                Longer descriptions are truncated in the middle before the run.
+            per_crew_tokens (int): Ceiling on the total tokens of a crew run. Checked pre-flight
+                against the estimate and after every task against actual usage.
+            ledger (TokenLedger, optional): Where per-task usage is recorded.
+            crew_name (str): Name stored with every ledger record.
+        """
+        self.per_task_tokens = per_task_tokens
+        self.per_crew_tokens = per_crew_tokens
+        self.ledger = ledger if ledger is not None else TokenLedger()
+        self.crew_name = crew_name
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def fit_task(self, task) -> int:
+        """
+        Truncate a task description to the per-task ceiling.
+
+        Returns:
+            int: The estimated prompt tokens of the task after fitting.
+        """
+        model = _model_name(task.agent)
+        tokens = count_tokens(task.description, model)
+        if tokens > self.per_task_tokens:
+            self.logger.warning(f"Task description of {tokens} tokens truncated to {self.per_task_tokens}")
+            task.description = truncate_middle(task.description, self.per_task_tokens, model)
+            tokens = count_tokens(task.description, model)
+        return tokens + count_tokens(task.expected_output or '', model) + AGENT_PROMPT_OVERHEAD
+
+    def preflight(self, tasks) -> dict:
+        """
+        Fit every task and check the estimated prompt tokens against the crew ceiling.
+
+        Returns:
+            dict: Estimated prompt tokens per task description and in total.
+
+        Raises:
+            TokenBudgetExceeded: If the estimate is over the crew ceiling.
+        """
+        estimates = {}
+        for i, task in enumerate(tasks):
+            estimates[f"{i}: {task.description[:60].strip()}"] = self.fit_task(task)
+        total = sum(estimates.values())
+        if total > self.per_crew_tokens:
+            raise TokenBudgetExceeded(
+                f"Estimated {total} prompt tokens exceed the crew budget of {self.per_crew_tokens}.")
+        return {'tasks': estimates, 'total': total}
+
+    def run(self, crew, inputs: dict = None):
+        """
+        Run a crew within the budget: pre-flight check, then record actual usage of every task
+        in the ledger and stop the run once the crew ceiling is exceeded.
+
+        Args:
+            crew (crewai.Crew | TaskGraphExecutor): The crew to run. Tasks of the same agent
+                must not overlap, which holds for both.
+            inputs (dict, optional): Values interpolated into the task and agent templates, as in
+                crew.kickoff(). Interpolated before the pre-flight check, so the budget applies to
+                the prompts that are sent.
+
+        Returns:
+            CrewOutput: The crew output.
+        """
+        if inputs:
+            # kickoff(inputs) would rebuild every description from its template and undo the truncation
+            for task in crew.tasks:
+                task.interpolate_inputs(inputs)
+            for agent in crew.agents:
+                agent.interpolate_inputs(inputs)
+        estimate = self.preflight(crew.tasks)
+        run_id = uuid.uuid4().hex[:12]
+        usage = {'total': 0}
+        usage_lock = threading.Lock()
+        # Token counters are cumulative per agent, so each task's usage is the delta since the last task
+        last_seen = {id(agent): agent_token_usage(agent) for agent in crew.agents}
+
+        def make_callback(task, original_callback):
+            def callback(output):
+                agent = task.agent
+                model = _model_name(agent)
+                with usage_lock:
+                    before = last_seen.get(id(agent))
+                    after = agent_token_usage(agent)
+                    last_seen[id(agent)] = after
+                    prompt_tokens = after.prompt_tokens - (before.prompt_tokens if before else 0)
+                    completion_tokens = after.completion_tokens - (before.completion_tokens if before else 0)
+                    usage['total'] += prompt_tokens + completion_tokens
+                self.ledger.record(
+                    run_id=run_id,
+                    crew=self.crew_name,
+                    task=task.name or task.description[:60].strip(),
+                    agent=agent.role,
+                    model=model,
+                    prompt_tokens=prompt_tokens,
+                    completion_tokens=completion_tokens,
+                    total_tokens=prompt_tokens + completion_tokens,
+                    requests=after.successful_requests - (before.successful_requests if before else 0),
+                    cost_usd=token_cost(model, prompt_tokens, completion_tokens),
+                    estimated_total=estimate['total'],
+                )
+                if original_callback:
+                    original_callback(output)
+                if usage['total'] > self.per_crew_tokens:
+                    raise TokenBudgetExceeded(
+                        f"Crew used {usage['total']} tokens, over its budget of {self.per_crew_tokens}.")
+            return callback
+
+        originals = [task.callback for task in crew.tasks]
+        for task, original in zip(crew.tasks, originals):
+            task.callback = make_callback(task, original)
+        try:
+            return crew.kickoff()
+        finally:
+            for task, original in zip(crew.tasks, originals):
+                task.callback = original
@@ -0,0 +1,198 @@
+import hashlib
+import json
+import os
+import threading
+import time
+import requests
+from src.Helpers.sqlite_lru import SQLiteLRUCache
+
+DEFAULT_CACHE_PATH = "./web_cache.db"
+# Search results change within hours; article texts rarely change once published
+DEFAULT_SEARCH_TTL_SECONDS = 3600
+DEFAULT_ARTICLE_TTL_SECONDS = 7 * 24 * 3600
+DEFAULT_MAX_BYTES = 128 * 1024 * 1024
+SERPER_URL = "https://google.serper.dev/{endpoint}"
+SERPER_TIMEOUT = 15.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    value TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_entries_last_access ON entries (last_access);
+"""
+
+
+def _key(*parts) -> str:
+    encoded = json.dumps(parts, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+class WebCache(SQLiteLRUCache):
+    TABLE = 'entries'
+    SCHEMA = SCHEMA
+    ENTRY_NAME = 'cached web entries'
+
+    def __init__(self, db_path: str = DEFAULT_CACHE_PATH, search_ttl_seconds: float = DEFAULT_SEARCH_TTL_SECONDS,
+                 article_ttl_seconds: float = DEFAULT_ARTICLE_TTL_SECONDS, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initializes the WebCache class.
+
+        Keeps Serper search responses (keyed by endpoint and query) and scraped article texts
+        (keyed by URL) on disk, so crews re-run on the same ticker do not repeat the searches
+        or downloads. Stale articles keep their ETag and Last-Modified headers so they can be
+        revalidated with a conditional request instead of downloaded again.
+
+        Args:
+            db_path (str): Path of the SQLite database file. Use ':memory:' for a throwaway cache.
+            search_ttl_seconds (float): Age after which a search response is a miss.
+            article_ttl_seconds (float): Age after which an article has to be revalidated.
+            max_bytes (int): Size bound of the stored values. The least recently used entries
+                are evicted once it is exceeded.
+        """
+        self.search_ttl_seconds = search_ttl_seconds
+        self.article_ttl_seconds = article_ttl_seconds
+        super().__init__(db_path, max_bytes)
+
+    def _get(self, key: str):
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT value, etag, last_modified, created_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                self._touch(key)
+        return row
+
+    def _set(self, key: str, kind: str, value: str, etag: str = None, last_modified: str = None):
+        self._store(key, len(value.encode('utf-8')), kind=kind, value=value, etag=etag, last_modified=last_modified)
+
+    def _count(self, hit: bool):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def get_search(self, endpoint: str, query: str):
+        """
+        The cached Serper response for endpoint and query, or None on a miss or an expired entry.
+        """
+        row = self._get(_key('search', endpoint, query))
+        fresh = row is not None and (self.search_ttl_seconds is None
+                                     or time.time() - row[3] <= self.search_ttl_seconds)
+        self._count(fresh)
+        return json.loads(row[0]) if fresh else None
+
+    def set_search(self, endpoint: str, query: str, response: dict):
+        self._set(_key('search', endpoint, query), 'search', json.dumps(response))
+
+    def get_article(self, url: str):
+        """
+        The cached article for url.
+
+        Returns:
+            dict: {'text', 'etag', 'last_modified', 'fresh'}, or None if url was never cached.
+                A stale entry ('fresh' False) can be revalidated with its etag / last_modified.
+        """
+        row = self._get(_key('article', url))
+        if row is None:
+            self._count(False)
+            return None
+        fresh = self.article_ttl_seconds is None or time.time() - row[3] <= self.article_ttl_seconds
+        self._count(fresh)
+        return {'text': row[0], 'etag': row[1], 'last_modified': row[2], 'fresh': fresh}
+
+    def set_article(self, url: str, text: str, etag: str = None, last_modified: str = None):
+        self._set(_key('article', url), 'article', text, etag, last_modified)
+
+    def revalidate_article(self, url: str):
+        """
+        Mark a stale article as fresh again, after the site answered 304 Not Modified.
+        """
+        now = time.time()
+        with self._lock:
+            with self.conn:
+                self.conn.execute("UPDATE entries SET created_at = ?, last_access = ? WHERE key = ?",
+                                  (now, now, _key('article', url)))
+
+    def stats(self) -> dict:
+        with self._lock:
+            counts = dict(self.conn.execute("SELECT kind, COUNT(*) FROM entries GROUP BY kind").fetchall())
+        return {'searches': counts.get('search', 0), 'articles': counts.get('article', 0),
+                'bytes': self._total_bytes, 'hits': self.hits, 'misses': self.misses}
+
+
+def conditional_headers(entry: dict) -> dict:
+    """
+    If-None-Match / If-Modified-Since headers that revalidate a cached article.
+    """
+    headers = {}
+    if entry and entry.get('etag'):
+        headers['If-None-Match'] = entry['etag']
+    if entry and entry.get('last_modified'):
+        headers['If-Modified-Since'] = entry['last_modified']
+    return headers
+
+
+_shared_cache = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_web_cache():
+    """
+    The process-wide cache shared by the search tools and the article scraper, configured from
+    the environment: WEB_CACHE_PATH, WEB_CACHE_SEARCH_TTL_SECONDS, WEB_CACHE_ARTICLE_TTL_SECONDS,
+    WEB_CACHE_MAX_MB. Returns None when WEB_CACHE_DISABLED is set.
+    """
+    global _shared_cache
+    if os.getenv("WEB_CACHE_DISABLED", "").lower() in ("1", "true", "yes"):
+        return None
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = WebCache(
+                db_path=os.getenv("WEB_CACHE_PATH", DEFAULT_CACHE_PATH),
+                search_ttl_seconds=float(os.getenv("WEB_CACHE_SEARCH_TTL_SECONDS", DEFAULT_SEARCH_TTL_SECONDS)),
+                article_ttl_seconds=float(os.getenv("WEB_CACHE_ARTICLE_TTL_SECONDS", DEFAULT_ARTICLE_TTL_SECONDS)),
+                max_bytes=int(float(os.getenv("WEB_CACHE_MAX_MB", DEFAULT_MAX_BYTES / 1024 ** 2)) * 1024 ** 2),
+            )
+    return _shared_cache
+
+
+def serper_request(endpoint: str, query: str, cache: WebCache = None) -> dict:
+    """
+    POST a query to a Serper endpoint ('search', 'news', ...), served from the web cache when
+    the same query was made within the search TTL.
+
+    Args:
+        endpoint (str): Serper endpoint name.
+        query (str): Search query.
+        cache (WebCache, optional): Cache to use instead of the shared one.
+
+    Returns:
+        dict: The decoded JSON response.
+
+    Raises:
+        requests.exceptions.RequestException: If the request fails or the response is not JSON.
+    """
+    cache = cache or get_web_cache()
+    if cache is not None:
+        cached = cache.get_search(endpoint, query)
+        if cached is not None:
+            return cached
+    headers = {
+        'X-API-KEY': os.environ['SERPER_API_KEY'],
+        'Content-Type': 'application/json'
+    }
+    response = requests.post(SERPER_URL.format(endpoint=endpoint), headers=headers,
+                             data=json.dumps({"q": query}), timeout=SERPER_TIMEOUT)
+    response.raise_for_status()
+    result = response.json()
+    if cache is not None:
+        cache.set_search(endpoint, query, result)
+    return result
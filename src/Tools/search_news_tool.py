@@ -7,14 +7,14 @@ import os
 from src.Agents.base_agent import BaseAgent
 import json
 import requests
-from newspaper import Article
-from newspaper.article import ArticleException
 from datetime import datetime
 import platform
 from pydantic import BaseModel, Field, ValidationError
 from typing import List
 from crewai_tools import BaseTool
-from crewai_tools import BaseTool
+from src.Helpers.article_scraper import scrape_articles
+from src.Helpers.prefetch import get_prefetcher
+from src.Helpers.web_cache import serper_request
 
 # Define input and output models for search_news
 class SearchNewsInput(BaseModel):
@@ -34,76 +34,89 @@ class SearchNewsOutput(BaseModel):
     results: List[ArticleOutput]
 
 
+def news_cache_key(query: str, top_result_to_return: int = 4) -> tuple:
+    """
+    Prefetch key of a news search. Queries differing only in case or spacing share a key.
+    """
+    return ('search_news', ' '.join(query.lower().split()), top_result_to_return)
+
+
+def search_news(query: str, top_result_to_return: int = 4):
+    """
+    Search news with the Serper API and scrape the top articles.
+
+    Returns:
+        SearchNewsOutput, or an error message string.
+    """
+    try:
+        # Served from the web cache when the same query was searched recently
+        results = serper_request('news', query).get('news', [])
+    except json.JSONDecodeError:
+        return "Error: Failed to parse JSON response from SERPER API."
+    except requests.exceptions.RequestException as e:
+        return f"Error: Failed to fetch news from SERPER API. Details: {e}"
+
+    if not results:
+        return SearchNewsOutput(results=[])
+
+    results = results[:top_result_to_return]
+    # Articles download concurrently; slow sites time out without holding up the rest
+    full_texts = scrape_articles([result.get('link', 'No Link') for result in results])
+
+    formatted_results = []
+    for result, full_text in zip(results, full_texts):
+        title = result.get('title', 'No Title')
+        link = result.get('link', 'No Link')
+        snippet = result.get('snippet', 'No Snippet')
+        source = result.get('source', 'Unknown Source')
+        date_str = result.get('date', 'Unknown Date')
+        thumbnail = result.get('thumbnail', 'No Image')
+
+        if date_str != 'Unknown Date':
+            try:
+                date_obj = datetime.fromisoformat(date_str)
+                formatted_date = date_obj.strftime('%b %#d, %Y') if platform.system() == "Windows" else date_obj.strftime('%b %-d, %Y')
+            except ValueError:
+                formatted_date = date_str
+        else:
+            formatted_date = date_str
+
+        truncated_full_text = (full_text[:500] + '...') if len(full_text) > 500 else full_text
+
+        formatted_results.append(
+            ArticleOutput(
+                title=title,
+                link=link,
+                snippet=snippet,
+                source=source,
+                date=formatted_date,
+                thumbnail=thumbnail,
+                full_text=truncated_full_text
+            )
+        )
+
+    return SearchNewsOutput(results=formatted_results)
+
+
+def prefetch_news(query: str, top_result_to_return: int = 4):
+    """
+    Start a news search in the background so a later Search News tool call with the same query
+    is answered from the prefetcher.
+    """
+    return get_prefetcher().prefetch(news_cache_key(query, top_result_to_return),
+                                     search_news, query, top_result_to_return)
+
+
 # Tool for searching news with Pydantic validation
 class SearchNewsTool(BaseTool):
     name: str = "Search News"
     description: str = "Tool to search news articles about a company, stock, or topic and return detailed results."
 
     def _run(self, input_data: SearchNewsInput) -> SearchNewsOutput:
-        
-        def scrape_full_article(url: str) -> str:
-            try:
-                article = Article(url)
-                article.download()
-                article.parse()
-                return article.text
-            except ArticleException as e:
-                return f"Error: Failed to scrape the article. Details: {e}"
-            except Exception as e:
-                return f"Error: An unexpected error occurred while scraping the article. Details: {e}"
-
-        url = "https://google.serper.dev/news"
-        payload = json.dumps({"q": input_data.query})
-        headers = {
-            'X-API-KEY': os.environ['SERPER_API_KEY'],
-            'Content-Type': 'application/json'
-        }
-        
-        try:
-            response = requests.post(url, headers=headers, data=payload)
-            response.raise_for_status()
-        except requests.exceptions.RequestException as e:
-            return f"Error: Failed to fetch news from SERPER API. Details: {e}"
-        
-        try:
-            results = response.json().get('news', [])
-        except json.JSONDecodeError:
-            return "Error: Failed to parse JSON response from SERPER API."
-        
-        if not results:
-            return SearchNewsOutput(results=[])
-
-        formatted_results = []
-        for result in results[:input_data.top_result_to_return]:
-            title = result.get('title', 'No Title')
-            link = result.get('link', 'No Link')
-            snippet = result.get('snippet', 'No Snippet')
-            source = result.get('source', 'Unknown Source')
-            date_str = result.get('date', 'Unknown Date')
-            thumbnail = result.get('thumbnail', 'No Image')
-            
-            if date_str != 'Unknown Date':
-                try:
-                    date_obj = datetime.fromisoformat(date_str)
-                    formatted_date = date_obj.strftime('%b %#d, %Y') if platform.system() == "Windows" else date_obj.strftime('%b %-d, %Y')
-                except ValueError:
-                    formatted_date = date_str
-            else:
-                formatted_date = date_str
-            
-            full_text = scrape_full_article(link)
-            truncated_full_text = (full_text[:500] + '...') if len(full_text) > 500 else full_text
-
-            formatted_results.append(
-                ArticleOutput(
-                    title=title,
-                    link=link,
-                    snippet=snippet,
-                    source=source,
-                    date=formatted_date,
-                    thumbnail=thumbnail,
-                    full_text=truncated_full_text
-                )
-            )
-
-        return SearchNewsOutput(results=formatted_results)
\ No newline at end of file
+        # Served from a crew's prefetch when it already searched this query
+        key = news_cache_key(input_data.query, input_data.top_result_to_return)
+        output = get_prefetcher().get(key, search_news, input_data.query, input_data.top_result_to_return)
+        if isinstance(output, str):
+            # Error message; search again on the next call
+            get_prefetcher().discard(key)
+        return output
@@ -0,0 +1,203 @@
+######################################
+# Run a crew over a watchlist of tickers.
+#
+#   python -m src.UI.batch_runner --crew vwap --tickers AAPL MSFT NVDA --workers 4 --rpm 120
+#   python -m src.UI.batch_runner --crew timing --tickers-file watchlist.txt --output timing.jsonl
+#
+# Results are appended to a JSON Lines file as each ticker finishes. Rerunning with the same
+# output file skips tickers that already completed, so an interrupted batch resumes.
+######################################
+import argparse
+import importlib
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.Helpers.llm_cache import set_rate_limiter
+from src.Helpers.rate_limiter import RateLimiter
+
+# Crew entry points by name: (module, class, keyword taking the ticker)
+CREWS = {
+    'financial': ('src.UI.main', 'FinancialCrew', 'company'),
+    'vwap': ('src.UI.vwap_main', 'FinancialCrewVWAP', 'company'),
+    'correlation': ('src.UI.correlated_stocks', 'StockCorrelationCrew', 'stock1'),
+    'timing': ('src.UI.timing_trading_system', 'TimingTradingSystem', 'stock'),
+    'bollinger': ('src.UI.gap', 'FinancialCrew', 'ticker'),
+}
+
+
+def crew_factory(name: str, **crew_kwargs):
+    """
+    Build a callable ticker -> crew object for one of the CREWS entry points.
+    crew_kwargs are passed to every crew, e.g. stock2='SPY' for the correlation crew.
+    """
+    if name not in CREWS:
+        raise ValueError(f"Unknown crew '{name}'. Choose from: {', '.join(CREWS)}")
+    module_name, class_name, ticker_arg = CREWS[name]
+    crew_class = getattr(importlib.import_module(module_name), class_name)
+    return lambda ticker: crew_class(**{ticker_arg: ticker}, **crew_kwargs)
+
+
+def serialize_output(output) -> dict:
+    """
+    Structured, JSON-serializable view of a CrewOutput (or any other crew result).
+    """
+    if not hasattr(output, 'raw'):
+        return {'raw': str(output)}
+    result = {
+        'raw': output.raw,
+        'json': getattr(output, 'json_dict', None),
+        'tasks': [
+            {'agent': task.agent, 'description': task.description.strip()[:200], 'raw': task.raw}
+            for task in getattr(output, 'tasks_output', None) or []
+        ],
+    }
+    token_usage = getattr(output, 'token_usage', None)
+    if token_usage is not None:
+        result['token_usage'] = token_usage.model_dump() if hasattr(token_usage, 'model_dump') else dict(token_usage)
+    return result
+
+
+class BatchCrewRunner:
+    def __init__(self, factory, crew_name: str = 'crew', workers: int = 4, requests_per_minute: float = None,
+                 results_path: str = "./batch_results.jsonl", resume: bool = True):
+        """
+        Initializes the BatchCrewRunner class.
+
+        Args:
+            factory (callable): Builds a crew object with a run() method for a ticker.
+            crew_name (str): Stored with every result.
+            workers (int): Number of crews running at once.
+            requests_per_minute (float, optional): Global limit on LLM API calls across all workers.
+                Responses served from the LLM cache do not count.
+            results_path (str): JSON Lines file results are appended to; doubles as the checkpoint.
+            resume (bool): Skip tickers that already completed in results_path.
+        """
+        self.factory = factory
+        self.crew_name = crew_name
+        self.workers = workers
+        self.requests_per_minute = requests_per_minute
+        self.results_path = results_path
+        self.resume = resume
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._write_lock = threading.Lock()
+
+    def completed_tickers(self) -> set:
+        """
+        Tickers with a successful result for this crew in the results file.
+        """
+        if not self.results_path or not os.path.exists(self.results_path):
+            return set()
+        completed = set()
+        with open(self.results_path) as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if record.get('crew') == self.crew_name and record.get('status') == 'ok':
+                    completed.add(record['ticker'])
+        return completed
+
+    def _write(self, record: dict):
+        if not self.results_path:
+            return
+        with self._write_lock:
+            with open(self.results_path, 'a') as f:
+                f.write(json.dumps(record, default=str) + "\n")
+
+    def run_ticker(self, ticker: str) -> dict:
+        """
+        Run the crew for one ticker and record the outcome. Errors are recorded, not raised,
+        so one bad ticker does not stop the batch.
+        """
+        started = time.perf_counter()
+        record = {'ticker': ticker, 'crew': self.crew_name, 'started_at': datetime.now().isoformat()}
+        try:
+            output = self.factory(ticker).run()
+            record.update(status='ok', result=serialize_output(output))
+        except Exception as e:
+            self.logger.error(f"{self.crew_name} failed for {ticker}: {e}")
+            record.update(status='error', error=f"{type(e).__name__}: {e}")
+        record['duration_s'] = round(time.perf_counter() - started, 3)
+        self._write(record)
+        return record
+
+    def run(self, tickers) -> list:
+        """
+        Run the crew for every ticker on a pool of workers.
+
+        Returns:
+            list: The result records of this batch in completion order.
+        """
+        tickers = list(dict.fromkeys(ticker.strip().upper() for ticker in tickers if ticker.strip()))
+        if self.resume:
+            done = self.completed_tickers()
+            if done:
+                self.logger.info(f"Skipping {len(done & set(tickers))} tickers completed earlier")
+            tickers = [ticker for ticker in tickers if ticker not in done]
+
+        if self.requests_per_minute:
+            previous_limiter = set_rate_limiter(RateLimiter(self.requests_per_minute, burst=self.workers))
+        records = []
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                futures = [pool.submit(self.run_ticker, ticker) for ticker in tickers]
+                for future in as_completed(futures):
+                    record = future.result()
+                    records.append(record)
+                    self.logger.info(f"[{len(records)}/{len(tickers)}] {record['ticker']}: {record['status']}")
+        finally:
+            if self.requests_per_minute:
+                set_rate_limiter(previous_limiter)
+        return records
+
+
+def read_tickers(path: str) -> list:
+    """
+    Tickers from a text file: one per line or comma separated, '#' starts a comment.
+    """
+    tickers = []
+    with open(path) as f:
+        for line in f:
+            line = line.split('#', 1)[0]
+            tickers.extend(part.strip() for part in line.split(',') if part.strip())
+    return tickers
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Run a crew over a list of tickers.')
+    parser.add_argument('--crew', required=True, choices=sorted(CREWS))
+    parser.add_argument('--tickers', nargs='*', default=[], help='tickers to analyze')
+    parser.add_argument('--tickers-file', default=None, help='file with one ticker per line')
+    parser.add_argument('--workers', type=int, default=4, help='crews running at once')
+    parser.add_argument('--rpm', type=float, default=None, help='global LLM requests per minute')
+    parser.add_argument('--output', default='./batch_results.jsonl', help='JSON Lines results / checkpoint file')
+    parser.add_argument('--no-resume', action='store_true', help='rerun tickers that already completed')
+    parser.add_argument('--stock2', default='SPY', help='second ticker for the correlation crew')
+    args = parser.parse_args(argv)
+
+    tickers = list(args.tickers)
+    if args.tickers_file:
+        tickers += read_tickers(args.tickers_file)
+    if not tickers:
+        parser.error('no tickers given')
+
+    crew_kwargs = {'stock2': args.stock2} if args.crew == 'correlation' else {}
+    runner = BatchCrewRunner(crew_factory(args.crew, **crew_kwargs), crew_name=args.crew, workers=args.workers,
+                             requests_per_minute=args.rpm, results_path=args.output, resume=not args.no_resume)
+    records = runner.run(tickers)
+    failed = [record['ticker'] for record in records if record['status'] != 'ok']
+    print(f"{len(records) - len(failed)} tickers completed, {len(failed)} failed{': ' + ', '.join(failed) if failed else ''}")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(main())
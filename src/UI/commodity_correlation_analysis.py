@@ -5,6 +5,7 @@ import logging
 from src.Agents.Commodity_Correlation_Agents.commodity_correlation_agent import CommodityCorrelationAgent
 from src.Agents.Commodity_Correlation_Agents.investment_decision_agent import InvestmentDecisionAgent
 from src.Helpers.pretty_print_crewai_output import display_crew_output
+from src.Helpers.token_budget import TokenBudget
 
 logging.basicConfig(level=logging.INFO)
 
@@ -25,7 +26,7 @@ class CommodityCorrelationCrew:
         )
 
         logging.info("CrewAI crew created for commodity correlation analysis")
-        result = crew.kickoff()
+        result = TokenBudget(crew_name='commodity_correlation_analysis').run(crew)
         return result
 
 if __name__ == "__main__":
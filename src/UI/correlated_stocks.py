@@ -11,6 +11,7 @@ import logging
 from src.Agents.Correlation_Agents.correlation_agent import CorrelationAgent
 from src.Agents.Correlation_Agents.investment_decision_agent import InvestmentDecisionAgent
 from src.Helpers.pretty_print_crewai_output import display_crew_output
+from src.Helpers.token_budget import TokenBudget
 
 load_dotenv()
 
@@ -44,7 +45,7 @@ class StockCorrelationCrew:
         )
 
         logging.info("CrewAI crew created")
-        result = crew.kickoff()
+        result = TokenBudget(crew_name='correlated_stocks').run(crew)
         return result
 
 
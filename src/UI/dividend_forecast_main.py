@@ -9,24 +9,18 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..',
 from crewai import Crew
 from src.Agents.Analysis.stock_analysis_agents import StockAnalysisAgents
 from src.Agents.Analysis.stock_analysis_tasks import StockAnalysisTasks
-import langchain_openai as lang_oai
+from src.Helpers.llm_registry import get_llm
 
 
 # Load environment variables (e.g., API keys)
 load_dotenv()
 
-gpt_4o_high_tokens = lang_oai.ChatOpenAI(
-    model_name="gpt-4o",
-    temperature=0.0,
-    max_tokens=1500
-)
-
 class FinancialCrew:
     def __init__(self, company):
         self.company = company
 
     def run(self):
-        agents = StockAnalysisAgents(gpt_model=gpt_4o_high_tokens)
+        agents = StockAnalysisAgents(gpt_model=get_llm("gpt-4o", temperature=0.0, max_tokens=1500))
         tasks = StockAnalysisTasks()
 
         # Create the dividend forecasting agent with the company name
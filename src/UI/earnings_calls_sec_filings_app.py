@@ -13,17 +13,12 @@ from cryptography.utils import CryptographyDeprecationWarning
 import tiktoken
 import openai  # Added import
 
-from langchain_openai import ChatOpenAI  # Added import
+from src.Helpers.llm_registry import get_llm
+from src.Helpers.task_graph import TaskGraphExecutor
 
 # Suppress CryptographyDeprecationWarning (Optional)
 warnings.filterwarnings("ignore", category=CryptographyDeprecationWarning)
 
-# Initialize the GPT model
-gpt_model = ChatOpenAI(
-    temperature=0,
-    model_name="gpt-4o"
-)
-
 # Load environment variables from .env file
 load_dotenv()
 
@@ -58,7 +53,7 @@ class FinancialCrew:
 
         prompt = f"Please provide a concise summary of the following earnings call transcript:\n\n{transcript}"
         try:
-            summary = gpt_model(prompt)
+            summary = get_llm("gpt-4o", temperature=0).call([{"role": "user", "content": prompt}])
             return summary
         except openai.RateLimitError as e:
             print(f"Rate limit exceeded during summarization: {e}. Retrying...")
@@ -148,15 +143,15 @@ class FinancialCrew:
 
     def run(self):
         """
-        Initializes agents and tasks, then executes the analysis using Crew.
+        Initializes agents and tasks, then executes the independent analyses concurrently.
         """
         agents = self.init_agents()
         tasks = self.init_tasks(agents)
 
-        crew = Crew(
+        # SEC filings, earnings calls and transcripts are analysed independently
+        crew = TaskGraphExecutor(
             agents=list(agents.values()),
-            tasks=list(tasks.values()),
-            verbose=True
+            tasks=list(tasks.values())
         )
 
         result = crew.kickoff()
@@ -226,7 +221,11 @@ if __name__ == "__main__":
     print("\n\n########################")
     print("## Analysis Report")
     print("########################\n")
-    print(result)
+    # The analyses run independently, so each task's output is part of the report
+    for task_output in result.tasks_output:
+        print(f"### {task_output.agent}: {task_output.summary}\n")
+        print(task_output.raw)
+        print()
 
 '''
     # Extract and serialize the analysis data
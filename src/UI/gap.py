@@ -9,10 +9,12 @@ import crewai as crewai
 from textwrap import dedent
 import logging
 import crewai as crewai
-import langchain_openai as lang_oai
+from src.Helpers.llm_registry import get_llm
 import crewai_tools as crewai_tools
 
 from src.Helpers.pretty_print_crewai_output import display_crew_output
+from src.Helpers.prefetch import get_prefetcher
+from src.Helpers.token_budget import TokenBudget
 
 from src.Indicators.bollinger import BollingerBands  # Import BollingerBands class
 from src.Data_Retrieval.data_fetcher import DataFetcher  # Import DataFetcher class
@@ -20,6 +22,7 @@ from src.Agents.Research.research_analyst_critic_agent import ResearchAnalysisCr
 from src.Agents.Research.research_analyst_agent import ResearchAnalystAgent
 from src.Agents.Research.bollinger_analysis_agent import BollingerAnalysisAgent
 from src.Agents.Research.bollinger_buy_sell_agent import BollingerBuySellAgent
+from src.Tools.search_news_tool import prefetch_news
 
 
 # Initialize logger
@@ -31,28 +34,51 @@ if not logger.hasHandlers():
     logger.addHandler(handler)
     logger.setLevel(logging.INFO)
 
-gpt_4o_high_tokens = lang_oai.ChatOpenAI(
-    model_name="gpt-4o",
-    temperature=0.0,
-    max_tokens=1500
-)
+
+def _fetch_bollinger_bands(ticker, start_date, end_date):
+    stock_data = DataFetcher().get_stock_data(ticker, start_date=start_date, end_date=end_date)
+    return stock_data, BollingerBands(stock_data).calculate_bands()
 
 
 class FinancialCrew:
-    def __init__(self, ticker):
+    def __init__(self, ticker, start_date=None, end_date=None, news_query=None, prefetch=True):
+        """
+        Initializes the FinancialCrew class.
+
+        The price data, Bollinger Bands and news search are started in the background here, so they
+        are ready by the time the agents need them instead of being fetched one after another.
+
+        Args:
+            ticker (str): Stock ticker.
+            start_date (datetime, optional): Start of the price history. Defaults to DataFetcher's.
+            end_date (datetime, optional): End of the price history. Defaults to today.
+            news_query (str, optional): Query the research analyst searches news with. Defaults to the ticker.
+            prefetch (bool): Start the fetches now; if False they run when first needed.
+        """
         self.ticker = ticker
-        self.stock_data = DataFetcher().get_stock_data(ticker)
+        self.start_date = start_date
+        self.end_date = end_date
+        self.news_query = news_query or ticker.upper()
+        self.prefetcher = get_prefetcher()
+        self._bands_key = ('bollinger', ticker, start_date, end_date)
+        if prefetch:
+            self.prefetcher.prefetch(self._bands_key, _fetch_bollinger_bands, ticker, start_date, end_date)
+            prefetch_news(self.news_query)
+
+    @property
+    def stock_data(self):
+        return self._bollinger()[0]
+
+    def _bollinger(self):
+        return self.prefetcher.get(self._bands_key, _fetch_bollinger_bands, self.ticker, self.start_date, self.end_date)
 
     def run(self):
-        # Initialize agents
-        #stock_analysis_agents = StockAnalysisAgents()
-        
-        # Bollinger Bands Data Calculation
-        bollinger_data = BollingerBands(self.stock_data)
-        bollinger_bands_data = bollinger_data.calculate_bands()
+        # Bollinger Bands Data Calculation (prefetched in __init__)
+        _, bollinger_bands_data = self._bollinger()
 
 
         # Initialize agents
+        gpt_4o_high_tokens = get_llm("gpt-4o", temperature=0.0, max_tokens=1500)
         research_analyst_agent = ResearchAnalystAgent(ticker=self.ticker, llm=gpt_4o_high_tokens)
         research_analyst_critic_agent = ResearchAnalysisCriticAgent(llm=gpt_4o_high_tokens)
         bollinger_investment_advisor_agent = BollingerAnalysisAgent(llm=gpt_4o_high_tokens)
@@ -64,7 +90,7 @@ class FinancialCrew:
 
 
         # Create tasks for Bollinger Bands analysis        
-        get_news = research_analyst_agent.get_scenarios_from_news()        
+        get_news = research_analyst_agent.get_scenarios_from_news(news_query=self.news_query)
         critique_research_analyst = research_analyst_critic_agent.critique_research_analyst_agent()
         revise_report = research_analyst_agent.revise_report()
         analyze_bollinger_data = bollinger_investment_advisor_agent.analyse_bollinger_data(bollinger_bands_data)
@@ -98,7 +124,8 @@ class FinancialCrew:
             process=crewai.Process.sequential
         )
 
-        result = crew.kickoff()
+        result = TokenBudget(crew_name='gap').run(crew)
+        logger.info(f"Prefetch: {self.prefetcher.stats()}")
         return result
 
 if __name__ == "__main__":
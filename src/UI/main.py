@@ -18,6 +18,7 @@ from textwrap import dedent
 
 from src.Agents.Analysis.stock_analysis_agents import StockAnalysisAgents
 from src.Agents.Analysis.stock_analysis_tasks import StockAnalysisTasks
+from src.Helpers.task_graph import TaskGraphExecutor
 
 from dotenv import load_dotenv
 load_dotenv()
@@ -39,7 +40,9 @@ class FinancialCrew:
     filings_task = tasks.filings_analysis(financial_analyst_agent)
     recommend_task = tasks.recommend(investment_advisor_agent)
 
-    crew = Crew(
+    # Research, financial and filings analysis are independent; only the recommendation
+    # needs their outputs. The two financial analyst tasks still run one after the other.
+    crew = TaskGraphExecutor(
       agents=[
         research_analyst_agent,
         financial_analyst_agent,
@@ -51,7 +54,7 @@ class FinancialCrew:
         filings_task,
         recommend_task
       ],
-      verbose=True
+      dependencies={recommend_task: [research_task, financial_task, filings_task]}
     )
 
     result = crew.kickoff()
@@ -7,13 +7,14 @@ for key, value in os.environ.items():
 import sys
 import logging
 import crewai as crewai
-import langchain_openai as lang_oai
+from src.Helpers.llm_registry import get_llm
 import crewai_tools as crewai_tools
 from src.Agents.Scenario_Agents.portfolio_data_agent import PortfolioDataAgent
 from src.Agents.Scenario_Agents.scenario_input_agent import ScenarioInputAgent
 from src.Agents.Scenario_Agents.scenario_input_critic_agent import ScenarioInputCriticAgent
 from src.Agents.Scenario_Agents.scenario_simulation_agent import ScenarioSimulationAgent
 from src.Helpers.pretty_print_crewai_output import display_crew_output
+from src.Helpers.token_budget import TokenBudget
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -24,17 +25,12 @@ if not logger.hasHandlers():
     logger.addHandler(handler)
     logger.setLevel(logging.DEBUG)
 
-gpt_4o_high_tokens = lang_oai.ChatOpenAI(
-    model_name="gpt-4o",
-    temperature=0.0,
-    max_tokens=1500
-)
-
 class ScenarioCrew:
   def __init__(self):
       self.is_init = True
 
   def run(self):
+    gpt_4o_high_tokens = get_llm("gpt-4o", temperature=0.0, max_tokens=1500)
     portfolio_data_agent = PortfolioDataAgent(llm=gpt_4o_high_tokens)
     scenario_input_agent = ScenarioInputAgent(llm=gpt_4o_high_tokens)
     scenario_input_critic_agent = ScenarioInputCriticAgent(llm=gpt_4o_high_tokens)
@@ -66,7 +62,7 @@ class ScenarioCrew:
     for agent in crew.agents:
       logger.info(f"Agent Name: '{agent.role}'")
 
-    result = crew.kickoff()
+    result = TokenBudget(crew_name='scenario').run(crew)
 
     # logger.info(f"CrewOutput Final Answer: {result.final_answer}")
 
@@ -6,6 +6,7 @@ from src.Agents.Timing_Trading_Agents.sentiment_analysis_agent import SentimentA
 from src.Agents.Timing_Trading_Agents.buy_sell_decision_agent import BuySellDecisionAgent
 from src.Data_Retrieval.timing_trading_data_fetcher import DataFetcher
 from src.Helpers.pretty_print_crewai_output import display_crew_output
+from src.Helpers.token_budget import TokenBudget
 
 load_dotenv()
 
@@ -34,7 +35,7 @@ class TimingTradingSystem:
             verbose=True
         )
 
-        result = crew.kickoff()
+        result = TokenBudget(crew_name='timing_trading_system').run(crew)
         return result
 
 if __name__ == "__main__":